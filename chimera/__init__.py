@@ -0,0 +1,5 @@
+"""
+Project Chimera runtime package.
+
+Implementation of the contracts defined in specs/ and skills/README.md.
+"""
@@ -0,0 +1,10 @@
+"""
+``python -m chimera``: see :mod:`chimera.cli`.
+"""
+
+import sys
+
+from chimera.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""
+Agent Task helpers shared across Chimera modules (specs/technical.md § 1.1).
+"""
+
+# Agent Task ``priority`` -> queue rank; lower ranks are served first.
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
@@ -0,0 +1,24 @@
+"""
+Timestamp helpers shared across Chimera modules.
+
+All API payloads use ISO 8601 with millisecond precision and a ``Z`` suffix
+(specs/technical.md § 1).
+"""
+
+from datetime import datetime, timezone
+
+
+def iso_from_epoch(seconds: float) -> str:
+    """Format a Unix timestamp as ``YYYY-MM-DDTHH:mm:ss.sssZ``."""
+    dt = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def iso_now() -> str:
+    """Current UTC time in the API timestamp format."""
+    return iso_from_epoch(datetime.now(tz=timezone.utc).timestamp())
+
+
+def epoch_from_iso(value: str) -> float:
+    """Parse an API timestamp back into a Unix timestamp."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
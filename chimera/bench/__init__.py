@@ -0,0 +1,12 @@
+"""
+Offline load-test harness for the Chimera swarm (``python -m chimera.bench``).
+"""
+
+from chimera.bench.harness import (
+    BenchConfig,
+    LoadHarness,
+    compare_reports,
+    run_load_test,
+)
+
+__all__ = ["BenchConfig", "LoadHarness", "compare_reports", "run_load_test"]
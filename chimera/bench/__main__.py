@@ -0,0 +1,84 @@
+"""
+Command line entry point: ``python -m chimera.bench``.
+
+Writes the JSON report to ``--output`` (stdout by default). With
+``--baseline`` the run is compared against a previous report and the exit
+status is 1 if throughput or tail latency regressed beyond ``--tolerance``.
+"""
+
+import argparse
+import json
+import sys
+
+from chimera.bench.fakes import LatencyProfile
+from chimera.bench.harness import BenchConfig, compare_reports, run_load_test
+
+
+def _profile(value: str) -> LatencyProfile:
+    """Parse ``median[,sigma[,error_rate]]``."""
+    parts = [float(part) for part in value.split(",")]
+    return LatencyProfile(*parts)
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = BenchConfig()
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench")
+    parser.add_argument("--agents", type=int, default=defaults.agents)
+    parser.add_argument("--duration", type=float, default=defaults.duration_seconds)
+    parser.add_argument("--time-scale", type=float, default=defaults.time_scale)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument("--judges", type=int, default=defaults.judges)
+    parser.add_argument(
+        "--mentions-per-agent-minute",
+        type=float,
+        default=defaults.mentions_per_agent_minute,
+    )
+    parser.add_argument(
+        "--trends-per-agent-minute",
+        type=float,
+        default=defaults.trends_per_agent_minute,
+    )
+    parser.add_argument("--llm", type=_profile, default=defaults.llm)
+    parser.add_argument("--social", type=_profile, default=defaults.social)
+    parser.add_argument("--wallet", type=_profile, default=defaults.wallet)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="previous report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        BenchConfig(
+            agents=args.agents,
+            duration_seconds=args.duration,
+            time_scale=args.time_scale,
+            workers=args.workers,
+            judges=args.judges,
+            mentions_per_agent_minute=args.mentions_per_agent_minute,
+            trends_per_agent_minute=args.trends_per_agent_minute,
+            llm=args.llm,
+            social=args.social,
+            wallet=args.wallet,
+            seed=args.seed,
+        )
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(rendered + "\n")
+    else:
+        print(rendered)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare_reports(
+                report, json.load(baseline_file), args.tolerance
+            )
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Engagement burst replay: ``python -m chimera.bench.engagement``.
+
+Generates the mention deliveries of a viral post: a decaying spike of
+mentions concentrated in a few threads and authors, where the same author
+often posts several mentions within seconds, plus platform re-deliveries
+of the same ``mention_id`` (mostly within seconds, some after the exact
+dedup window). The burst is replayed twice in simulated time through a
+fixed pool of reply workers:
+
+- ``per_mention``: every delivery runs the whole engagement loop (semantic
+  filter, context assembly, generation, reply, verification: two LLM calls
+  and three MCP calls) in arrival order.
+- ``coalesced``: deliveries go through ``skill_manage_engagement_loop`` and
+  its :class:`MentionIngestor`; one loop runs per reply group, highest
+  priority and author influence first, and the group is reported with
+  ``complete`` once its reply is posted.
+
+The report compares LLM and MCP calls, duplicate replies and the reply
+latency (first delivery to reply posted, per unique mention) by priority.
+The simulation is deterministic and does not sleep.
+"""
+
+import argparse
+import heapq
+import json
+import random
+import sys
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from chimera._time import iso_from_epoch
+from chimera.bench.fakes import LatencyProfile
+from chimera.bench.harness import HIGH_PRIORITY_TARGET_SECONDS, percentiles
+from chimera.social.mention_ingest import MentionIngestor, ProcessedMentionSet
+from chimera.skills.social.manage_engagement_loop import (
+    skill_manage_engagement_loop,
+)
+
+# 2026-02-01T00:00:00Z
+START = 1769904000.0
+# (workflow step, server, tool); "llm" calls are LLM calls, the rest MCP.
+REPLY_STEPS = (
+    ("plan", "llm", "semantic_filter"),
+    ("generate", "memory", "assemble_context"),
+    ("generate", "llm", "generate_text"),
+    ("act", "social", "reply_comment"),
+    ("verify", "social", "get_post"),
+)
+
+
+@dataclass
+class BurstConfig:
+    """Burst shape, reply pool and ingest settings."""
+
+    mentions: int = 3000
+    duration_seconds: float = 300.0
+    threads: int = 40
+    authors: int = 800
+    follow_up_probability: float = 0.6
+    redelivery_fraction: float = 0.3
+    late_redelivery_fraction: float = 0.05
+    high_priority_fraction: float = 0.1
+    workers: int = 32
+    window_seconds: float = 2.0
+    recent_seconds: float = 120.0
+    seed: int = 0
+    llm: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.8, 0.4))
+    social: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.15, 0.5))
+    memory: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.2, 0.3))
+
+
+def generate_burst(config: BurstConfig) -> list[tuple[float, dict[str, Any]]]:
+    """``(seconds since start, mention)`` deliveries, sorted by time."""
+    rng = random.Random(config.seed)
+    agent_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    author_weights = [1.0 / rank**0.8 for rank in range(1, config.authors + 1)]
+    thread_weights = [1.0 / rank for rank in range(1, config.threads + 1)]
+    influence = [min(1.0, rng.lognormvariate(0.0, 1.0) / 10) for _ in author_weights]
+    mentions: list[tuple[float, dict[str, Any]]] = []
+    while len(mentions) < config.mentions:
+        at = rng.expovariate(4.0 / config.duration_seconds)
+        if at >= config.duration_seconds:
+            continue
+        author = rng.choices(range(config.authors), author_weights)[0]
+        thread = rng.choices(range(config.threads), thread_weights)[0]
+        priority = (
+            "high"
+            if rng.random() < config.high_priority_fraction
+            else rng.choice(("medium", "medium", "low"))
+        )
+        while len(mentions) < config.mentions:
+            index = len(mentions)
+            mentions.append(
+                (
+                    at,
+                    {
+                        "agent_id": agent_id,
+                        "mention_id": f"m{index:07d}",
+                        "platform": "twitter",
+                        "mention_content": f"@chimera reply #{index}",
+                        "mention_author": f"@fan{author:04d}",
+                        "mention_timestamp": iso_from_epoch(START + at),
+                        "priority": priority,
+                        "thread_id": f"thread-{thread:03d}",
+                        "author_influence": round(influence[author], 3),
+                    },
+                )
+            )
+            if rng.random() >= config.follow_up_probability:
+                break
+            at += rng.uniform(0.2, 1.5)
+
+    deliveries = list(mentions)
+    for at, mention in mentions:
+        roll = rng.random()
+        if roll < config.late_redelivery_fraction:
+            late = config.recent_seconds + rng.uniform(1.0, 60.0)
+            deliveries.append((at + late, mention))
+        elif roll < config.late_redelivery_fraction + config.redelivery_fraction:
+            deliveries.append((at + rng.uniform(0.1, 30.0), mention))
+    deliveries.sort(key=lambda delivery: delivery[0])
+    return deliveries
+
+
+def replay(
+    config: BurstConfig,
+    deliveries: list[tuple[float, dict[str, Any]]],
+    *,
+    coalesce: bool,
+) -> dict[str, Any]:
+    """Replay ``deliveries`` through the reply pool in simulated time."""
+    rng = random.Random(config.seed + 1)
+    profiles = {"llm": config.llm, "social": config.social, "memory": config.memory}
+    now = 0.0
+    ingestor = MentionIngestor(
+        ProcessedMentionSet(
+            recent_seconds=config.recent_seconds, clock=lambda: START + now
+        ),
+        window_seconds=config.window_seconds,
+        clock=lambda: START + now,
+    )
+    # (key, tie-break sequence, payload) heaps: events by time, ready by rank
+    events: list[tuple[float, int, tuple[str, Any]]] = []
+    # payload: (reply group or None, mentions it answers)
+    ready: list[tuple[Any, int, tuple[Any, list[dict[str, Any]]]]] = []
+    seq = 0
+
+    def push(queue: list, key: Any, payload: Any) -> None:
+        nonlocal seq
+        seq += 1
+        heapq.heappush(queue, (key, seq, payload))
+
+    for at, mention in deliveries:
+        push(events, at, ("arrival", mention))
+
+    first_seen: dict[str, float] = {}
+    answered: dict[str, float] = {}
+    calls = {"llm": 0, "mcp": 0}
+    replies = duplicate_replies = 0
+    free = config.workers
+    while events:
+        now, _, (kind, payload) = heapq.heappop(events)
+        if kind == "arrival":
+            first_seen.setdefault(payload["mention_id"], now)
+            if not coalesce:
+                push(ready, (now,), (None, [payload]))
+            else:
+                skill_manage_engagement_loop(**payload, ingestor=ingestor)
+                due = ingestor.next_due()
+                if due is not None:
+                    push(events, max(now, due - START), ("due", None))
+        elif kind == "due":
+            for group in ingestor.pop_due():
+                push(ready, group.rank, (group, group.mentions))
+        else:
+            group, batch = payload
+            if group is not None:
+                ingestor.complete(group)
+            free += 1
+            replies += 1
+            for mention in batch:
+                if mention["mention_id"] in answered:
+                    duplicate_replies += 1
+                else:
+                    answered[mention["mention_id"]] = now
+        while free and ready:
+            _, _, job = heapq.heappop(ready)
+            free -= 1
+            took = 0.0
+            for _, server, _ in REPLY_STEPS:
+                took += profiles[server].sample(rng)[0]
+                calls["llm" if server == "llm" else "mcp"] += 1
+            push(events, now + took, ("done", job))
+
+    priorities = {
+        mention["mention_id"]: mention["priority"] for _, mention in deliveries
+    }
+    latency: dict[str, list[float]] = {"high": [], "medium": [], "low": []}
+    for mention_id, posted in answered.items():
+        latency[priorities[mention_id]].append(posted - first_seen[mention_id])
+    high = latency["high"]
+    report = {
+        "reply_tasks": replies,
+        "llm_calls": calls["llm"],
+        "mcp_calls": calls["mcp"],
+        "duplicate_replies": duplicate_replies,
+        "unanswered": len(first_seen) - len(answered),
+        "latency_seconds": percentiles([s for v in latency.values() for s in v]),
+        "latency_by_priority": {p: percentiles(v) for p, v in latency.items()},
+        "high_priority_within_target": round(
+            sum(s <= HIGH_PRIORITY_TARGET_SECONDS for s in high) / len(high), 4
+        )
+        if high
+        else 1.0,
+        "makespan_seconds": round(now, 3),
+    }
+    if coalesce:
+        report["ingest"] = ingestor.stats()
+        report["ingest"]["filter_bytes"] = ingestor.processed.memory_bytes
+    return report
+
+
+def run_burst(config: BurstConfig) -> dict[str, Any]:
+    """Replay one burst per mention and coalesced; report the savings."""
+    deliveries = generate_burst(config)
+    baseline = replay(config, deliveries, coalesce=False)
+    coalesced = replay(config, deliveries, coalesce=True)
+    saved = {}
+    for kind in ("llm_calls", "mcp_calls"):
+        saved[kind] = baseline[kind] - coalesced[kind]
+        saved[f"{kind}_fraction"] = round(saved[kind] / baseline[kind], 4)
+    return {
+        "config": asdict(config),
+        "deliveries": len(deliveries),
+        "unique_mentions": config.mentions,
+        "per_mention": baseline,
+        "coalesced": coalesced,
+        "saved": saved,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench.engagement")
+    parser.add_argument("--mentions", type=int, default=3000)
+    parser.add_argument("--duration", type=float, default=300.0)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--window", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    report = run_burst(
+        BurstConfig(
+            mentions=args.mentions,
+            duration_seconds=args.duration,
+            workers=args.workers,
+            window_seconds=args.window,
+            seed=args.seed,
+        )
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
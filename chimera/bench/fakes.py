@@ -0,0 +1,188 @@
+"""
+Deterministic fake MCP, LLM and wallet servers for offline load tests.
+
+Each server samples a latency and an error outcome per call from a
+:class:`LatencyProfile`. The random stream for a call is derived from the
+server seed, tool name, arguments and how many times that exact call has
+been made, so results do not depend on task scheduling order.
+"""
+
+import abc
+import asyncio
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+
+class FakeServerError(Exception):
+    """Injected transient failure from a fake server."""
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Log-normal latency around ``median_seconds`` plus an error rate."""
+
+    median_seconds: float = 0.1
+    sigma: float = 0.5
+    error_rate: float = 0.0
+
+    def sample(self, rng: random.Random) -> tuple[float, bool]:
+        delay = self.median_seconds * math.exp(rng.gauss(0.0, self.sigma))
+        return delay, rng.random() < self.error_rate
+
+
+class FakeServer(abc.ABC):
+    """
+    Base fake: ``await call(tool, arguments)`` or ``call_blocking(...)``.
+
+    Latencies are multiplied by ``time_scale`` before sleeping so a long
+    simulated run finishes quickly; reported metrics divide it back out.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self, profile: LatencyProfile, *, seed: int = 0, time_scale: float = 1.0
+    ) -> None:
+        self.profile = profile
+        self.seed = seed
+        self.time_scale = time_scale
+        self.calls: Counter[str] = Counter()
+        self.errors = 0
+        self._seen: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    async def call(self, tool: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        delay, fail, rng = self._prepare(tool, arguments)
+        await asyncio.sleep(delay * self.time_scale)
+        return self._finish(tool, arguments, fail, rng)
+
+    def call_blocking(self, tool: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        delay, fail, rng = self._prepare(tool, arguments)
+        time.sleep(delay * self.time_scale)
+        return self._finish(tool, arguments, fail, rng)
+
+    @abc.abstractmethod
+    def handle(
+        self, tool: str, arguments: dict[str, Any], rng: random.Random
+    ) -> dict[str, Any]:
+        """Return the tool's output for a call that did not fail."""
+
+    def _prepare(
+        self, tool: str, arguments: dict[str, Any]
+    ) -> tuple[float, bool, random.Random]:
+        key = json.dumps(arguments, sort_keys=True, default=str)
+        with self._lock:
+            self.calls[tool] += 1
+            self._seen[f"{tool}:{key}"] += 1
+            attempt = self._seen[f"{tool}:{key}"]
+        digest = hashlib.sha256(
+            f"{self.seed}:{self.name}:{tool}:{key}:{attempt}".encode()
+        ).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        delay, fail = self.profile.sample(rng)
+        return delay, fail, rng
+
+    def _finish(
+        self, tool: str, arguments: dict[str, Any], fail: bool, rng: random.Random
+    ) -> dict[str, Any]:
+        if fail:
+            with self._lock:
+                self.errors += 1
+            raise FakeServerError(f"{self.name}.{tool}: injected failure")
+        return self.handle(tool, arguments, rng)
+
+
+class FakeSocialMCP(FakeServer):
+    """twitter/instagram MCP server: ``post_content``, ``reply_comment``."""
+
+    name = "social"
+
+    def handle(self, tool, arguments, rng):
+        if tool == "post_content":
+            return {"success": True, "post_id": f"p{rng.getrandbits(48):x}"}
+        if tool == "reply_comment":
+            return {"success": True, "reply_id": f"r{rng.getrandbits(48):x}"}
+        return {"success": False, "error": f"unknown tool: {tool}"}
+
+
+class FakeLLM(FakeServer):
+    """Cognitive Core LLM: ``generate_text``, ``summarize``, ``embed``."""
+
+    name = "llm"
+
+    def handle(self, tool, arguments, rng):
+        if tool == "generate_text":
+            words = rng.randint(8, 40)
+            return {
+                "success": True,
+                "text_content": " ".join(["lorem"] * words),
+                "confidence_score": round(min(1.0, rng.betavariate(8, 1.5)), 3),
+                "token_count": words * 2,
+            }
+        if tool == "summarize":
+            return {"success": True, "summary": f"{len(arguments['items'])} moments"}
+        if tool == "embed":
+            return {
+                "success": True,
+                "vectors": [
+                    [rng.random() for _ in range(8)] for _ in arguments["texts"]
+                ],
+            }
+        return {"success": False, "error": f"unknown tool: {tool}"}
+
+
+class FakeMemoryStore(FakeServer):
+    """Weaviate MCP server: ``write_memory`` (bulk)."""
+
+    name = "weaviate"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.records = 0
+
+    def handle(self, tool, arguments, rng):
+        with self._lock:
+            self.records += len(arguments["records"])
+        return {"success": True}
+
+
+class FakeWallet(FakeServer):
+    """Coinbase MCP server: ``get_balance``, ``send_payment``."""
+
+    name = "coinbase"
+
+    def __init__(self, *args, opening_usdc: str = "500.00", **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.opening_usdc = Decimal(opening_usdc)
+        self.usdc: dict[str, Decimal] = {}
+
+    def handle(self, tool, arguments, rng):
+        agent_id = arguments["agent_id"]
+        with self._lock:
+            balance = self.usdc.setdefault(agent_id, self.opening_usdc)
+            if tool == "get_balance":
+                return {
+                    "success": True,
+                    "balances": {"USDC": str(balance), "ETH": "0.10"},
+                    "wallet_address": "0x" + agent_id.replace("-", "")[:40],
+                }
+            if tool == "send_payment":
+                amount = Decimal(str(arguments["amount_usdc"]))
+                if amount > balance:
+                    return {"success": False, "error": "BudgetExceededError"}
+                self.usdc[agent_id] = balance - amount
+                return {
+                    "success": True,
+                    "tx_hash": f"0x{rng.getrandbits(128):032x}",
+                    "amount": str(amount),
+                    "token_symbol": "USDC",
+                }
+        return {"success": False, "error": f"unknown tool: {tool}"}
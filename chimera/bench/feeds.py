@@ -0,0 +1,138 @@
+"""
+Synthetic skill_monitor_resources feeds for trend backtests.
+
+``python -m chimera.bench.feeds OUT_DIR --days 7`` records a week of polls
+across news, twitter and market resources into a feed log. The topics are a
+Zipf-distributed background vocabulary plus injected bursts (a few new
+topics that spike on two resources for one to four hours), so trend
+parameters can be compared against known ground truth.
+"""
+
+import argparse
+import random
+import sys
+from typing import Any
+
+from chimera._time import iso_from_epoch
+from chimera.bench.personas import NICHES, REGIONS
+from chimera.perception.feed_log import FeedRecorder
+
+FEED_URIS = (
+    "news://ethiopia/fashion/trends",
+    "news://kenya/tech/latest",
+    "twitter://mentions/recent",
+    "twitter://trending",
+    "market://crypto/eth/price",
+)
+_SYLLABLES = ("ka", "lo", "mi", "ra", "te", "zu", "no", "vi", "sa", "de", "bo", "ye")
+# 2026-02-01T00:00:00Z
+DEFAULT_START = 1769904000.0
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _vocabulary(rng: random.Random, size: int) -> list[str]:
+    words = [niche for niche in NICHES] + [region.lower() for region in REGIONS]
+    while len(words) < size:
+        word = _word(rng)
+        if word not in words:
+            words.append(word)
+    return words
+
+
+def generate_bursts(
+    rng: random.Random, start: float, days: float, per_day: float
+) -> list[dict[str, Any]]:
+    """Ground-truth bursts: start, end, topics and the resources carrying them."""
+    bursts = []
+    for _ in range(round(days * per_day)):
+        begin = start + rng.uniform(0, days * 86400)
+        bursts.append(
+            {
+                "start": begin,
+                "end": begin + rng.uniform(1, 4) * 3600,
+                "topics": [f"{_word(rng)}-{_word(rng)}" for _ in range(3)],
+                "uris": rng.sample(FEED_URIS[:4], 2),
+                "rate": rng.uniform(0.3, 0.7),
+            }
+        )
+    return sorted(bursts, key=lambda burst: burst["start"])
+
+
+def generate_feed_log(
+    path: str,
+    *,
+    days: float = 7.0,
+    poll_seconds: float = 60.0,
+    bursts_per_day: float = 3.0,
+    start: float = DEFAULT_START,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Write a synthetic feed log; returns record count and the bursts."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng, 400)
+    weights = [1.0 / rank for rank in range(1, len(vocabulary) + 1)]
+    bursts = generate_bursts(rng, start, days, bursts_per_day)
+    last_content: dict[str, Any] = {}
+    price = 3000.0
+    polls = int(days * 86400 / poll_seconds)
+    with FeedRecorder(path) as recorder:
+        for poll in range(polls):
+            now = start + poll * poll_seconds
+            active = [b for b in bursts if b["start"] <= now < b["end"]]
+            for uri in FEED_URIS:
+                if uri.startswith("market://"):
+                    price *= 1 + rng.gauss(0, 0.002)
+                    content = {"symbol": "ETH", "price_usd": round(price, 2)}
+                    recorder.record(_update(uri, content, now, True))
+                    continue
+                if uri in last_content and rng.random() < 0.3:
+                    recorder.record(_update(uri, last_content[uri], now, False))
+                    continue
+                for offset in range(rng.choice((0, 1, 1, 2, 3))):
+                    topics = set(rng.choices(vocabulary, weights, k=3))
+                    for burst in active:
+                        if uri in burst["uris"] and rng.random() < burst["rate"]:
+                            topics.update(burst["topics"])
+                    content = {
+                        "title": " ".join(sorted(topics)),
+                        "topics": sorted(topics),
+                    }
+                    last_content[uri] = content
+                    recorder.record(_update(uri, content, now + offset, True))
+        records = recorder.recorded
+    return {"records": records, "bursts": bursts}
+
+
+def _update(uri: str, content: Any, when: float, changed: bool) -> dict[str, Any]:
+    return {
+        "resource_uri": uri,
+        "content": content,
+        "timestamp": iso_from_epoch(when),
+        "change_detected": changed,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench.feeds")
+    parser.add_argument("path", help="feed log directory to create")
+    parser.add_argument("--days", type=float, default=7.0)
+    parser.add_argument("--poll-seconds", type=float, default=60.0)
+    parser.add_argument("--bursts-per-day", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    result = generate_feed_log(
+        args.path,
+        days=args.days,
+        poll_seconds=args.poll_seconds,
+        bursts_per_day=args.bursts_per_day,
+        seed=args.seed,
+    )
+    print(f"recorded {result['records']} updates, {len(result['bursts'])} bursts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
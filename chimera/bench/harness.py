@@ -0,0 +1,518 @@
+"""
+Full-swarm load harness (SRS NFR 3.0 scale, NFR 3.1 latency targets).
+
+Boots N simulated agents with generated SOUL personas and drives them with
+synthetic mention and trend feeds through the Planner -> Worker -> Judge
+path:
+
+- **Planner** turns each feed event into an Agent Task (specs/technical.md
+  § 1.1). Cost-incurring tasks first call ``skill_get_wallet_balance``
+  through :class:`~chimera.commerce.wallet_cache.WalletBalanceCache`
+  (FR 5.1). Tasks go onto a priority TaskQueue.
+- **Workers** (a shared, stateless pool) generate content with the LLM and
+  push a Worker Result (§ 1.2) onto the ReviewQueue.
+- **Judges** route by ``confidence_score`` (> 0.9 auto-approve, 0.7-0.9
+  HITL, < 0.7 reject), act through the social MCP server, pay for generated
+  content through the wallet, and hand high-engagement interactions to
+  ``skill_evolve_persona``'s write-behind pipeline.
+
+Every state change is published through the OpenClaw
+:class:`~chimera.openclaw.status_publisher.StatusPublisher`. All external
+systems are deterministic fakes (:mod:`chimera.bench.fakes`), so runs are
+offline and comparable. Simulated time is compressed by ``time_scale``;
+reported latencies are in simulated seconds.
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from chimera._task import PRIORITY_RANK
+from chimera._time import iso_now
+from chimera.bench.fakes import (
+    FakeLLM,
+    FakeMemoryStore,
+    FakeServer,
+    FakeServerError,
+    FakeSocialMCP,
+    FakeWallet,
+    LatencyProfile,
+)
+from chimera.bench.personas import generate_persona
+from chimera.commerce.wallet_cache import WalletBalanceCache
+from chimera.memory.persona_pipeline import PersonaEvolutionPipeline
+from chimera.openclaw.simulation import MockOpenClawRegistry
+from chimera.openclaw.status_publisher import PublisherConfig, StatusPublisher
+from chimera.skills.commerce.get_wallet_balance import skill_get_wallet_balance
+from chimera.skills.memory.evolve_persona import skill_evolve_persona
+
+HIGH_PRIORITY_TARGET_SECONDS = 10.0
+STAGES = ("plan", "queue_wait", "work", "review_wait", "judge", "act")
+
+
+@dataclass
+class BenchConfig:
+    """Load shape, pool sizes and fake server behaviour."""
+
+    agents: int = 1000
+    duration_seconds: float = 120.0
+    time_scale: float = 0.05
+    tenants: int = 20
+    mentions_per_agent_minute: float = 0.5
+    trends_per_agent_minute: float = 0.1
+    high_priority_fraction: float = 0.2
+    high_engagement_fraction: float = 0.1
+    content_cost_usdc: str = "0.25"
+    workers: int = 200
+    judges: int = 50
+    max_retries: int = 3
+    seed: int = 0
+    llm: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.8, 0.4, 0.01))
+    social: LatencyProfile = field(
+        default_factory=lambda: LatencyProfile(0.15, 0.5, 0.01)
+    )
+    wallet: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.3, 0.3))
+    memory: LatencyProfile = field(default_factory=lambda: LatencyProfile(0.2, 0.3))
+
+
+@dataclass
+class _Event:
+    at: float
+    kind: str
+    agent_index: int
+    priority: str
+
+
+@dataclass
+class _Job:
+    event: _Event
+    persona: dict[str, Any]
+    started: float
+    marks: dict[str, float] = field(default_factory=dict)
+    task: dict[str, Any] | None = None
+    result: dict[str, Any] | None = None
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 plus count and max."""
+    if not samples:
+        return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        index = max(0, min(len(ordered) - 1, int(p * len(ordered) + 0.5) - 1))
+        return round(ordered[index], 4)
+
+    return {
+        "count": len(ordered),
+        "p50": rank(0.50),
+        "p95": rank(0.95),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def generate_feed(config: BenchConfig) -> list[_Event]:
+    """Poisson mention and trend arrivals per agent, sorted by time."""
+    rng = random.Random(config.seed)
+    events: list[_Event] = []
+    rates = (
+        ("mention", config.mentions_per_agent_minute / 60.0),
+        ("trend", config.trends_per_agent_minute / 60.0),
+    )
+    for index in range(config.agents):
+        for kind, rate in rates:
+            if rate <= 0:
+                continue
+            at = rng.expovariate(rate)
+            while at < config.duration_seconds:
+                priority = (
+                    "high"
+                    if kind == "mention"
+                    and rng.random() < config.high_priority_fraction
+                    else rng.choice(("medium", "low"))
+                )
+                events.append(_Event(at, kind, index, priority))
+                at += rng.expovariate(rate)
+    events.sort(key=lambda e: e.at)
+    return events
+
+
+class LoadHarness:
+    """Runs one load test; create a fresh instance per run."""
+
+    def __init__(self, config: BenchConfig) -> None:
+        self.config = config
+        scale = config.time_scale
+        seed = config.seed
+        self.llm = FakeLLM(config.llm, seed=seed, time_scale=scale)
+        self.social = FakeSocialMCP(config.social, seed=seed, time_scale=scale)
+        self.wallet = FakeWallet(config.wallet, seed=seed, time_scale=scale)
+        self.memory = FakeMemoryStore(config.memory, seed=seed, time_scale=scale)
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.end_to_end: dict[str, list[float]] = defaultdict(list)
+        self.outcomes: Counter[str] = Counter()
+        self._seq = 0
+        self._cost = Decimal(config.content_cost_usdc)
+        self._rng = random.Random(seed + 1)
+
+    async def run(self) -> dict[str, Any]:
+        cfg = self.config
+        feed = generate_feed(cfg)
+        # Trace from before the personas exist until the drive ends, so the
+        # per-agent figure includes queues, caches and in-flight work under
+        # load, not just the idle persona records. The synthetic feed is the
+        # load, not the agents, so it is built before tracing starts.
+        tracemalloc.start()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        personas = [
+            generate_persona(random.Random(f"{cfg.seed}:{i}"), i, cfg.tenants)
+            for i in range(cfg.agents)
+        ]
+        registry = MockOpenClawRegistry()
+        self.publisher = StatusPublisher(
+            registry,
+            PublisherConfig(
+                heartbeat_interval_seconds=120.0 * cfg.time_scale,
+                debounce_seconds=2.0 * cfg.time_scale,
+                max_debounce_seconds=10.0 * cfg.time_scale,
+            ),
+            rng=random.Random(cfg.seed),
+        )
+        for persona in personas:
+            self.publisher.register(
+                persona["agent_id"],
+                {
+                    "agent_id": persona["agent_id"],
+                    "tenant_id": persona["tenant_id"],
+                    "name": persona["name"],
+                    "niche": persona["niche"],
+                    "status": {"operational_state": "sleeping", "queue_depth": 0},
+                },
+            )
+        self.wallet_cache = WalletBalanceCache(
+            lambda agent_id: self.wallet.call_blocking(
+                "get_balance", {"agent_id": agent_id}
+            ),
+            ttl_seconds=10.0 * cfg.time_scale,
+            max_staleness_seconds=60.0 * cfg.time_scale,
+            max_workers=16,
+        )
+        with tempfile.TemporaryDirectory() as workdir:
+            self.persona_pipeline = PersonaEvolutionPipeline(
+                self._summarize,
+                self._embed,
+                self._write_memories,
+                f"{workdir}/persona.journal",
+                merge_window_seconds=30.0 * cfg.time_scale,
+                retry_backoff_seconds=5.0 * cfg.time_scale,
+                fsync=False,
+            )
+            self.persona_pipeline.start()
+            wall_start = time.perf_counter()
+            await self._drive(personas, feed)
+            wall_seconds = time.perf_counter() - wall_start
+            agent_bytes = tracemalloc.get_traced_memory()[1] - baseline_bytes
+            tracemalloc.stop()
+            self.persona_pipeline.stop()
+        self.wallet_cache.close()
+
+        return self._report(feed, agent_bytes, wall_seconds, registry)
+
+    # -- Driver -------------------------------------------------------------
+
+    async def _drive(self, personas: list[dict[str, Any]], feed: list[_Event]) -> None:
+        cfg = self.config
+        self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.review_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        pools = [asyncio.create_task(self._worker()) for _ in range(cfg.workers)]
+        pools += [asyncio.create_task(self._judge()) for _ in range(cfg.judges)]
+        pools.append(asyncio.create_task(self._publish_loop()))
+
+        start = time.perf_counter()
+        planners = []
+        for event in feed:
+            delay = start + event.at * cfg.time_scale - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            job = _Job(event, personas[event.agent_index], time.perf_counter())
+            planners.append(asyncio.create_task(self._plan(job)))
+        await asyncio.gather(*planners)
+        await self.task_queue.join()
+        await self.review_queue.join()
+        for task in pools:
+            task.cancel()
+        await asyncio.gather(*pools, return_exceptions=True)
+        self.publisher.flush()
+
+    async def _publish_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.time_scale)
+            self.publisher.flush()
+
+    # -- Planner / Worker / Judge -----------------------------------------
+
+    async def _plan(self, job: _Job) -> None:
+        event, persona = job.event, job.persona
+        agent_id = persona["agent_id"]
+        self._set_state(agent_id, "planning")
+        if event.kind == "trend":
+            balance = await asyncio.to_thread(
+                skill_get_wallet_balance, agent_id, cache=self.wallet_cache
+            )
+            if not balance["success"] or (
+                Decimal(balance["balances"].get("USDC", "0")) < self._cost
+            ):
+                self.outcomes["skipped_budget"] += 1
+                return
+        job.task = {
+            "task_id": str(uuid.uuid4()),
+            "task_type": "reply_comment"
+            if event.kind == "mention"
+            else "generate_content",
+            "priority": event.priority,
+            "context": {
+                "goal_description": f"Respond to {event.kind} in {persona['niche'][0]}",
+                "persona_constraints": persona["directives"],
+                "required_resources": [f"mcp://twitter/mentions/{agent_id}"],
+            },
+            "assigned_worker_id": "",
+            "created_at": iso_now(),
+            "status": "pending",
+        }
+        self._mark(job, "plan")
+        await self._put(self.task_queue, job)
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, job = await self.task_queue.get()
+            try:
+                self._mark(job, "queue_wait")
+                agent_id = job.persona["agent_id"]
+                self._set_state(agent_id, "working")
+                try:
+                    generated = await self._call(
+                        self.llm,
+                        "generate_text",
+                        {
+                            "task_id": job.task["task_id"],
+                            "prompt": job.task["context"]["goal_description"],
+                        },
+                    )
+                except FakeServerError:
+                    self.outcomes["failed"] += 1
+                    self._set_state(agent_id, "sleeping")
+                    continue
+                job.result = {
+                    "result_id": str(uuid.uuid4()),
+                    "task_id": job.task["task_id"],
+                    "agent_id": agent_id,
+                    "status": "success",
+                    "artifact": {
+                        "content_type": "text",
+                        "text_content": generated["text_content"],
+                        "platform": "twitter",
+                        "disclosure_level": "automated",
+                    },
+                    "confidence_score": generated["confidence_score"],
+                    "created_at": iso_now(),
+                }
+                self._mark(job, "work")
+                await self._put(self.review_queue, job)
+            finally:
+                self.task_queue.task_done()
+
+    async def _judge(self) -> None:
+        while True:
+            _, _, job = await self.review_queue.get()
+            try:
+                self._mark(job, "review_wait")
+                await self._review(job)
+                self._set_state(job.persona["agent_id"], "sleeping")
+            finally:
+                self.review_queue.task_done()
+
+    async def _review(self, job: _Job) -> None:
+        agent_id = job.persona["agent_id"]
+        self._set_state(agent_id, "judging")
+        score = job.result["confidence_score"]
+        self._mark(job, "judge")
+        if score < 0.7:
+            self.outcomes["rejected"] += 1
+            return
+        if score <= 0.9:
+            self.outcomes["hitl"] += 1
+            return
+        try:
+            if job.event.kind == "mention":
+                await self._call(
+                    self.social,
+                    "reply_comment",
+                    {
+                        "platform": "twitter",
+                        "parent_id": job.task["task_id"],
+                        "text_content": job.result["artifact"]["text_content"],
+                    },
+                )
+            else:
+                await self._pay_for_content(agent_id, job.task["task_id"])
+                await self._call(
+                    self.social,
+                    "post_content",
+                    {
+                        "platform": "twitter",
+                        "text_content": job.result["artifact"]["text_content"],
+                    },
+                )
+        except FakeServerError:
+            self.outcomes["failed"] += 1
+            return
+        self._mark(job, "act")
+        self.outcomes["published"] += 1
+        elapsed = (time.perf_counter() - job.started) / self.config.time_scale
+        self.end_to_end[job.event.priority].append(elapsed)
+        if self._rng.random() < self.config.high_engagement_fraction:
+            skill_evolve_persona(
+                agent_id=agent_id,
+                interaction_id=str(uuid.uuid4()),
+                engagement_metrics={"likes": 120, "engagement_score": 0.95},
+                interaction_content={"text": job.result["artifact"]["text_content"]},
+                timestamp=iso_now(),
+                pipeline=self.persona_pipeline,
+            )
+
+    async def _pay_for_content(self, agent_id: str, task_id: str) -> None:
+        result = await asyncio.to_thread(
+            self.wallet.call_blocking,
+            "send_payment",
+            {"agent_id": agent_id, "task_id": task_id, "amount_usdc": str(self._cost)},
+        )
+        self.wallet_cache.apply_transfer(agent_id, result)
+
+    # -- Helpers -------------------------------------------------------------
+
+    async def _call(
+        self, server: FakeServer, tool: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Call with exponential backoff on transient errors."""
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                return await server.call(tool, arguments)
+            except FakeServerError:
+                self.outcomes["retries"] += 1
+                if attempt == self.config.max_retries:
+                    raise
+                await asyncio.sleep(0.2 * 2**attempt * self.config.time_scale)
+        raise AssertionError("unreachable")
+
+    async def _put(self, queue: asyncio.PriorityQueue, job: _Job) -> None:
+        self._seq += 1
+        await queue.put((PRIORITY_RANK[job.event.priority], self._seq, job))
+
+    def _mark(self, job: _Job, stage: str) -> None:
+        now = time.perf_counter()
+        previous = max(job.marks.values(), default=job.started)
+        job.marks[stage] = now
+        self.samples[stage].append((now - previous) / self.config.time_scale)
+
+    def _set_state(self, agent_id: str, state: str) -> None:
+        self.publisher.update(agent_id, {"status": {"operational_state": state}})
+
+    def _summarize(self, agent_id: str, items: list[dict[str, Any]]) -> str:
+        ids = [item["interaction_id"] for item in items]
+        result = self.llm.call_blocking(
+            "summarize", {"agent_id": agent_id, "items": ids}
+        )
+        return result["summary"]
+
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        return self.llm.call_blocking("embed", {"texts": texts})["vectors"]
+
+    def _write_memories(self, records: list[dict[str, Any]]) -> None:
+        ids = [record["memory_id"] for record in records]
+        self.memory.call_blocking("write_memory", {"records": ids})
+
+    def _report(
+        self,
+        feed: list[_Event],
+        agent_bytes: int,
+        wall_seconds: float,
+        registry: MockOpenClawRegistry,
+    ) -> dict[str, Any]:
+        cfg = self.config
+        high = self.end_to_end.get("high", [])
+        everything = [s for samples in self.end_to_end.values() for s in samples]
+        within = sum(1 for s in high if s <= HIGH_PRIORITY_TARGET_SECONDS)
+        return {
+            "config": asdict(cfg),
+            "events": len(feed),
+            "outcomes": dict(self.outcomes),
+            "throughput_tasks_per_second": round(
+                self.outcomes["published"] / cfg.duration_seconds, 3
+            ),
+            "stages": {stage: percentiles(self.samples[stage]) for stage in STAGES},
+            "end_to_end": {
+                "all": percentiles(everything),
+                **{p: percentiles(self.end_to_end[p]) for p in PRIORITY_RANK},
+            },
+            "high_priority_within_10s": round(within / len(high), 4) if high else 1.0,
+            "memory_per_agent_bytes": agent_bytes // max(cfg.agents, 1),
+            "peak_rss_mb": _peak_rss_mb(),
+            "calls": {
+                server.name: dict(server.calls)
+                for server in (self.llm, self.social, self.wallet, self.memory)
+            },
+            "wallet_balance_fetches": self.wallet_cache.fetches,
+            "persona_memories_written": self.memory.records,
+            "openclaw_messages": self.publisher.stats.messages_sent,
+            "wall_seconds": round(wall_seconds, 3),
+        }
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1)
+
+
+def run_load_test(config: BenchConfig | None = None) -> dict[str, Any]:
+    """Run one load test synchronously and return its report."""
+    return asyncio.run(LoadHarness(config or BenchConfig()).run())
+
+
+def compare_reports(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2
+) -> list[str]:
+    """List regressions of ``current`` against ``baseline`` beyond ``tolerance``."""
+    regressions = []
+    base_tp = baseline["throughput_tasks_per_second"]
+    if current["throughput_tasks_per_second"] < base_tp * (1 - tolerance):
+        regressions.append(
+            f"throughput {current['throughput_tasks_per_second']} < {base_tp}"
+        )
+    for scope in ("all", "high"):
+        for p in ("p95", "p99"):
+            now_value = current["end_to_end"][scope][p]
+            base_value = baseline["end_to_end"][scope][p]
+            if base_value and now_value > base_value * (1 + tolerance):
+                regressions.append(
+                    f"end_to_end.{scope}.{p} {now_value}s > {base_value}s"
+                )
+    if current["high_priority_within_10s"] < baseline["high_priority_within_10s"] - (
+        tolerance / 10
+    ):
+        regressions.append(
+            "high_priority_within_10s "
+            f"{current['high_priority_within_10s']} < "
+            f"{baseline['high_priority_within_10s']}"
+        )
+    return regressions
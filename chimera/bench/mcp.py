@@ -0,0 +1,114 @@
+"""
+MCP client layer benchmark: ``python -m chimera.bench.mcp``.
+
+Runs the same burst of skill calls against an in-process
+:class:`StubMCPServer` twice:
+
+- ``per_call``: every call opens its own session, sends one request and
+  closes it (what each skill did without a shared client layer).
+- ``shared``: all calls go through one :class:`MCPClientManager`, so they
+  share a single pipelined session and identical resource reads coalesce.
+
+Both modes report wall time, sessions opened and requests the server saw.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from chimera.mcp.client import MCPClientManager, ServerConfig
+from chimera.mcp.session import MCPSession
+from chimera.mcp.stub_server import StubMCPServer
+
+SERVER = "mcp-server-stub"
+
+
+def _workload(calls: int, hot_uris: int, read_share: float, seed: int) -> list:
+    rng = random.Random(seed)
+    work = []
+    for index in range(calls):
+        if rng.random() < read_share:
+            uri = f"mcp://news/trending/{rng.randrange(hot_uris)}"
+            work.append(("resources/read", {"uri": uri}))
+        else:
+            arguments = {"name": "echo", "arguments": {"n": index}}
+            work.append(("tools/call", arguments))
+    return work
+
+
+async def _per_call(server: StubMCPServer, work: list) -> None:
+    async def one(method: str, params: dict[str, Any]) -> None:
+        session = MCPSession(await server.connect())
+        await session.initialize()
+        try:
+            await session.request(method, params)
+        finally:
+            await session.close()
+
+    await asyncio.gather(*(one(method, params) for method, params in work))
+
+
+async def _shared(server: StubMCPServer, work: list) -> dict[str, Any]:
+    manager = MCPClientManager([ServerConfig(SERVER, server.connect)])
+
+    async def one(method: str, params: dict[str, Any]) -> None:
+        if method == "resources/read":
+            await manager.read_resource(SERVER, params["uri"])
+        else:
+            await manager.call_tool(SERVER, params["name"], params["arguments"])
+
+    await asyncio.gather(*(one(method, params) for method, params in work))
+    metrics = manager.metrics()[SERVER]
+    await manager.close()
+    return metrics
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    server = StubMCPServer(
+        SERVER,
+        latency_seconds=args.latency,
+        connect_latency_seconds=args.connect_latency,
+    )
+    work = _workload(args.calls, args.hot_uris, args.read_share, args.seed)
+    started = time.perf_counter()
+    metrics = None
+    if mode == "per_call":
+        await _per_call(server, work)
+    else:
+        metrics = await _shared(server, work)
+    report = {
+        "wall_seconds": round(time.perf_counter() - started, 4),
+        "sessions_opened": server.sessions,
+        "server_requests": sum(server.requests.values()),
+        "max_in_flight": server.max_in_flight,
+    }
+    if metrics is not None:
+        report["client_metrics"] = metrics
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench.mcp")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--hot-uris", type=int, default=20)
+    parser.add_argument("--read-share", type=float, default=0.6)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--connect-latency", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = {
+        "calls": args.calls,
+        "per_call": asyncio.run(_run_mode("per_call", args)),
+        "shared": asyncio.run(_run_mode("shared", args)),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Generated SOUL personas for simulated agents (SRS FR 1.0).
+"""
+
+import random
+import uuid
+from typing import Any
+
+NICHES = ("fashion", "tech", "music", "fitness", "food", "travel", "gaming")
+REGIONS = ("Ethiopia", "Kenya", "Nigeria", "Ghana", "global")
+VOICE_TRAITS = ("witty", "warm", "Gen-Z slang", "analytical", "playful", "calm")
+DIRECTIVES = (
+    "Never discuss politics",
+    "Always disclose AI identity when asked",
+    "No financial advice",
+    "Keep replies under 280 characters",
+)
+
+
+def generate_persona(rng: random.Random, index: int, tenants: int) -> dict[str, Any]:
+    """One SOUL-derived persona, deterministic for a given ``rng`` state."""
+    niche = rng.choice(NICHES)
+    region = rng.choice(REGIONS)
+    persona = {
+        "agent_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "tenant_id": f"tenant-{index % tenants:03d}",
+        "name": f"Chimera {niche.title()} {index:04d}",
+        "niche": [niche, region],
+        "voice_traits": rng.sample(VOICE_TRAITS, 2),
+        "directives": rng.sample(DIRECTIVES, 2),
+        "backstory": f"A {niche} creator from {region} with a loyal audience.",
+    }
+    persona["soul_md"] = render_soul_md(persona)
+    return persona
+
+
+def render_soul_md(persona: dict[str, Any]) -> str:
+    """Render a persona as a SOUL.md document (YAML frontmatter + backstory)."""
+    lines = [
+        "---",
+        f"name: {persona['name']}",
+        f"niche: [{', '.join(persona['niche'])}]",
+        f"voice_traits: [{', '.join(persona['voice_traits'])}]",
+        "directives:",
+        *(f"  - {directive}" for directive in persona["directives"]),
+        "---",
+        "",
+        persona["backstory"],
+        "",
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,268 @@
+"""
+Shard scaling benchmark: ``python -m chimera.bench.shards``.
+
+For each shard count (default 1, 2, 4, 8) the parent process runs a
+:class:`ShardCoordinator`, routes a fixed backlog of ``--tasks`` Agent Tasks
+for ``--agents`` agents (spread over ``--tenants`` tenants) onto the hash
+ring by ``tenant_id`` and ships each shard's share to its own worker process.
+Tenants listed in ``--split`` are routed per agent instead. Every worker
+holds a :class:`Shard` (priority queue + agent cache) and, after a common
+start signal, drains its share. A task costs ``--cpu-ms`` of CPU work plus
+``--io-ms`` of waiting (the MCP / LLM round trip); a cache miss adds
+``--load-ms`` to load the agent's context. Caches start cold, so with a
+non-zero ``--load-ms`` more shards also mean warmer caches (fewer agents
+each) and scaling can exceed linear.
+
+Throughput is the backlog divided by the time until the slowest shard has
+drained its share, so an uneven tenant placement shows up as lost scaling
+efficiency (``backlog_imbalance`` is the busiest shard's share relative to
+an even split). The report also gives how many agents move when one shard
+joins under the same placement, compared with modulo placement. CPU work
+only scales with real cores, so the report includes ``cpu_count``; on fewer
+cores than shards, scaling comes from overlapping the I/O waits.
+
+Tenant routing does not scale near-linearly. Whole tenants are the unit of
+placement, so with the default 200 tenants the busiest of 8 shards holds
+about 1.3x an even share and efficiency at 8 shards is about 0.75, whatever
+the ring's ``--vnodes``. Routing per agent (``--split '*'``) with
+``--vnodes 1024`` reaches about 0.92.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import uuid
+from typing import Any, Iterable
+
+from chimera._time import iso_now
+from chimera.orchestration.coordinator import Assignment, ShardCoordinator
+from chimera.orchestration.ring import HashRing, ring_hash, routing_key
+from chimera.orchestration.shard import Shard
+
+TASK_TYPES = ("generate_content", "reply_comment", "fetch_trends")
+PRIORITIES = ("high", "medium", "medium", "low")
+
+
+def _agents(count: int, tenants: int, seed: int) -> dict[str, str]:
+    rng = random.Random(seed)
+    return {
+        str(uuid.UUID(int=rng.getrandbits(128), version=4)): f"tenant-{i % tenants:03d}"
+        for i in range(count)
+    }
+
+
+def _task(rng: random.Random) -> dict[str, Any]:
+    return {
+        "task_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "task_type": rng.choice(TASK_TYPES),
+        "priority": rng.choice(PRIORITIES),
+        "context": {"goal_description": "bench task"},
+        "created_at": iso_now(),
+        "status": "pending",
+    }
+
+
+def _burn(milliseconds: float) -> int:
+    """Deterministic CPU work for about ``milliseconds``."""
+    deadline = time.perf_counter() + milliseconds / 1000.0
+    value = 0
+    while time.perf_counter() < deadline:
+        value = ring_hash(str(value)) & 0xFFFF
+    return value
+
+
+def _shard_worker(
+    shard_id: str, assignment, inbox, results, start, settings: dict[str, Any]
+) -> None:
+    load_seconds = settings["load_ms"] / 1000.0
+
+    def load(agent_id: str) -> dict[str, Any]:
+        time.sleep(load_seconds)
+        return {"agent_id": agent_id}
+
+    shard = Shard(shard_id, cache_size=settings["cache_size"], loader=load)
+    shard.assign(assignment)
+    while (batch := inbox.get()) is not None:
+        shard.submit_many(batch)
+    results.put(("ready", shard_id, len(shard)))
+    start.wait()
+
+    io_seconds = settings["io_ms"] / 1000.0
+    completed = 0
+    began = time.perf_counter()
+    while (item := shard.pop()) is not None:
+        agent_id, tenant_id, _task = item
+        shard.context(agent_id, tenant_id)
+        _burn(settings["cpu_ms"])
+        time.sleep(io_seconds)
+        completed += 1
+    elapsed = time.perf_counter() - began
+    results.put(("done", shard_id, completed, elapsed, shard.stats()))
+
+
+def run_shards(
+    shards: int, agents: dict[str, str], args: argparse.Namespace
+) -> dict[str, Any]:
+    """Drain a routed backlog of ``args.tasks`` with ``shards`` processes."""
+    coordinator = ShardCoordinator(vnodes=args.vnodes, split_tenants=args.split)
+    for agent_id, tenant_id in agents.items():
+        coordinator.register_agent(agent_id, tenant_id)
+    for index in range(shards):
+        coordinator.join(f"shard-{index}")
+    assignment = coordinator.assignment
+
+    total = args.tasks
+    rng = random.Random(args.seed)
+    agent_ids = list(agents)
+    routed: dict[str, list] = {shard_id: [] for shard_id in assignment.shards}
+    routing_started = time.perf_counter()
+    for _ in range(total):
+        agent_id = rng.choice(agent_ids)
+        tenant_id = agents[agent_id]
+        owner = assignment.owner(tenant_id, agent_id)
+        routed[owner].append((agent_id, tenant_id, _task(rng)))
+    routing_seconds = time.perf_counter() - routing_started
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    start = context.Event()
+    settings = {
+        "cpu_ms": args.cpu_ms,
+        "io_ms": args.io_ms,
+        "load_ms": args.load_ms,
+        "cache_size": args.cache_size,
+    }
+    workers, inboxes = [], []
+    for shard_id, tasks in routed.items():
+        # Keep every inbox referenced until its worker has drained it.
+        inbox = context.Queue()
+        inboxes.append(inbox)
+        process = context.Process(
+            target=_shard_worker,
+            args=(shard_id, assignment, inbox, results, start, settings),
+            daemon=True,
+        )
+        process.start()
+        for offset in range(0, len(tasks), 512):
+            inbox.put(tasks[offset : offset + 512])
+        inbox.put(None)
+        workers.append(process)
+    for _ in workers:
+        results.get()
+    start.set()
+    reports = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+
+    completed = sum(report[2] for report in reports)
+    # Makespan: the backlog is done when the busiest shard is.
+    wall = max(report[3] for report in reports)
+    hits = sum(report[4]["cache_hits"] for report in reports)
+    misses = sum(report[4]["cache_misses"] for report in reports)
+    backlog = [len(tasks) for tasks in routed.values()]
+    return {
+        "shards": shards,
+        "completed": completed,
+        "wall_seconds": round(wall, 3),
+        "throughput_per_second": round(completed / wall, 1),
+        "routing_per_second": round(total / routing_seconds),
+        "cache_hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "backlog_imbalance": round(max(backlog) * len(backlog) / sum(backlog), 3),
+        "per_shard_completed": {report[1]: report[2] for report in reports},
+    }
+
+
+def movement(
+    agents: dict[str, str],
+    max_shards: int,
+    vnodes: int,
+    split_tenants: Iterable[str] = (),
+) -> list:
+    """
+    Agents moved when shard ``n + 1`` joins: consistent vs. modulo placement.
+
+    Agents are placed by :meth:`Assignment.key`, with the same
+    ``split_tenants`` as the benchmark runs.
+    """
+    split = frozenset(split_tenants)
+    keys = [routing_key(tenant, agent, split) for agent, tenant in agents.items()]
+    hashes = [ring_hash(key) for key in keys]
+    rows = []
+    for shards in range(1, max_shards):
+        before = Assignment(
+            0, HashRing((f"shard-{i}" for i in range(shards)), vnodes=vnodes), split
+        )
+        after = Assignment(1, before.ring.with_shard(f"shard-{shards}"), split)
+        ring_moved = sum(
+            before.owner(tenant, agent) != after.owner(tenant, agent)
+            for agent, tenant in agents.items()
+        )
+        modulo_moved = sum(h % shards != h % (shards + 1) for h in hashes)
+        rows.append(
+            {
+                "from_shards": shards,
+                "to_shards": shards + 1,
+                "ideal_fraction": round(1 / (shards + 1), 4),
+                "consistent_fraction": round(ring_moved / len(keys), 4),
+                "modulo_fraction": round(modulo_moved / len(keys), 4),
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench.shards")
+    parser.add_argument("--shards", default="1,2,4,8", help="shard counts to run")
+    parser.add_argument("--agents", type=int, default=2000)
+    parser.add_argument("--tenants", type=int, default=200)
+    parser.add_argument(
+        "--split",
+        default="",
+        help="tenants routed per agent: comma list, '*' for all; default none",
+    )
+    parser.add_argument("--tasks", type=int, default=2000, help="backlog size")
+    parser.add_argument("--cpu-ms", type=float, default=0.2)
+    parser.add_argument("--io-ms", type=float, default=5.0)
+    parser.add_argument("--load-ms", type=float, default=0.0)
+    parser.add_argument("--cache-size", type=int, default=4096)
+    parser.add_argument("--vnodes", type=int, default=128)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    agents = _agents(args.agents, args.tenants, args.seed)
+    if args.split == "*":
+        args.split = sorted(set(agents.values()))
+    else:
+        args.split = [tenant for tenant in args.split.split(",") if tenant]
+    counts = [int(count) for count in args.shards.split(",")]
+    runs = [run_shards(count, agents, args) for count in counts]
+    base = runs[0]["throughput_per_second"] / runs[0]["shards"]
+    # Against the first run, so an uneven placement lowers the efficiency.
+    for run in runs:
+        run["scaling_efficiency"] = round(
+            run["throughput_per_second"] / (base * run["shards"]), 3
+        )
+    report = {
+        "cpu_count": os.cpu_count(),
+        "agents": args.agents,
+        "tenants": args.tenants,
+        "split_tenants": len(args.split),
+        "tasks": args.tasks,
+        "task_cost_ms": {"cpu": args.cpu_ms, "io": args.io_ms, "load": args.load_ms},
+        "runs": runs,
+        "rebalance": movement(agents, max(counts), args.vnodes, args.split),
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
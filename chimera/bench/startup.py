@@ -0,0 +1,71 @@
+"""
+Worker cold-start benchmark: ``python -m chimera.bench.startup``.
+
+Spawns ``python -m chimera worker --skills=<role> --dry-run`` in a fresh
+interpreter per run and records wall-clock time to the ready report, the
+preload time the worker measured itself, peak RSS and loaded module count.
+Each role in :data:`WORKER_ROLES` is measured, plus ``all`` as the eager
+baseline every Worker would pay without the lazy registry.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+from chimera.skills.registry import WORKER_ROLES
+
+
+def measure_cold_start(
+    skills: str, *, runs: int = 5, python: str = sys.executable
+) -> dict[str, Any]:
+    """Median cold-start metrics for a worker started with ``--skills``."""
+    wall, preload, rss, modules = [], [], [], []
+    ready: dict[str, Any] = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [python, "-m", "chimera", "worker", f"--skills={skills}", "--dry-run"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        wall.append(time.perf_counter() - started)
+        ready = json.loads(completed.stdout.strip().splitlines()[-1])
+        preload.append(ready["preload_seconds"])
+        modules.append(ready["modules_loaded"])
+        if ready["max_rss_kb"] is not None:
+            rss.append(ready["max_rss_kb"])
+    return {
+        "skills": skills,
+        "loaded": len(ready.get("skills", [])),
+        "missing": len(ready.get("missing", [])),
+        "cold_start_seconds": round(statistics.median(wall), 4),
+        "preload_seconds": round(statistics.median(preload), 4),
+        "max_rss_kb": int(statistics.median(rss)) if rss else None,
+        "modules_loaded": int(statistics.median(modules)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.bench.startup")
+    parser.add_argument(
+        "--roles",
+        default=",".join([*WORKER_ROLES, "all"]),
+        help="comma-separated --skills selectors to measure",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = [
+        measure_cold_start(role, runs=args.runs) for role in args.roles.split(",")
+    ]
+    print(json.dumps({"runs": args.runs, "roles": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Command line entry point: ``python -m chimera``.
+
+``chimera worker --skills=...`` starts a Worker that preloads only the
+selected skills (names, categories, worker roles or ``all``; see
+:meth:`SkillRegistry.resolve`) and then serves JSON-lines requests on stdin::
+
+    {"id": 1, "skill": "skill_generate_text", "arguments": {...}}
+
+Each response is one JSON line on stdout: ``{"id": 1, "result": {...}}``.
+Before serving, each selected skill's ``configure`` hook installs its
+defaults (wallet cache, persona pipeline, mention ingestor) on the registry's
+lazy MCP client pool; stateful ones keep their files under ``--state-dir``.
+A ``ready`` line with preload time and peak RSS is written to stderr before
+the first request is read; ``--dry-run`` prints it to stdout and exits.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, TextIO
+
+from chimera.skills.registry import (
+    WORKER_ROLES,
+    SkillNotImplementedError,
+    SkillRegistry,
+    UnknownSkillError,
+    default_registry,
+    set_default_registry,
+)
+
+
+def max_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB (``None`` off Unix)."""
+    # Linux keeps ru_maxrss across exec, so a child spawned from a large
+    # parent would report the parent's peak; VmHWM is reset on exec.
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux.
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def serve(
+    registry: SkillRegistry,
+    skills: list[str],
+    stdin: TextIO,
+    stdout: TextIO,
+) -> int:
+    """Answer requests for ``skills`` until stdin closes; returns served count."""
+    allowed = set(skills)
+    served = 0
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            result = {"success": False, "error": f"invalid request: {exc}"}
+        else:
+            if not isinstance(request, dict):
+                result = {"success": False, "error": "request must be an object"}
+            else:
+                request_id = request.get("id")
+                result = _invoke(registry, allowed, request)
+        stdout.write(json.dumps({"id": request_id, "result": result}) + "\n")
+        stdout.flush()
+        served += 1
+    return served
+
+
+def _invoke(
+    registry: SkillRegistry, allowed: set[str], request: dict[str, Any]
+) -> dict[str, Any]:
+    name = request.get("skill")
+    if not isinstance(name, str):
+        return {"success": False, "error": "skill must be a string"}
+    if name not in allowed:
+        return {"success": False, "error": f"skill not served here: {name}"}
+    arguments = request.get("arguments") or {}
+    if not isinstance(arguments, dict):
+        return {"success": False, "error": "arguments must be an object"}
+    try:
+        return registry.get(name)(**arguments)
+    except SkillNotImplementedError as exc:
+        return {"success": False, "error": str(exc)}
+    except Exception as exc:
+        return {"success": False, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def worker(args: argparse.Namespace, registry: SkillRegistry | None = None) -> int:
+    started = time.perf_counter()
+    mcp = None
+    if registry is None and args.mcp_config:
+        mcp = _mcp_client(args.mcp_config)
+        registry = SkillRegistry(client_factory=mcp.bind)
+        set_default_registry(registry)
+    registry = registry or default_registry()
+    try:
+        skills = registry.resolve(args.skills.split(","))
+    except UnknownSkillError as exc:
+        print(f"chimera worker: {exc}", file=sys.stderr)
+        return 2
+    missing = registry.preload(skills)
+    if missing and args.strict:
+        print(
+            f"chimera worker: not implemented: {', '.join(missing)}",
+            file=sys.stderr,
+        )
+        return 2
+    ready = {
+        "event": "ready",
+        "skills": [name for name in skills if name not in missing],
+        "missing": missing,
+        "preload_seconds": round(time.perf_counter() - started, 6),
+        "max_rss_kb": max_rss_kb(),
+        "modules_loaded": len(sys.modules),
+    }
+    try:
+        if args.dry_run:
+            print(json.dumps(ready))
+            return 0
+        try:
+            registry.configure(ready["skills"], state_dir=args.state_dir)
+        except OSError as exc:
+            print(f"chimera worker: {exc}", file=sys.stderr)
+            return 2
+        print(json.dumps(ready), file=sys.stderr, flush=True)
+        serve(registry, ready["skills"], sys.stdin, sys.stdout)
+    finally:
+        registry.close()
+        if mcp is not None:
+            mcp.close()
+    return 0
+
+
+def _mcp_client(path: str) -> Any:
+    # Imported here so workers without MCP servers never load the client layer.
+    from chimera.mcp import BlockingMCPClient, MCPClientManager, load_server_configs
+
+    with open(path, encoding="utf-8") as config_file:
+        configs = load_server_configs(json.load(config_file))
+    return BlockingMCPClient(MCPClientManager(configs))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="chimera")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    worker_parser = commands.add_parser(
+        "worker", help="serve skill requests as a Worker"
+    )
+    worker_parser.add_argument(
+        "--skills",
+        default="all",
+        help=(
+            "comma-separated skill names, categories or roles "
+            f"({', '.join(WORKER_ROLES)}); default: all"
+        ),
+    )
+    worker_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="exit if a selected skill has no implementation",
+    )
+    worker_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="preload, print the ready report and exit",
+    )
+    worker_parser.add_argument(
+        "--mcp-config",
+        help="JSON file of MCP servers (see chimera.mcp.load_server_configs)",
+    )
+    worker_parser.add_argument(
+        "--state-dir",
+        default=os.path.join(tempfile.gettempdir(), f"chimera-worker-{os.getpid()}"),
+        help=(
+            "directory for skill journals; pass a fixed path to replay them "
+            "after a restart (default: per-process temp directory)"
+        ),
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "worker":
+        return worker(args)
+    return 2
@@ -0,0 +1,11 @@
+"""
+Agentic commerce support (skills/README.md § 5, SRS FR 5.x).
+"""
+
+from chimera.commerce.wallet_cache import (
+    BalanceSnapshot,
+    WalletBalanceCache,
+    WalletBalanceError,
+)
+
+__all__ = ["BalanceSnapshot", "WalletBalanceCache", "WalletBalanceError"]
@@ -0,0 +1,264 @@
+"""
+Per-agent wallet balance cache for skill_get_wallet_balance (SRS FR 5.1).
+
+The Planner must check the balance before every cost-incurring workflow;
+without a cache that is one Coinbase ``get_balance`` MCP round trip per
+content task. :class:`WalletBalanceCache` serves those reads locally:
+
+- Entries younger than ``ttl_seconds`` are returned as-is.
+- Entries older than ``ttl_seconds`` are still returned, and a background
+  refresh is started (stale-while-revalidate).
+- Entries older than ``max_staleness_seconds`` are never used: the caller
+  blocks on a refresh. This is the safety bound for budget decisions.
+- Concurrent reads of the same agent share one in-flight refresh, unless
+  it was sent too long ago to satisfy the reader's bound; then a new one is
+  sent.
+- Results of ``skill_transfer_asset`` / ``skill_deploy_token`` are applied
+  locally at once (write-through) and a background refresh is scheduled.
+
+Age is measured from when the last successful ``get_balance`` request was
+*sent*, so a slow MCP response never makes a balance look fresher than it is.
+Local debits recorded after a refresh was sent are re-applied on top of that
+refresh's result, so a chain read racing a transfer cannot resurrect funds
+that were already spent.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable
+
+from chimera._time import iso_now
+
+# agent_id -> get_balance MCP output (specs/technical.md § 1.7)
+BalanceFetcher = Callable[[str], dict[str, Any]]
+
+
+class WalletBalanceError(Exception):
+    """Raised when the wallet MCP server cannot provide a balance."""
+
+
+@dataclass(frozen=True)
+class BalanceSnapshot:
+    """Balances for one agent and how old the chain confirmation is."""
+
+    agent_id: str
+    wallet_address: str
+    balances: dict[str, Decimal]
+    age_seconds: float
+    checked_at: str
+
+    def to_output(self) -> dict[str, Any]:
+        """Render as the skill_get_wallet_balance output contract."""
+        return {
+            "success": True,
+            "wallet_address": self.wallet_address,
+            "balances": {token: str(amount) for token, amount in self.balances.items()},
+            "checked_at": self.checked_at,
+        }
+
+
+@dataclass
+class _Entry:
+    wallet_address: str
+    chain_balances: dict[str, Decimal]
+    confirmed_at: float
+    checked_at: str
+
+
+class WalletBalanceCache:
+    """
+    Thread-safe balance cache keyed by ``agent_id``.
+
+    ``fetch`` wraps the Coinbase MCP ``get_balance`` tool for one agent and is
+    only ever called from the refresh executor.
+    """
+
+    def __init__(
+        self,
+        fetch: BalanceFetcher,
+        *,
+        ttl_seconds: float = 10.0,
+        max_staleness_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_workers: int = 4,
+    ) -> None:
+        if ttl_seconds < 0 or max_staleness_seconds < ttl_seconds:
+            raise ValueError("require 0 <= ttl_seconds <= max_staleness_seconds")
+        self._fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="wallet-refresh"
+        )
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        # agent_id -> (ticket, sent_at, future) of the newest refresh
+        self._inflight: dict[str, tuple[int, float, Future]] = {}
+        self._tickets = 0
+        # (sequence, token, delta) applied locally, not yet covered by a
+        # chain read that was sent after them.
+        self._adjustments: dict[str, list[tuple[int, str, Decimal]]] = {}
+        self._seq = 0
+        self.fetches = 0
+
+    def get(
+        self, agent_id: str, *, max_staleness_seconds: float | None = None
+    ) -> BalanceSnapshot:
+        """
+        Return a balance no older than the staleness bound.
+
+        ``max_staleness_seconds`` may tighten (never loosen) the configured
+        bound, e.g. ``0`` to force a chain read before a large spend. The bound
+        is measured from the call: the returned balance was requested from the
+        chain no earlier than ``bound`` seconds before ``get`` was called.
+        """
+        bound = self.max_staleness_seconds
+        if max_staleness_seconds is not None:
+            bound = min(bound, max_staleness_seconds)
+        with self._lock:
+            entry = self._entries.get(agent_id)
+            now = self._clock()
+            not_before = now - bound
+            if entry is not None and entry.confirmed_at >= not_before:
+                if now - entry.confirmed_at > self.ttl_seconds:
+                    self._refresh_locked(agent_id)
+                return self._snapshot(agent_id, entry, now)
+            future = self._refresh_locked(agent_id, not_before)
+        while True:
+            future.result()
+            with self._lock:
+                entry = self._entries.get(agent_id)
+                if entry is not None and entry.confirmed_at >= not_before:
+                    return self._snapshot(agent_id, entry, self._clock())
+                # Invalidated while the refresh was in flight, or a newer
+                # refresh replaced the one we joined and then failed the bound.
+                future = self._refresh_locked(agent_id, not_before)
+
+    def refresh(self, agent_id: str) -> Future:
+        """Start (or join) a background refresh; returns its future."""
+        with self._lock:
+            return self._refresh_locked(agent_id)
+
+    def apply_transfer(self, agent_id: str, result: dict[str, Any]) -> None:
+        """Debit a successful ``skill_transfer_asset`` result locally."""
+        if not result.get("success"):
+            return
+        try:
+            amount = Decimal(str(result["amount"]))
+        except (KeyError, InvalidOperation) as exc:
+            raise ValueError(f"invalid transfer amount: {result!r}") from exc
+        self._adjust(agent_id, result.get("token_symbol", "USDC"), -amount)
+
+    def apply_deploy(
+        self,
+        agent_id: str,
+        result: dict[str, Any],
+        *,
+        gas_fee_native: str | None = None,
+    ) -> None:
+        """
+        Record a successful ``skill_deploy_token`` result.
+
+        The deploy output carries no fee, so the ETH balance is only debited
+        when the caller knows ``gas_fee_native``; a refresh is always started.
+        """
+        if not result.get("success"):
+            return
+        try:
+            fee = Decimal(gas_fee_native) if gas_fee_native is not None else Decimal(0)
+        except (TypeError, InvalidOperation) as exc:
+            raise ValueError(f"invalid gas_fee_native: {gas_fee_native!r}") from exc
+        self._adjust(agent_id, "ETH", -fee)
+
+    def invalidate(self, agent_id: str) -> None:
+        """Drop the cached entry; the next read blocks on the chain."""
+        with self._lock:
+            self._entries.pop(agent_id, None)
+
+    def close(self) -> None:
+        """Wait for in-flight refreshes and stop the executor."""
+        self._executor.shutdown(wait=True)
+
+    def _adjust(self, agent_id: str, token: str, delta: Decimal) -> None:
+        with self._lock:
+            self._seq += 1
+            if delta:
+                pending = self._adjustments.setdefault(agent_id, [])
+                pending.append((self._seq, token, delta))
+            self._refresh_locked(agent_id)
+
+    def _refresh_locked(self, agent_id: str, not_before: float | None = None) -> Future:
+        """Join the in-flight refresh if it was sent at or after ``not_before``."""
+        inflight = self._inflight.get(agent_id)
+        if inflight is not None and (not_before is None or inflight[1] >= not_before):
+            return inflight[2]
+        self.fetches += 1
+        self._tickets += 1
+        sent_at = self._clock()
+        future = self._executor.submit(
+            self._do_refresh, agent_id, self._tickets, self._seq, sent_at
+        )
+        self._inflight[agent_id] = (self._tickets, sent_at, future)
+        return future
+
+    def _do_refresh(
+        self, agent_id: str, ticket: int, seq_at_start: int, sent_at: float
+    ) -> None:
+        try:
+            result = self._fetch(agent_id)
+            if not result.get("success"):
+                raise WalletBalanceError(result.get("error", "get_balance failed"))
+            balances = {
+                token: Decimal(str(amount))
+                for token, amount in result.get("balances", {}).items()
+            }
+        except Exception as exc:
+            with self._lock:
+                self._finish_locked(agent_id, ticket)
+            if isinstance(exc, WalletBalanceError):
+                raise
+            raise WalletBalanceError(str(exc)) from exc
+
+        with self._lock:
+            self._finish_locked(agent_id, ticket)
+            current = self._entries.get(agent_id)
+            if current is not None and current.confirmed_at > sent_at:
+                # A refresh sent later has already landed; keep the newer read.
+                return
+            self._entries[agent_id] = _Entry(
+                wallet_address=result.get("wallet_address", ""),
+                chain_balances=balances,
+                confirmed_at=sent_at,
+                checked_at=iso_now(),
+            )
+            # Debits recorded after the request was sent may be missing from
+            # this chain read; keep them until a later refresh covers them.
+            later = [
+                adjustment
+                for adjustment in self._adjustments.pop(agent_id, [])
+                if adjustment[0] > seq_at_start
+            ]
+            if later:
+                self._adjustments[agent_id] = later
+                self._refresh_locked(agent_id)
+
+    def _finish_locked(self, agent_id: str, ticket: int) -> None:
+        inflight = self._inflight.get(agent_id)
+        if inflight is not None and inflight[0] == ticket:
+            del self._inflight[agent_id]
+
+    def _snapshot(self, agent_id: str, entry: _Entry, now: float) -> BalanceSnapshot:
+        balances = dict(entry.chain_balances)
+        for _, token, delta in self._adjustments.get(agent_id, ()):
+            balances[token] = balances.get(token, Decimal(0)) + delta
+        return BalanceSnapshot(
+            agent_id=agent_id,
+            wallet_address=entry.wallet_address,
+            balances=balances,
+            age_seconds=now - entry.confirmed_at,
+            checked_at=entry.checked_at,
+        )
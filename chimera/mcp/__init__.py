@@ -0,0 +1,37 @@
+"""
+Shared MCP client layer: persistent, pipelined sessions per server.
+"""
+
+from chimera.mcp.client import (
+    BlockingMCPClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    MCPClientManager,
+    ServerConfig,
+    ServerPolicy,
+    load_server_configs,
+)
+from chimera.mcp.session import (
+    MCPError,
+    MCPRemoteError,
+    MCPSession,
+    MCPTimeoutError,
+    MCPUnavailableError,
+    StdioTransport,
+)
+
+__all__ = [
+    "BlockingMCPClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "MCPClientManager",
+    "MCPError",
+    "MCPRemoteError",
+    "MCPSession",
+    "MCPTimeoutError",
+    "MCPUnavailableError",
+    "ServerConfig",
+    "ServerPolicy",
+    "StdioTransport",
+    "load_server_configs",
+]
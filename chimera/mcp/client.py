@@ -0,0 +1,489 @@
+"""
+Shared MCP client manager: one long-lived session per server per process.
+
+Skills reach every external system through MCP servers (specs/_meta.md).
+:class:`MCPClientManager` owns those connections:
+
+- A session is opened on first use of a server and reused for every later
+  call; concurrent requests are pipelined over it (:class:`MCPSession`).
+- Concurrent ``resources/read`` calls for the same URI on the same server
+  share one request; every caller receives the same result object.
+- Each server has its own :class:`ServerPolicy`: request timeout, retry with
+  exponential backoff, and a circuit breaker that fails fast while the
+  server is unhealthy.
+- Per-server call counts and latency percentiles are available from
+  :meth:`MCPClientManager.metrics`.
+
+Only transport failures and timeouts are retried or counted against the
+breaker; a JSON-RPC error is a definite answer from a healthy server. Tool
+calls have side effects (``post_content``, ``send_payment``), so they are
+retried only when listed in ``ServerPolicy.idempotent_tools``.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+from chimera.mcp.session import (
+    MCPRemoteError,
+    MCPSession,
+    MCPTimeoutError,
+    MCPUnavailableError,
+    StdioTransport,
+    Transport,
+)
+
+Connector = Callable[[], Awaitable[Transport]]
+
+
+class CircuitOpenError(MCPUnavailableError):
+    """The server's circuit breaker is open; the request was not sent."""
+
+
+@dataclass(frozen=True)
+class ServerPolicy:
+    """Timeout, retry and circuit-breaker settings for one MCP server."""
+
+    timeout_seconds: float = 10.0
+    connect_timeout_seconds: float = 10.0
+    max_attempts: int = 3
+    backoff_seconds: float = 0.2
+    max_backoff_seconds: float = 5.0
+    failure_threshold: int = 5
+    reset_timeout_seconds: float = 30.0
+    idempotent_tools: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        if self.timeout_seconds <= 0 or self.connect_timeout_seconds <= 0:
+            raise ValueError("timeouts must be positive")
+        if self.max_attempts < 1 or self.failure_threshold < 1:
+            raise ValueError("max_attempts and failure_threshold must be >= 1")
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """How to reach one MCP server and the policy to apply to it."""
+
+    name: str
+    connect: Connector
+    policy: ServerPolicy = field(default_factory=ServerPolicy)
+
+    @classmethod
+    def stdio(
+        cls,
+        name: str,
+        command: list[str],
+        *,
+        env: dict[str, str] | None = None,
+        policy: ServerPolicy | None = None,
+    ) -> "ServerConfig":
+        """A server launched as a subprocess speaking MCP over stdio."""
+        return cls(
+            name,
+            lambda: StdioTransport.spawn(command, env=env),
+            policy or ServerPolicy(),
+        )
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker: closed -> open -> half-open -> closed.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls for ``reset_timeout_seconds``. It then admits one trial
+    call; success closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Give back a half-open trial that ended without an outcome."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+
+class ServerStats:
+    """Counters and a bounded latency window for one server."""
+
+    def __init__(self, window: int = 2048) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.sessions_opened = 0
+        self.max_in_flight = 0
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    def snapshot(self, breaker: CircuitBreaker) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def rank(p: float) -> float:
+            if not ordered:
+                return 0.0
+            index = max(0, min(len(ordered) - 1, int(p * len(ordered) + 0.5) - 1))
+            return round(ordered[index], 6)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "sessions_opened": self.sessions_opened,
+            "max_in_flight": self.max_in_flight,
+            "breaker": breaker.state,
+            "latency_seconds": {
+                "p50": rank(0.50),
+                "p95": rank(0.95),
+                "p99": rank(0.99),
+                "max": round(ordered[-1], 6) if ordered else 0.0,
+            },
+        }
+
+
+class _Server:
+    def __init__(self, config: ServerConfig, clock: Callable[[], float]) -> None:
+        self.config = config
+        self.policy = config.policy
+        self.breaker = CircuitBreaker(
+            config.policy.failure_threshold,
+            config.policy.reset_timeout_seconds,
+            clock=clock,
+        )
+        self.stats = ServerStats()
+        self.session: MCPSession | None = None
+        self.connect_lock = asyncio.Lock()
+        self.reads: dict[str, asyncio.Task] = {}
+
+
+class MCPClientManager:
+    """
+    Process-wide MCP connections, keyed by server name.
+
+    All methods must be awaited on the same event loop; use
+    :class:`BlockingMCPClient` from synchronous skill code.
+    """
+
+    def __init__(
+        self,
+        servers: Iterable[ServerConfig],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._configs = {config.name: config for config in servers}
+        self._servers: dict[str, _Server] = {}
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    def servers(self) -> list[str]:
+        return list(self._configs)
+
+    async def call_tool(
+        self, server: str, tool: str, arguments: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """``tools/call``; retried only if ``tool`` is declared idempotent."""
+        state = self._server(server)
+        return await self._request(
+            state,
+            "tools/call",
+            {"name": tool, "arguments": arguments or {}},
+            retry=tool in state.policy.idempotent_tools,
+        )
+
+    async def read_resource(self, server: str, uri: str) -> dict[str, Any]:
+        """``resources/read``, coalesced with identical in-flight reads."""
+        state = self._server(server)
+        task = state.reads.get(uri)
+        if task is None:
+            task = asyncio.create_task(
+                self._request(state, "resources/read", {"uri": uri}, retry=True)
+            )
+            state.reads[uri] = task
+            task.add_done_callback(lambda _, uri=uri: state.reads.pop(uri, None))
+        else:
+            state.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def request(
+        self,
+        server: str,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        retry: bool = False,
+    ) -> Any:
+        """Any other MCP method (``tools/list``, ``resources/list``, ...)."""
+        return await self._request(self._server(server), method, params, retry=retry)
+
+    def client(self, server: str) -> "ServerClient":
+        """A handle bound to one server, e.g. for a :class:`LazyClientPool`."""
+        self._server(server)
+        return ServerClient(self, server)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Per-server counters and latency percentiles (servers used so far)."""
+        return {
+            name: state.stats.snapshot(state.breaker)
+            for name, state in self._servers.items()
+        }
+
+    async def close(self) -> None:
+        """Close every open session."""
+        for state in self._servers.values():
+            for task in list(state.reads.values()):
+                task.cancel()
+            if state.session is not None:
+                await state.session.close()
+                state.session = None
+
+    def _server(self, name: str) -> _Server:
+        state = self._servers.get(name)
+        if state is None:
+            try:
+                config = self._configs[name]
+            except KeyError:
+                raise KeyError(f"unknown MCP server: {name}") from None
+            state = self._servers[name] = _Server(config, self._clock)
+        return state
+
+    async def _request(
+        self,
+        state: _Server,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        retry: bool,
+    ) -> Any:
+        policy = state.policy
+        attempts = policy.max_attempts if retry else 1
+        for attempt in range(1, attempts + 1):
+            if not state.breaker.allow():
+                state.stats.rejected += 1
+                raise CircuitOpenError(f"{state.config.name}: circuit open")
+            started = self._clock()
+            state.stats.requests += 1
+            try:
+                session = await self._session(state)
+                state.stats.max_in_flight = max(
+                    state.stats.max_in_flight, session.in_flight + 1
+                )
+                result = await asyncio.wait_for(
+                    session.request(method, params), policy.timeout_seconds
+                )
+            except asyncio.CancelledError:
+                state.breaker.release()
+                raise
+            except MCPRemoteError:
+                state.breaker.record_success()
+                state.stats.errors += 1
+                state.stats.latencies.append(self._clock() - started)
+                raise
+            except (MCPUnavailableError, TimeoutError) as exc:
+                state.breaker.record_failure()
+                state.stats.errors += 1
+                if isinstance(exc, TimeoutError):
+                    state.stats.timeouts += 1
+                    exc = MCPTimeoutError(
+                        f"{state.config.name} {method}: no response within "
+                        f"{policy.timeout_seconds}s"
+                    )
+                if attempt == attempts:
+                    raise exc
+                state.stats.retries += 1
+                await asyncio.sleep(self._backoff(policy, attempt))
+                continue
+            state.breaker.record_success()
+            state.stats.latencies.append(self._clock() - started)
+            return result
+        raise AssertionError("unreachable")
+
+    async def _session(self, state: _Server) -> MCPSession:
+        session = state.session
+        if session is not None and not session.closed:
+            return session
+        async with state.connect_lock:
+            session = state.session
+            if session is not None and not session.closed:
+                return session
+            if session is not None:
+                await session.close()
+            timeout = state.policy.connect_timeout_seconds
+            try:
+                transport = await asyncio.wait_for(state.config.connect(), timeout)
+            except (OSError, TimeoutError, MCPUnavailableError) as exc:
+                raise MCPUnavailableError(
+                    f"{state.config.name}: connect failed: {exc!r}"
+                ) from exc
+            session = MCPSession(transport)
+            try:
+                await asyncio.wait_for(session.initialize(), timeout)
+            except BaseException as exc:
+                # Never leave a half-open transport (or stdio subprocess) and
+                # its reader task behind a failed handshake.
+                await session.close()
+                # A JSON-RPC error here (e.g. a rejected protocol version) is
+                # a failed connect, not a healthy answer.
+                if isinstance(
+                    exc, (OSError, TimeoutError, MCPUnavailableError, MCPRemoteError)
+                ):
+                    raise MCPUnavailableError(
+                        f"{state.config.name}: initialize failed: {exc!r}"
+                    ) from exc
+                raise
+            state.session = session
+            state.stats.sessions_opened += 1
+            return session
+
+    def _backoff(self, policy: ServerPolicy, attempt: int) -> float:
+        delay = min(
+            policy.max_backoff_seconds, policy.backoff_seconds * 2 ** (attempt - 1)
+        )
+        return delay * (0.5 + self._rng.random() / 2)
+
+
+class ServerClient:
+    """:class:`MCPClientManager` calls pre-bound to one server."""
+
+    def __init__(self, manager: MCPClientManager, server: str) -> None:
+        self.manager = manager
+        self.server = server
+
+    async def call_tool(
+        self, tool: str, arguments: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.manager.call_tool(self.server, tool, arguments)
+
+    async def read_resource(self, uri: str) -> dict[str, Any]:
+        return await self.manager.read_resource(self.server, uri)
+
+
+class BlockingMCPClient:
+    """
+    Synchronous facade for skills, running the manager on a private loop.
+
+    Calls from any thread are submitted to one background event loop, so
+    blocking callers still share sessions, pipelining and coalescing.
+    """
+
+    def __init__(self, manager: MCPClientManager) -> None:
+        self.manager = manager
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mcp-client", daemon=True
+        )
+        self._thread.start()
+
+    def call_tool(
+        self, server: str, tool: str, arguments: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return self._run(self.manager.call_tool(server, tool, arguments))
+
+    def read_resource(self, server: str, uri: str) -> dict[str, Any]:
+        return self._run(self.manager.read_resource(server, uri))
+
+    def bind(self, server: str) -> "BoundBlockingClient":
+        """A synchronous handle for one server (a ``LazyClientPool`` factory)."""
+        self.manager.client(server)
+        return BoundBlockingClient(self, server)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        return self._run(self._metrics())
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self.manager.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _metrics(self) -> dict[str, dict[str, Any]]:
+        return self.manager.metrics()
+
+    def _run(self, coro: Awaitable[Any]) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+class BoundBlockingClient:
+    """:class:`BlockingMCPClient` calls pre-bound to one server."""
+
+    def __init__(self, client: BlockingMCPClient, server: str) -> None:
+        self.client = client
+        self.server = server
+
+    def call_tool(
+        self, tool: str, arguments: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return self.client.call_tool(self.server, tool, arguments)
+
+    def read_resource(self, uri: str) -> dict[str, Any]:
+        return self.client.read_resource(self.server, uri)
+
+
+def load_server_configs(document: dict[str, Any]) -> list[ServerConfig]:
+    """
+    Build stdio server configs from a JSON document::
+
+        {"mcp-server-news": {"command": ["news-mcp"], "env": {},
+                             "timeout_seconds": 5, "idempotent_tools": []}}
+
+    Keys other than ``command`` and ``env`` are :class:`ServerPolicy` fields.
+    """
+    configs = []
+    for name, spec in document.items():
+        spec = dict(spec)
+        command = spec.pop("command")
+        env = spec.pop("env", None)
+        if "idempotent_tools" in spec:
+            spec["idempotent_tools"] = frozenset(spec["idempotent_tools"])
+        configs.append(
+            ServerConfig.stdio(name, command, env=env, policy=ServerPolicy(**spec))
+        )
+    return configs
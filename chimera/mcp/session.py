@@ -0,0 +1,222 @@
+"""
+MCP sessions: JSON-RPC 2.0 over a message transport (specs/technical.md § 1).
+
+An :class:`MCPSession` performs the ``initialize`` handshake once and then
+multiplexes any number of concurrent requests over the same transport. Each
+request gets its own id; a single reader task routes responses back to the
+waiting callers, so requests are pipelined instead of sent one at a time.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+from typing import Any, Protocol
+
+PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "chimera", "version": "0.1.0"}
+
+
+class MCPError(Exception):
+    """Base class for MCP client failures."""
+
+
+class MCPRemoteError(MCPError):
+    """The server answered with a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str, data: Any = None) -> None:
+        super().__init__(f"[{code}] {message}")
+        self.code = code
+        self.data = data
+
+
+class MCPUnavailableError(MCPError):
+    """The server could not be reached or stopped responding."""
+
+
+class MCPTimeoutError(MCPUnavailableError):
+    """A request exceeded its server's timeout."""
+
+
+class Transport(Protocol):
+    """Ordered, bidirectional stream of JSON-RPC messages."""
+
+    async def send(self, message: dict[str, Any]) -> None: ...
+
+    async def receive(self) -> dict[str, Any]:
+        """Next message; raises :class:`EOFError` once the peer has gone."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class StdioTransport:
+    """Newline-delimited JSON-RPC over a server subprocess's stdin/stdout."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self._process = process
+
+    @classmethod
+    async def spawn(
+        cls, command: list[str], *, env: dict[str, str] | None = None
+    ) -> "StdioTransport":
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env={**os.environ, **env} if env else None,
+            limit=1 << 24,
+        )
+        return cls(process)
+
+    async def send(self, message: dict[str, Any]) -> None:
+        stdin = self._process.stdin
+        stdin.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        await stdin.drain()
+
+    async def receive(self) -> dict[str, Any]:
+        line = await self._process.stdout.readline()
+        if not line:
+            raise EOFError("MCP server closed stdout")
+        return json.loads(line)
+
+    async def close(self) -> None:
+        if self._process.returncode is None:
+            self._process.stdin.close()
+            try:
+                await asyncio.wait_for(self._process.wait(), 2.0)
+            except TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+
+
+class MCPSession:
+    """One initialized MCP connection with pipelined requests."""
+
+    def __init__(self, transport: Transport) -> None:
+        self._transport = transport
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reader: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+        # ``closed`` also flips when the connection fails; the transport is
+        # only released by close(), exactly once.
+        self.closed = False
+        self._transport_closed = False
+        self.server_info: dict[str, Any] = {}
+
+    async def initialize(self) -> dict[str, Any]:
+        """Run the ``initialize`` handshake; returns the server's result."""
+        self._reader = asyncio.create_task(self._read_loop())
+        result = await self.request(
+            "initialize",
+            {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": CLIENT_INFO,
+            },
+        )
+        self.server_info = result.get("serverInfo", {})
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return result
+
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Send one request and wait for its result."""
+        if self.closed:
+            raise MCPUnavailableError("session is closed")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._send(message)
+            return await future
+        except asyncio.CancelledError:
+            if not self.closed:
+                await self._notify_cancelled(request_id)
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def close(self) -> None:
+        if self._transport_closed:
+            return
+        self._transport_closed = True
+        self._fail_pending(MCPUnavailableError("session closed"))
+        if self._reader is not None:
+            self._reader.cancel()
+        await self._transport.close()
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        async with self._send_lock:
+            try:
+                await self._transport.send(message)
+            except (OSError, RuntimeError) as exc:
+                self._fail_pending(MCPUnavailableError(f"send failed: {exc}"))
+                raise MCPUnavailableError(f"send failed: {exc}") from exc
+
+    async def _notify_cancelled(self, request_id: int) -> None:
+        try:
+            await asyncio.shield(
+                self._send(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "notifications/cancelled",
+                        "params": {"requestId": request_id, "reason": "timeout"},
+                    }
+                )
+            )
+        except (MCPError, asyncio.CancelledError):
+            pass
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                message = await self._transport.receive()
+                if not isinstance(message, dict):
+                    raise ValueError(f"not a JSON-RPC message: {message!r:.80}")
+                if "method" in message:
+                    if "id" in message:
+                        await self._answer_server_request(message)
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is None or future.done():
+                    continue  # late response to a cancelled request
+                if "error" in message:
+                    error = message["error"]
+                    future.set_exception(
+                        MCPRemoteError(
+                            error.get("code", -32603),
+                            error.get("message", "unknown error"),
+                            error.get("data"),
+                        )
+                    )
+                else:
+                    future.set_result(message.get("result"))
+        except asyncio.CancelledError:
+            raise
+        except (EOFError, OSError, ValueError) as exc:
+            self._fail_pending(MCPUnavailableError(f"connection lost: {exc}"))
+
+    async def _answer_server_request(self, message: dict[str, Any]) -> None:
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if message["method"] == "ping":
+            response["result"] = {}
+        else:
+            response["error"] = {"code": -32601, "message": "method not found"}
+        try:
+            await self._send(response)
+        except MCPError:
+            pass
+
+    def _fail_pending(self, error: MCPError) -> None:
+        self.closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
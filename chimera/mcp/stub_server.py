@@ -0,0 +1,242 @@
+"""
+Local stub MCP server for tests and benchmarks.
+
+:class:`StubMCPServer` answers ``initialize``, ``ping``, ``tools/list``,
+``tools/call`` and ``resources/read`` after a configurable latency, handling
+requests concurrently so pipelining is observable. Use :meth:`connect` for an
+in-process transport, or run it as a real stdio server::
+
+    python -m chimera.mcp.stub_server --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from collections import Counter
+from typing import Any, Callable
+
+from chimera.mcp.session import PROTOCOL_VERSION
+
+ToolHandler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class InProcessTransport:
+    """Client end of a queue pair connected to a :class:`StubMCPServer`."""
+
+    def __init__(self, outbox: asyncio.Queue, inbox: asyncio.Queue) -> None:
+        self._outbox = outbox
+        self._inbox = inbox
+        self._closed = False
+
+    async def send(self, message: dict[str, Any]) -> None:
+        if self._closed:
+            raise ConnectionResetError("transport closed")
+        await self._outbox.put(json.loads(json.dumps(message)))
+
+    async def receive(self) -> dict[str, Any]:
+        message = await self._inbox.get()
+        if message is None:
+            raise EOFError("stub server disconnected")
+        return message
+
+    async def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self._outbox.put(None)
+
+
+class StubMCPServer:
+    """
+    Scriptable MCP server.
+
+    ``latency_seconds`` delays every response; ``connect_latency_seconds``
+    delays ``initialize`` (the cost of opening a session). With
+    ``failure_rate`` a share of tool calls return a JSON-RPC error. While
+    ``down`` is set, new connections are refused and requests go unanswered.
+    ``initialize`` is rejected unless the client asks for
+    ``protocol_version``.
+    """
+
+    def __init__(
+        self,
+        name: str = "mcp-server-stub",
+        *,
+        latency_seconds: float = 0.0,
+        connect_latency_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        protocol_version: str = PROTOCOL_VERSION,
+        seed: int = 0,
+    ) -> None:
+        self.name = name
+        self.protocol_version = protocol_version
+        self.latency_seconds = latency_seconds
+        self.connect_latency_seconds = connect_latency_seconds
+        self.failure_rate = failure_rate
+        self.down = False
+        self.tools: dict[str, ToolHandler] = {
+            "echo": lambda arguments: {"echo": arguments},
+        }
+        self.requests: Counter[str] = Counter()
+        self.sessions = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._rng = random.Random(seed)
+        self._peers: list[asyncio.Queue] = []
+        self._serving: set[asyncio.Task] = set()
+
+    @property
+    def open_sessions(self) -> int:
+        """In-process sessions whose client has not closed the transport."""
+        return len(self._serving)
+
+    def add_tool(self, name: str, handler: ToolHandler) -> None:
+        self.tools[name] = handler
+
+    async def connect(self) -> InProcessTransport:
+        """Open an in-process session transport."""
+        if self.down:
+            raise ConnectionRefusedError(f"{self.name} is down")
+        to_server: asyncio.Queue = asyncio.Queue()
+        to_client: asyncio.Queue = asyncio.Queue()
+        self._peers.append(to_client)
+        task = asyncio.create_task(self._serve_queue(to_server, to_client))
+        self._serving.add(task)
+        task.add_done_callback(self._serving.discard)
+        return InProcessTransport(to_server, to_client)
+
+    async def disconnect_all(self) -> None:
+        """Drop every in-process session, as if the server restarted."""
+        peers, self._peers = self._peers, []
+        for peer in peers:
+            await peer.put(None)
+
+    async def handle(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        """Response for one request, or ``None`` for notifications."""
+        method = message.get("method")
+        if "id" not in message:
+            return None
+        self.requests[method] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if method == "initialize":
+                self.sessions += 1
+                await asyncio.sleep(self.connect_latency_seconds)
+            else:
+                await asyncio.sleep(self.latency_seconds)
+            while self.down:
+                await asyncio.sleep(0.01)
+            return {"jsonrpc": "2.0", "id": message["id"], **self._dispatch(message)}
+        finally:
+            self.in_flight -= 1
+
+    def _dispatch(self, message: dict[str, Any]) -> dict[str, Any]:
+        method = message["method"]
+        params = message.get("params") or {}
+        if method == "initialize":
+            if params.get("protocolVersion") != self.protocol_version:
+                return _error(-32602, "unsupported protocol version")
+            return {
+                "result": {
+                    "protocolVersion": self.protocol_version,
+                    "capabilities": {"tools": {}, "resources": {}},
+                    "serverInfo": {"name": self.name, "version": "0"},
+                }
+            }
+        if method == "ping":
+            return {"result": {}}
+        if method == "tools/list":
+            tools = [{"name": name, "inputSchema": {}} for name in self.tools]
+            return {"result": {"tools": tools}}
+        if method == "tools/call":
+            handler = self.tools.get(params.get("name"))
+            if handler is None:
+                return _error(-32602, f"unknown tool: {params.get('name')}")
+            if self._rng.random() < self.failure_rate:
+                return _error(-32603, "injected failure")
+            payload = handler(params.get("arguments") or {})
+            return {
+                "result": {
+                    "content": [{"type": "text", "text": json.dumps(payload)}],
+                    "structuredContent": payload,
+                    "isError": False,
+                }
+            }
+        if method == "resources/read":
+            uri = params.get("uri", "")
+            return {
+                "result": {
+                    "contents": [
+                        {
+                            "uri": uri,
+                            "mimeType": "application/json",
+                            "text": json.dumps({"uri": uri}),
+                        }
+                    ]
+                }
+            }
+        return _error(-32601, f"method not found: {method}")
+
+    async def _serve_queue(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        async def answer(message: dict[str, Any]) -> None:
+            response = await self.handle(message)
+            if response is not None:
+                await outbox.put(response)
+
+        tasks: set[asyncio.Task] = set()
+        while (message := await inbox.get()) is not None:
+            task = asyncio.create_task(answer(message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        for task in tasks:
+            task.cancel()
+
+    async def serve_stdio(self) -> None:
+        """Serve newline-delimited JSON-RPC on this process's stdin/stdout."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=1 << 24)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+        out = sys.stdout.buffer
+
+        async def answer(message: dict[str, Any]) -> None:
+            response = await self.handle(message)
+            if response is not None:
+                out.write(json.dumps(response).encode() + b"\n")
+                out.flush()
+
+        tasks: set[asyncio.Task] = set()
+        while line := await reader.readline():
+            task = asyncio.create_task(answer(json.loads(line)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _error(code: int, message: str) -> dict[str, Any]:
+    return {"error": {"code": code, "message": message}}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.mcp.stub_server")
+    parser.add_argument("--name", default="mcp-server-stub")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--connect-latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    server = StubMCPServer(
+        args.name,
+        latency_seconds=args.latency,
+        connect_latency_seconds=args.connect_latency,
+        failure_rate=args.failure_rate,
+    )
+    asyncio.run(server.serve_stdio())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
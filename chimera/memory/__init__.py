@@ -0,0 +1,7 @@
+"""
+Memory and persona management (skills/README.md § 2).
+"""
+
+from chimera.memory.persona_pipeline import JournalInUseError, PersonaEvolutionPipeline
+
+__all__ = ["JournalInUseError", "PersonaEvolutionPipeline"]
@@ -0,0 +1,434 @@
+"""
+Write-behind persona evolution pipeline (skills/README.md § 2.5, SRS FR 1.2).
+
+``skill_evolve_persona`` used to summarise and write each high-engagement
+interaction to Weaviate inline from the Judge. This pipeline moves that work
+off the Judge's hot path:
+
+1. :meth:`PersonaEvolutionPipeline.submit` appends the interaction to a local
+   journal and enqueues it under its agent; it does no LLM or network I/O.
+2. A background worker merges each agent's queued interactions into a single
+   memory once ``merge_threshold`` interactions are queued or the oldest has
+   waited ``merge_window_seconds``. One LLM summary is produced per merged
+   group.
+3. Summaries are embedded in batches of ``embed_batch_size`` and bulk-written
+   to the semantic store.
+4. The result, in the ``skill_evolve_persona`` output shape with
+   ``written_to_weaviate: true``, is reported through ``on_written`` and
+   :meth:`status`; a ``commit`` record is appended to the journal. An error
+   raised by ``on_written`` is logged; it never re-queues committed work.
+
+On restart the journal is replayed: interactions without a matching commit
+are re-queued, so pending writes survive a crash. Writes are at-least-once;
+the semantic store should upsert by ``memory_id``.
+
+The journal has its own lock, so the Judge never waits on the pipeline's
+state lock while the disk is busy; commits are appended in one write per
+batch. Once the journal reaches ``compact_bytes`` (and has doubled since the
+last compaction) it is rewritten to hold only the interactions that are still
+open, ready or being written. The live groups are copied without the journal
+lock; only the records appended meanwhile are copied under it.
+
+A journal belongs to one pipeline at a time: the constructor takes an
+exclusive lock on ``<journal>.lock`` (where ``fcntl`` is available) and raises
+:class:`JournalInUseError` if another pipeline, in any process, holds it.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from chimera._time import iso_now
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# (agent_id, interactions) -> summary text. One LLM call per merged group.
+Summarizer = Callable[[str, list[dict[str, Any]]], str]
+# texts -> vectors, same order. One embedding call per batch.
+Embedder = Callable[[list[str]], list[list[float]]]
+# records -> None; raises on failure. Maps to weaviate ``write_memory``.
+MemoryWriter = Callable[[list[dict[str, Any]]], None]
+# (memory_id, skill_evolve_persona output) -> None
+WrittenCallback = Callable[[str, dict[str, Any]], None]
+
+
+class JournalInUseError(OSError):
+    """Raised when another pipeline already owns the journal."""
+
+
+@dataclass
+class _Group:
+    memory_id: str
+    agent_id: str
+    opened_at: float
+    interactions: list[dict[str, Any]] = field(default_factory=list)
+
+
+class PersonaEvolutionPipeline:
+    """
+    Queues interactions per agent and writes merged memories in the background.
+
+    Use :meth:`start`/:meth:`stop` to run the worker thread, or call
+    :meth:`run_once` directly to process due groups synchronously.
+    """
+
+    def __init__(
+        self,
+        summarize: Summarizer,
+        embed: Embedder,
+        write: MemoryWriter,
+        journal_path: str | os.PathLike[str],
+        *,
+        merge_threshold: int = 5,
+        merge_window_seconds: float = 30.0,
+        embed_batch_size: int = 32,
+        retry_backoff_seconds: float = 5.0,
+        max_status_entries: int = 10_000,
+        compact_bytes: int = 1 << 20,
+        on_written: WrittenCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        fsync: bool = True,
+    ) -> None:
+        if merge_threshold < 1:
+            raise ValueError("merge_threshold must be >= 1")
+        if embed_batch_size < 1:
+            raise ValueError("embed_batch_size must be >= 1")
+        self._summarize = summarize
+        self._embed = embed
+        self._write = write
+        self._journal_path = os.fspath(journal_path)
+        self.merge_threshold = merge_threshold
+        self.merge_window_seconds = merge_window_seconds
+        self.embed_batch_size = embed_batch_size
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._max_status_entries = max_status_entries
+        self.compact_bytes = compact_bytes
+        self._on_written = on_written
+        self._clock = clock
+        self._fsync = fsync
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Guards the journal file; never acquired while holding ``_lock``.
+        self._journal_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._open: dict[str, _Group] = {}
+        self._ready: list[_Group] = []
+        # Groups taken by run_once and not yet committed or re-queued.
+        self._writing: dict[str, _Group] = {}
+        self._retry_at = 0.0
+        self._status: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._uncommitted = 0
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+        self._lock_file = _lock_journal(self._journal_path)
+        self._recover()
+        self._journal = open(self._journal_path, "a", encoding="utf-8")
+        self._journal_bytes = self._compacted_bytes = os.path.getsize(
+            self._journal_path
+        )
+
+    # -- Judge-facing API -------------------------------------------------
+
+    def submit(self, interaction: dict[str, Any]) -> str:
+        """
+        Journal and enqueue one interaction; returns its future ``memory_id``.
+
+        ``interaction`` follows the ``skill_evolve_persona`` input contract.
+        Interactions merged into the same memory share a ``memory_id``.
+        """
+        agent_id = interaction["agent_id"]
+        # Holding the journal lock across the state update keeps the submit
+        # record ahead of the group's commit record in the journal.
+        with self._journal_lock:
+            with self._lock:
+                now = self._clock()
+                group = self._open.get(agent_id)
+                if group is None:
+                    group = _Group(str(uuid.uuid4()), agent_id, now)
+                    self._open[agent_id] = group
+                group.interactions.append(interaction)
+                self._uncommitted += 1
+                self._remember(group.memory_id, {"written_to_weaviate": False})
+                if len(group.interactions) >= self.merge_threshold:
+                    self._ready.append(self._open.pop(agent_id))
+                    self._wakeup.notify()
+            self._append_journal(
+                [{"op": "submit", "memory_id": group.memory_id, "item": interaction}]
+            )
+        return group.memory_id
+
+    def status(self, memory_id: str) -> dict[str, Any] | None:
+        """Latest known state for ``memory_id`` (``written_to_weaviate`` etc.)."""
+        with self._lock:
+            entry = self._status.get(memory_id)
+            return dict(entry) if entry is not None else None
+
+    def pending(self) -> int:
+        """Interactions accepted but not yet written."""
+        with self._lock:
+            return self._uncommitted
+
+    # -- Background processing --------------------------------------------
+
+    def run_once(self, force: bool = False) -> int:
+        """
+        Summarise, embed and write every due group; returns memories written.
+
+        ``force`` treats every open group as due (used when draining).
+        """
+        with self._lock:
+            now = self._clock()
+            if not force and now < self._retry_at:
+                return 0
+            for agent_id, group in list(self._open.items()):
+                if force or now - group.opened_at >= self.merge_window_seconds:
+                    self._ready.append(self._open.pop(agent_id))
+            due, self._ready = self._ready, []
+            self._writing.update((group.memory_id, group) for group in due)
+        if not due:
+            return 0
+
+        written = 0
+        for start in range(0, len(due), self.embed_batch_size):
+            batch = due[start : start + self.embed_batch_size]
+            try:
+                self._process(batch)
+            except Exception as exc:
+                with self._lock:
+                    for group in batch:
+                        self._remember(
+                            group.memory_id,
+                            {"written_to_weaviate": False, "error": str(exc)},
+                        )
+                    for group in due[start:]:
+                        self._writing.pop(group.memory_id, None)
+                    self._ready[:0] = due[start:]
+                    self._retry_at = self._clock() + self.retry_backoff_seconds
+                break
+            written += len(batch)
+        return written
+
+    def start(self) -> None:
+        """Run :meth:`run_once` on a daemon thread until :meth:`stop`."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._loop, name="persona-evolution", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, drain: bool = True) -> None:
+        """Stop the worker; with ``drain`` flush every queued interaction."""
+        with self._lock:
+            self._stopping = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if drain:
+            self.run_once(force=True)
+        self._compact()
+
+    def close(self) -> None:
+        """Stop without draining and close the journal; pending work persists."""
+        self.stop(drain=False)
+        with self._journal_lock:
+            self._journal.close()
+        self._lock_file.close()
+
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                if not self._ready or self._clock() < self._retry_at:
+                    self._wakeup.wait(timeout=self._next_deadline())
+                if self._stopping:
+                    return
+            self.run_once()
+
+    def _next_deadline(self) -> float:
+        now = self._clock()
+        if now < self._retry_at:
+            return self._retry_at - now
+        deadlines = [
+            g.opened_at + self.merge_window_seconds for g in self._open.values()
+        ]
+        # Overdue groups are flushed at once rather than after another window.
+        return max(min(deadlines, default=now + self.merge_window_seconds) - now, 0.0)
+
+    def _process(self, batch: list[_Group]) -> None:
+        summaries = [self._summarize(g.agent_id, g.interactions) for g in batch]
+        vectors = self._embed(summaries)
+        timestamp = iso_now()
+        records = [
+            {
+                "memory_id": group.memory_id,
+                "agent_id": group.agent_id,
+                "content": summary,
+                "vector": vector,
+                "timestamp": timestamp,
+                "metadata": {
+                    "kind": "persona_evolution",
+                    "interaction_ids": [
+                        i.get("interaction_id") for i in group.interactions
+                    ],
+                    "engagement_score": max(
+                        i.get("engagement_metrics", {}).get("engagement_score", 0.0)
+                        for i in group.interactions
+                    ),
+                },
+            }
+            for group, summary, vector in zip(batch, summaries, vectors)
+        ]
+        self._write(records)
+
+        results = []
+        with self._lock:
+            for group, summary in zip(batch, summaries):
+                self._writing.pop(group.memory_id, None)
+                self._uncommitted -= len(group.interactions)
+                result = {
+                    "success": True,
+                    "memory_id": group.memory_id,
+                    "summary": summary,
+                    "written_to_weaviate": True,
+                    "timestamp": timestamp,
+                }
+                self._remember(group.memory_id, result)
+                results.append(result)
+        with self._journal_lock:
+            self._append_journal(
+                [{"op": "commit", "memory_id": group.memory_id} for group in batch]
+            )
+            grown = self._journal_bytes >= max(
+                self.compact_bytes, 2 * self._compacted_bytes
+            )
+        if grown:
+            self._compact()
+        if self._on_written is not None:
+            for result in results:
+                # The commit is durable; a failing callback must not requeue it.
+                try:
+                    self._on_written(result["memory_id"], result)
+                except Exception:
+                    logger.exception("on_written failed for %s", result["memory_id"])
+
+    # -- Journal ----------------------------------------------------------
+
+    def _append_journal(self, records: list[dict[str, Any]]) -> None:
+        # Caller holds ``_journal_lock``.
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        self._journal.write(data)
+        self._journal.flush()
+        self._journal_bytes += len(data.encode("utf-8"))
+        if self._fsync:
+            os.fsync(self._journal.fileno())
+
+    def _recover(self) -> None:
+        if not os.path.exists(self._journal_path):
+            return
+        groups: dict[str, _Group] = {}
+        with open(self._journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from a crash mid-append
+                memory_id = record["memory_id"]
+                if record["op"] == "commit":
+                    groups.pop(memory_id, None)
+                    continue
+                item = record["item"]
+                group = groups.get(memory_id)
+                if group is None:
+                    group = _Group(memory_id, item["agent_id"], self._clock())
+                    groups[memory_id] = group
+                group.interactions.append(item)
+        self._ready = list(groups.values())
+        self._uncommitted = sum(len(g.interactions) for g in self._ready)
+        for group in self._ready:
+            self._remember(group.memory_id, {"written_to_weaviate": False})
+        self._rewrite_journal(self._ready)
+
+    def _compact(self) -> None:
+        """Rewrite the journal keeping only interactions not yet committed."""
+        with self._compact_lock:
+            with self._journal_lock:
+                with self._lock:
+                    live = [
+                        _Group(
+                            g.memory_id, g.agent_id, g.opened_at, list(g.interactions)
+                        )
+                        for g in (
+                            *self._writing.values(),
+                            *self._ready,
+                            *self._open.values(),
+                        )
+                    ]
+                offset = self._journal_bytes
+            # The bulk of the rewrite happens without blocking submit().
+            tmp_path = self._rewrite_journal(live, replace=False)
+            with self._journal_lock:
+                with open(self._journal_path, "rb") as journal:
+                    journal.seek(offset)
+                    tail = journal.read()
+                with open(tmp_path, "ab") as tmp:
+                    tmp.write(tail)
+                    tmp.flush()
+                    if self._fsync:
+                        os.fsync(tmp.fileno())
+                self._journal.close()
+                os.replace(tmp_path, self._journal_path)
+                self._journal = open(self._journal_path, "a", encoding="utf-8")
+                self._journal_bytes = self._compacted_bytes = os.path.getsize(
+                    self._journal_path
+                )
+
+    def _rewrite_journal(self, groups: list[_Group], *, replace: bool = True) -> str:
+        tmp_path = f"{self._journal_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            for group in groups:
+                for item in group.interactions:
+                    record = {"op": "submit", "memory_id": group.memory_id}
+                    record["item"] = item
+                    tmp.write(json.dumps(record, separators=(",", ":")) + "\n")
+            tmp.flush()
+            if self._fsync:
+                os.fsync(tmp.fileno())
+        if replace:
+            os.replace(tmp_path, self._journal_path)
+        return tmp_path
+
+    def _remember(self, memory_id: str, state: dict[str, Any]) -> None:
+        self._status[memory_id] = state
+        self._status.move_to_end(memory_id)
+        while len(self._status) > self._max_status_entries:
+            self._status.popitem(last=False)
+
+
+def _lock_journal(journal_path: str) -> Any:
+    lock_file = open(journal_path + ".lock", "a", encoding="utf-8")
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            lock_file.close()
+            raise JournalInUseError(
+                f"{journal_path} is in use by another pipeline"
+            ) from exc
+    return lock_file
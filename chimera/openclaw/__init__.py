@@ -0,0 +1,11 @@
+"""
+OpenClaw integration (specs/openclaw_integration.md).
+"""
+
+from chimera.openclaw.status_publisher import (
+    PublisherConfig,
+    PublisherStats,
+    StatusPublisher,
+)
+
+__all__ = ["PublisherConfig", "PublisherStats", "StatusPublisher"]
@@ -0,0 +1,287 @@
+"""
+Fleet simulation for OpenClaw status publishing.
+
+Compares the naive per-agent publisher (one full ``openclaw_update_status``
+call per state change and per fixed heartbeat) against
+:class:`~chimera.openclaw.status_publisher.StatusPublisher` on the same
+synthetic event stream, and reports bytes and messages per minute.
+
+Also provides :class:`MockOpenClawRegistry`, the local stand-in for the
+OpenClaw MCP server described in specs/openclaw_integration.md § 10 (P2).
+
+Run: ``python -m chimera.openclaw.simulation --agents 1000 --minutes 10``
+"""
+
+import argparse
+import json
+import random
+import uuid
+from collections import Counter
+from typing import Any
+
+from chimera.openclaw.status_publisher import (
+    BATCH_TOOL,
+    PublisherConfig,
+    StatusPublisher,
+    encoded_size,
+    flatten,
+    unflatten,
+)
+
+OPERATIONAL_STATES = ("planning", "working", "judging", "sleeping")
+
+
+class MockOpenClawRegistry:
+    """
+    In-memory OpenClaw registry reachable through an MCP-style callable.
+
+    Supports ``openclaw_update_status`` (full payload, used by the naive
+    baseline) and ``openclaw_update_status_batch`` (delta batches). Deltas
+    whose ``base_version`` does not match the stored version are rejected
+    per agent and reported back in ``resync``.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.versions: dict[str, int] = {}
+        self.heartbeats: dict[str, str] = {}
+        self.calls: Counter[str] = Counter()
+
+    def __call__(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        self.calls[tool_name] += 1
+        if tool_name == "openclaw_update_status":
+            agent_id = arguments["agent_id"]
+            self.entries[agent_id] = arguments["document"]
+            self.heartbeats[agent_id] = arguments["sent_at"]
+            return {"success": True}
+        if tool_name == BATCH_TOOL:
+            return self._apply_batch(arguments)
+        return {"success": False, "error": f"unknown tool: {tool_name}"}
+
+    def document(self, agent_id: str) -> dict[str, Any]:
+        """Registry view of one agent, including ``last_heartbeat_at``."""
+        document = json.loads(json.dumps(self.entries[agent_id]))
+        document.setdefault("status", {})["last_heartbeat_at"] = self.heartbeats[
+            agent_id
+        ]
+        return document
+
+    def _apply_batch(self, message: dict[str, Any]) -> dict[str, Any]:
+        resync = []
+        for update in message["updates"]:
+            agent_id = update["agent_id"]
+            if "full" in update:
+                self.entries[agent_id] = update["full"]
+            elif "set" in update:
+                if self.versions.get(agent_id) != update["base_version"]:
+                    resync.append(agent_id)
+                    continue
+                flat = flatten(self.entries[agent_id])
+                flat.update(update["set"])
+                for path in update["unset"]:
+                    flat.pop(path, None)
+                self.entries[agent_id] = unflatten(flat)
+            elif self.versions.get(agent_id) != update["version"]:
+                resync.append(agent_id)
+                continue
+            self.versions[agent_id] = update["version"]
+            self.heartbeats[agent_id] = message["sent_at"]
+        return {"success": True, "resync": resync}
+
+
+def make_document(agent_id: str, rng: random.Random) -> dict[str, Any]:
+    """Registration-shaped status document (openclaw_integration.md § 3)."""
+    return {
+        "agent_id": agent_id,
+        "capabilities": {
+            "content_types": ["image", "video", "text"],
+            "languages": ["en", "am"],
+            "payment_tokens": ["USDC"],
+            "services_offered": ["influencer_collab", "brand_campaign"],
+        },
+        "availability": {
+            "open_for_collaboration": True,
+            "max_concurrent_collabs": 3,
+            "reason": None,
+        },
+        "status": {
+            "operational_state": "sleeping",
+            "queue_depth": rng.randint(0, 5),
+            "wallet_balance_usdc": f"{rng.uniform(10, 500):.2f}",
+        },
+    }
+
+
+def _events(
+    agent_ids: list[str],
+    seconds: int,
+    changes_per_agent_minute: float,
+    flap_probability: float,
+    rng: random.Random,
+) -> list[list[tuple[str, dict[str, Any]]]]:
+    """Per-second lists of ``(agent_id, changes)``."""
+    timeline: list[list[tuple[str, dict[str, Any]]]] = [[] for _ in range(seconds)]
+    p_change = changes_per_agent_minute / 60.0
+    for second in range(seconds):
+        for agent_id in agent_ids:
+            if rng.random() >= p_change:
+                continue
+            if rng.random() < flap_probability and second + 1 < seconds:
+                # planning -> working -> judging inside ~1 second.
+                for state in ("planning", "working"):
+                    timeline[second].append(
+                        (agent_id, {"status": {"operational_state": state}})
+                    )
+                timeline[second + 1].append(
+                    (agent_id, {"status": {"operational_state": "judging"}})
+                )
+            else:
+                change: dict[str, Any] = {
+                    "status": {"operational_state": rng.choice(OPERATIONAL_STATES)}
+                }
+                if rng.random() < 0.5:
+                    change["status"]["queue_depth"] = rng.randint(0, 10)
+                timeline[second].append((agent_id, change))
+    return timeline
+
+
+def simulate_fleet(
+    agents: int = 1000,
+    minutes: float = 10.0,
+    *,
+    changes_per_agent_minute: float = 1.0,
+    flap_probability: float = 0.3,
+    config: PublisherConfig | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Drive both publishers with the same synthetic fleet and compare traffic.
+
+    Returns ``{"baseline": {...}, "batched": {...}, "registry_consistent":
+    bool}``; each side reports ``messages_per_minute``, ``bytes_per_minute``
+    and ``peak_messages_per_second`` (a burstiness measure).
+    """
+    config = config or PublisherConfig()
+    rng = random.Random(seed)
+    seconds = int(minutes * 60)
+    agent_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(agents)]
+    documents = {agent_id: make_document(agent_id, rng) for agent_id in agent_ids}
+    timeline = _events(
+        agent_ids, seconds, changes_per_agent_minute, flap_probability, rng
+    )
+    epoch = 1_770_292_800.0  # 2026-02-05T12:00:00Z
+    clock = {"now": 0.0}
+
+    baseline = _run_baseline(documents, timeline, config, epoch)
+
+    registry = MockOpenClawRegistry()
+    publisher = StatusPublisher(
+        registry,
+        config,
+        clock=lambda: clock["now"],
+        wall_clock=lambda: epoch + clock["now"],
+        rng=random.Random(seed + 1),
+    )
+    per_second: list[int] = []
+    for agent_id, document in documents.items():
+        publisher.register(agent_id, document, now=0.0)
+    for second, events in enumerate(timeline):
+        clock["now"] = float(second)
+        for agent_id, changes in events:
+            publisher.update(agent_id, changes)
+        per_second.append(publisher.flush())
+    # Let pending debounces settle so the registry can be checked.
+    settle = int(config.max_debounce_seconds) + 1
+    for second in range(seconds, seconds + settle):
+        publisher.flush(now=float(second))
+
+    expected = _final_documents(documents, timeline)
+    consistent = all(
+        flatten(registry.entries[agent_id]) == expected[agent_id]
+        for agent_id in agent_ids
+    )
+    stats = publisher.stats
+    return {
+        "agents": agents,
+        "minutes": minutes,
+        "baseline": baseline,
+        "batched": {
+            "messages_per_minute": stats.messages_sent / minutes,
+            "bytes_per_minute": stats.bytes_sent / minutes,
+            "peak_messages_per_second": max(per_second, default=0),
+            "full_updates": stats.full_updates,
+            "delta_updates": stats.delta_updates,
+            "heartbeats": stats.heartbeats,
+            "debounced_changes": stats.debounced_changes,
+        },
+        "registry_consistent": consistent,
+    }
+
+
+def _run_baseline(
+    documents: dict[str, dict[str, Any]],
+    timeline: list[list[tuple[str, dict[str, Any]]]],
+    config: PublisherConfig,
+    epoch: float,
+) -> dict[str, Any]:
+    """Naive publisher: full payload on every change and fixed heartbeat."""
+    current = {agent_id: flatten(doc) for agent_id, doc in documents.items()}
+    interval = int(config.heartbeat_interval_seconds)
+    messages = 0
+    total_bytes = 0
+    per_second: list[int] = []
+    for second, events in enumerate(timeline):
+        sent = 0
+        due = set(current) if second % interval == 0 else set()
+        for agent_id, changes in events:
+            current[agent_id].update(flatten(changes))
+            due.add(agent_id)
+        for agent_id in due:
+            message = {
+                "agent_id": agent_id,
+                "sent_at": epoch + second,
+                "document": unflatten(current[agent_id]),
+            }
+            total_bytes += encoded_size(message)
+            sent += 1
+        messages += sent
+        per_second.append(sent)
+    minutes = len(timeline) / 60.0
+    return {
+        "messages_per_minute": messages / minutes,
+        "bytes_per_minute": total_bytes / minutes,
+        "peak_messages_per_second": max(per_second, default=0),
+    }
+
+
+def _final_documents(
+    documents: dict[str, dict[str, Any]],
+    timeline: list[list[tuple[str, dict[str, Any]]]],
+) -> dict[str, dict[str, Any]]:
+    final = {agent_id: flatten(doc) for agent_id, doc in documents.items()}
+    for events in timeline:
+        for agent_id, changes in events:
+            final[agent_id].update(flatten(changes))
+    return final
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--changes-per-agent-minute", type=float, default=1.0)
+    parser.add_argument("--flap-probability", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    report = simulate_fleet(
+        args.agents,
+        args.minutes,
+        changes_per_agent_minute=args.changes_per_agent_minute,
+        flap_probability=args.flap_probability,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Registry Publisher: batched, delta-encoded OpenClaw status heartbeats.
+
+Implements the publishing side of specs/openclaw_integration.md § 4.2-4.3 for
+large fleets. Instead of one full Status payload per agent per heartbeat, the
+publisher:
+
+- coalesces many agents' updates into one ``openclaw_update_status_batch``
+  call (up to ``max_batch_size`` entries per message);
+- sends only the fields that changed since the last version the registry
+  acknowledged (§ 5 "incremental status");
+- jitters each agent's heartbeat inside the configured window so a fleet
+  started at the same instant does not heartbeat in lock-step;
+- debounces rapid ``operational_state`` flaps (planning -> working ->
+  judging) so only the settled state is published.
+
+Batch message (tool arguments)::
+
+    {
+      "schema": "openclaw_status_delta_v1",
+      "sent_at": "2026-02-05T12:00:00.000Z",
+      "updates": [
+        {"agent_id": "...", "version": 1, "full": {...}},
+        {"agent_id": "...", "version": 8, "base_version": 7,
+         "set": {"status.queue_depth": 3}, "unset": []},
+        {"agent_id": "...", "version": 8}
+      ]
+    }
+
+``full`` entries carry the whole document (first publish or after a resync),
+delta entries carry dotted field paths relative to ``base_version``, and
+entries with only a ``version`` are pure heartbeats. The registry sets
+``status.last_heartbeat_at`` to ``sent_at`` for every agent in the batch.
+
+The transport is any callable ``(tool_name, arguments) -> result`` wrapping
+the OpenClaw MCP server (Constitution Principle II: MCP-only access). A
+successful result is ``{"success": true}`` optionally with ``"resync": [ids]``
+listing agents whose base version the registry no longer holds.
+"""
+
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from chimera._time import iso_from_epoch
+
+BATCH_TOOL = "openclaw_update_status_batch"
+PAYLOAD_SCHEMA = "openclaw_status_delta_v1"
+
+# Managed by the publisher/registry from ``sent_at``; never diffed.
+HEARTBEAT_FIELD = "status.last_heartbeat_at"
+
+Transport = Callable[[str, dict[str, Any]], dict[str, Any]]
+
+
+@dataclass
+class PublisherConfig:
+    """Tuning knobs for :class:`StatusPublisher`."""
+
+    heartbeat_interval_seconds: float = 120.0
+    heartbeat_jitter: float = 0.25
+    debounce_seconds: float = 2.0
+    max_debounce_seconds: float = 10.0
+    max_batch_size: int = 500
+
+    def __post_init__(self) -> None:
+        if self.heartbeat_interval_seconds <= 0:
+            raise ValueError("heartbeat_interval_seconds must be positive")
+        if not 0.0 <= self.heartbeat_jitter < 1.0:
+            raise ValueError("heartbeat_jitter must be in [0.0, 1.0)")
+        if self.max_debounce_seconds < self.debounce_seconds:
+            raise ValueError("max_debounce_seconds must be >= debounce_seconds")
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+
+@dataclass
+class PublisherStats:
+    """Counters for outbound traffic; ``bytes_sent`` is compact JSON size."""
+
+    messages_sent: int = 0
+    bytes_sent: int = 0
+    full_updates: int = 0
+    delta_updates: int = 0
+    heartbeats: int = 0
+    debounced_changes: int = 0
+    failed_messages: int = 0
+
+
+@dataclass
+class _AgentEntry:
+    desired: dict[str, Any]
+    acked: dict[str, Any] | None = None
+    acked_version: int = 0
+    first_change_at: float | None = None
+    last_change_at: float | None = None
+    next_heartbeat_at: float = 0.0
+    pending: bool = False
+
+
+def flatten(document: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested dicts into dotted paths; lists and scalars are leaves."""
+    flat: dict[str, Any] = {}
+    for key, value in document.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten(flat: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of :func:`flatten`."""
+    document: dict[str, Any] = {}
+    for path, value in flat.items():
+        node = document
+        *parents, leaf = path.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return document
+
+
+def diff(base: dict[str, Any], target: dict[str, Any]) -> tuple[dict, list[str]]:
+    """Return ``(set, unset)`` turning flat ``base`` into flat ``target``."""
+    changed = {k: v for k, v in target.items() if k not in base or base[k] != v}
+    removed = sorted(k for k in base if k not in target)
+    return changed, removed
+
+
+def encoded_size(message: dict[str, Any]) -> int:
+    """Size in bytes of ``message`` as compact UTF-8 JSON."""
+    return len(json.dumps(message, separators=(",", ":")).encode("utf-8"))
+
+
+class StatusPublisher:
+    """
+    Coalesces per-agent status changes into batched delta messages.
+
+    Call :meth:`register` once per agent, :meth:`update` on every state
+    change, and :meth:`flush` on a short tick (e.g. every second). Pass
+    ``now`` explicitly to drive the publisher from a simulated clock.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        config: PublisherConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._transport = transport
+        self.config = config or PublisherConfig()
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._rng = rng or random.Random()
+        self._agents: dict[str, _AgentEntry] = {}
+        self.stats = PublisherStats()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def register(
+        self, agent_id: str, document: dict[str, Any], now: float | None = None
+    ) -> None:
+        """Start publishing ``agent_id`` with a full registry document."""
+        now = self._clock() if now is None else now
+        # The full publish goes out on the next flush; its ack schedules the
+        # first jittered heartbeat.
+        entry = _AgentEntry(desired=self._normalise(document), pending=True)
+        entry.first_change_at = entry.last_change_at = now
+        self._agents[agent_id] = entry
+
+    def update(
+        self, agent_id: str, changes: dict[str, Any], now: float | None = None
+    ) -> None:
+        """
+        Merge ``changes`` (nested, partial) into the agent's desired document.
+
+        A field set to ``None`` is kept (the spec uses ``null`` for e.g.
+        ``availability.reason``); use :meth:`register` to drop fields.
+        """
+        entry = self._agents.get(agent_id)
+        if entry is None:
+            raise KeyError(f"agent {agent_id!r} is not registered")
+        now = self._clock() if now is None else now
+        merged = dict(entry.desired)
+        merged.update(self._normalise(changes))
+        if merged == entry.desired:
+            return
+        entry.desired = merged
+        if entry.pending:
+            self.stats.debounced_changes += 1
+        else:
+            entry.pending = True
+            entry.first_change_at = now
+        entry.last_change_at = now
+
+    def deregister(self, agent_id: str) -> None:
+        """Stop publishing ``agent_id`` (the caller sends openclaw_deregister)."""
+        self._agents.pop(agent_id, None)
+
+    def flush(self, now: float | None = None) -> int:
+        """
+        Send every due update; returns the number of messages sent.
+
+        An agent is due when its pending change has been quiet for
+        ``debounce_seconds`` (or pending for ``max_debounce_seconds``), when
+        the registry holds no acknowledged version of it yet, or when its
+        jittered heartbeat deadline has passed.
+        """
+        now = self._clock() if now is None else now
+        cfg = self.config
+        updates: list[dict[str, Any]] = []
+        sent: list[tuple[str, _AgentEntry, dict[str, Any], int]] = []
+
+        for agent_id, entry in self._agents.items():
+            settled = entry.pending and (
+                entry.acked is None
+                or now - entry.last_change_at >= cfg.debounce_seconds
+                or now - entry.first_change_at >= cfg.max_debounce_seconds
+            )
+            update = self._content_update(agent_id, entry) if settled else None
+            if update is not None:
+                snapshot = dict(entry.desired)
+            elif now >= entry.next_heartbeat_at and entry.acked is not None:
+                # Heartbeats re-confirm the acknowledged state, so pending
+                # (still debouncing) edits are not marked as delivered.
+                update = {"agent_id": agent_id, "version": entry.acked_version}
+                snapshot = entry.acked
+            else:
+                if settled:
+                    # Flapped back to the acknowledged state.
+                    entry.pending = False
+                continue
+            if settled and snapshot is entry.acked:
+                entry.pending = False
+            updates.append(update)
+            sent.append((agent_id, entry, snapshot, update["version"]))
+
+        messages = 0
+        for start in range(0, len(updates), cfg.max_batch_size):
+            end = start + cfg.max_batch_size
+            if self._send(updates[start:end], sent[start:end], now):
+                messages += 1
+        return messages
+
+    def _content_update(
+        self, agent_id: str, entry: _AgentEntry
+    ) -> dict[str, Any] | None:
+        version = entry.acked_version + 1
+        if entry.acked is None:
+            return {
+                "agent_id": agent_id,
+                "version": version,
+                "full": unflatten(entry.desired),
+            }
+        changed, removed = diff(entry.acked, entry.desired)
+        if not changed and not removed:
+            return None
+        return {
+            "agent_id": agent_id,
+            "version": version,
+            "base_version": entry.acked_version,
+            "set": changed,
+            "unset": removed,
+        }
+
+    def _send(
+        self,
+        updates: list[dict[str, Any]],
+        sent: list[tuple[str, _AgentEntry, dict[str, Any], int]],
+        now: float,
+    ) -> bool:
+        message = {
+            "schema": PAYLOAD_SCHEMA,
+            "sent_at": iso_from_epoch(self._wall_clock()),
+            "updates": updates,
+        }
+        self.stats.messages_sent += 1
+        self.stats.bytes_sent += encoded_size(message)
+        try:
+            result = self._transport(BATCH_TOOL, message)
+        except Exception:
+            result = {"success": False}
+        if not result.get("success"):
+            # Entries stay pending and are re-diffed against the last ack.
+            self.stats.failed_messages += 1
+            return False
+
+        resync = set(result.get("resync", ()))
+        cfg = self.config
+        for (agent_id, entry, snapshot, version), update in zip(sent, updates):
+            if "full" in update:
+                self.stats.full_updates += 1
+            elif "set" in update:
+                self.stats.delta_updates += 1
+            else:
+                self.stats.heartbeats += 1
+            if self._agents.get(agent_id) is not entry:
+                continue  # deregistered while in flight
+            if agent_id in resync:
+                entry.acked, entry.acked_version = None, 0
+                entry.pending = True
+                entry.first_change_at = entry.last_change_at = now
+                continue
+            entry.acked, entry.acked_version = snapshot, version
+            if entry.desired == snapshot:
+                entry.pending = False
+            jitter = self._rng.uniform(-cfg.heartbeat_jitter, cfg.heartbeat_jitter)
+            entry.next_heartbeat_at = now + cfg.heartbeat_interval_seconds * (
+                1.0 + jitter
+            )
+        return True
+
+    @staticmethod
+    def _normalise(document: dict[str, Any]) -> dict[str, Any]:
+        flat = flatten(document)
+        flat.pop(HEARTBEAT_FIELD, None)
+        return flat
@@ -0,0 +1,25 @@
+"""
+Orchestrator sharding: agents partitioned by tenant across shards (NFR 3.0).
+"""
+
+from chimera.orchestration.coordinator import (
+    Assignment,
+    Rebalance,
+    ShardCoordinator,
+    UnknownShardError,
+)
+from chimera.orchestration.ring import HashRing, ring_hash, routing_key
+from chimera.orchestration.shard import NotOwnerError, Shard, ShardRouter
+
+__all__ = [
+    "Assignment",
+    "HashRing",
+    "NotOwnerError",
+    "Rebalance",
+    "Shard",
+    "ShardCoordinator",
+    "ShardRouter",
+    "UnknownShardError",
+    "ring_hash",
+    "routing_key",
+]
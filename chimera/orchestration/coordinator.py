@@ -0,0 +1,210 @@
+"""
+Shard membership and live rebalancing for orchestrator shards (NFR 3.0).
+
+:class:`ShardCoordinator` is the single source of truth for which shards
+exist. Shards :meth:`~ShardCoordinator.join`, renew a lease with
+:meth:`~ShardCoordinator.heartbeat` and :meth:`~ShardCoordinator.leave`;
+shards whose lease lapses are dropped by :meth:`~ShardCoordinator.expire`.
+Every membership change publishes a new :class:`Assignment` (a numbered
+epoch of the hash ring) and a :class:`Rebalance` listing exactly which
+known agents changed owner, so shards hand off only those agents' queued
+tasks and cached state.
+
+The coordinator runs in-process (tests, single-node deployments, the shard
+benchmark); a multi-node deployment would back the same interface with a
+lease store such as Redis.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from chimera.orchestration.ring import DEFAULT_VNODES, HashRing, routing_key
+
+
+class UnknownShardError(LookupError):
+    """Raised for a shard that is not (or no longer) a ring member."""
+
+
+@dataclass(frozen=True)
+class Assignment:
+    """One epoch of agent-to-shard placement."""
+
+    epoch: int
+    ring: HashRing
+    split_tenants: frozenset[str] = frozenset()
+
+    @property
+    def shards(self) -> tuple[str, ...]:
+        return self.ring.shards
+
+    def key(self, tenant_id: str, agent_id: str) -> str:
+        return routing_key(tenant_id, agent_id, self.split_tenants)
+
+    def owner(self, tenant_id: str, agent_id: str) -> str:
+        """Shard that owns ``agent_id`` in this epoch."""
+        return self.ring.shard_for(self.key(tenant_id, agent_id))
+
+
+@dataclass(frozen=True)
+class Rebalance:
+    """Placement change between two epochs, limited to known agents."""
+
+    previous: Assignment
+    current: Assignment
+    # agent_id -> (old owner or None, new owner or None)
+    moved: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    agents: int = 0
+
+    @property
+    def moved_fraction(self) -> float:
+        return len(self.moved) / self.agents if self.agents else 0.0
+
+
+class ShardCoordinator:
+    """
+    In-process membership, leases and agent directory for a shard ring.
+
+    ``register_agent`` mirrors the ``agents`` table (``agent_id`` ->
+    ``tenant_id``) so rebalances can be computed per agent. Subscribers are
+    called synchronously, in subscription order, after every epoch change.
+    """
+
+    def __init__(
+        self,
+        *,
+        vnodes: int = DEFAULT_VNODES,
+        lease_seconds: float = 30.0,
+        split_tenants: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._leases: dict[str, float] = {}
+        self._tenants: dict[str, str] = {}
+        self._subscribers: list[Callable[[Rebalance], None]] = []
+        self.assignment = Assignment(
+            0, HashRing(vnodes=vnodes), frozenset(split_tenants)
+        )
+
+    # -- agent directory -------------------------------------------------
+
+    def register_agent(self, agent_id: str, tenant_id: str) -> None:
+        with self._lock:
+            self._tenants[agent_id] = tenant_id
+
+    def tenant_of(self, agent_id: str) -> str:
+        """``tenant_id`` of a registered agent; KeyError if unknown."""
+        return self._tenants[agent_id]
+
+    def owner_of(self, agent_id: str) -> str:
+        """Current owner shard of a registered agent."""
+        return self.assignment.owner(self._tenants[agent_id], agent_id)
+
+    def agents(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._tenants)
+
+    # -- membership ------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[Rebalance], None]) -> Callable[[], None]:
+        """
+        Call ``callback`` on every rebalance; returns an unsubscribe function.
+
+        Unsubscribing is thread-safe and idempotent.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def join(self, shard_id: str) -> Assignment:
+        """Add ``shard_id`` (or renew its lease) and return the assignment."""
+        with self._lock:
+            self._leases[shard_id] = self._clock() + self.lease_seconds
+            if shard_id in self.assignment.ring:
+                return self.assignment
+            return self._publish(self.assignment.ring.with_shard(shard_id))
+
+    def heartbeat(self, shard_id: str) -> Assignment:
+        """Renew a member's lease; UnknownShardError if it was dropped."""
+        with self._lock:
+            if shard_id not in self._leases:
+                raise UnknownShardError(f"{shard_id} is not a member; join again")
+            self._leases[shard_id] = self._clock() + self.lease_seconds
+            return self.assignment
+
+    def leave(self, shard_id: str) -> Assignment:
+        with self._lock:
+            if self._leases.pop(shard_id, None) is None:
+                raise UnknownShardError(f"{shard_id} is not a member")
+            return self._publish(self.assignment.ring.without_shard(shard_id))
+
+    def expire(self) -> list[str]:
+        """Drop every shard whose lease has lapsed; returns their ids."""
+        with self._lock:
+            now = self._clock()
+            expired = sorted(s for s, until in self._leases.items() if until <= now)
+            if expired:
+                ring = self.assignment.ring
+                for shard_id in expired:
+                    del self._leases[shard_id]
+                    ring = ring.without_shard(shard_id)
+                self._publish(ring)
+            return expired
+
+    def split_tenant(self, tenant_id: str) -> Assignment:
+        """Route ``tenant_id`` per agent from now on (a tenant outgrew a shard)."""
+        with self._lock:
+            current = self.assignment
+            if tenant_id in current.split_tenants:
+                return current
+            return self._publish(current.ring, current.split_tenants | {tenant_id})
+
+    def _publish(
+        self, ring: HashRing, split_tenants: frozenset[str] | None = None
+    ) -> Assignment:
+        previous = self.assignment
+        current = Assignment(
+            previous.epoch + 1,
+            ring,
+            previous.split_tenants if split_tenants is None else split_tenants,
+        )
+        self.assignment = current
+        rebalance = Rebalance(
+            previous,
+            current,
+            plan_moves(previous, current, self._tenants),
+            agents=len(self._tenants),
+        )
+        for callback in list(self._subscribers):
+            callback(rebalance)
+        return current
+
+
+def plan_moves(
+    previous: Assignment, current: Assignment, tenants: dict[str, str]
+) -> dict[str, tuple[str | None, str | None]]:
+    """Agents (``agent_id`` -> ``tenant_id``) whose owner differs between epochs."""
+    # Unsplit tenants share one key, so look each key pair up once.
+    owners: dict[tuple[str, str], tuple[str | None, str | None]] = {}
+    moved = {}
+    for agent_id, tenant_id in tenants.items():
+        keys = (previous.key(tenant_id, agent_id), current.key(tenant_id, agent_id))
+        pair = owners.get(keys)
+        if pair is None:
+            pair = owners[keys] = (_owner(previous, keys[0]), _owner(current, keys[1]))
+        if pair[0] != pair[1]:
+            moved[agent_id] = pair
+    return moved
+
+
+def _owner(assignment: Assignment, key: str) -> str | None:
+    return assignment.ring.shard_for(key) if len(assignment.ring) else None
@@ -0,0 +1,83 @@
+"""
+Consistent hash ring placing agents on orchestrator shards (NFR 3.0).
+
+Each shard owns ``vnodes`` points on a 64-bit ring (BLAKE2b of
+``"<shard>#<i>"``); a routing key belongs to the first point at or after its
+own hash. Adding or removing one of ``n`` shards therefore moves only about
+``1/n`` of the keys, where modulo placement would move nearly all of them.
+
+Routing keys come from the ``agents`` table (specs/technical.md § 2):
+by default all agents of a tenant share one key, so a tenant's memories,
+budgets and campaigns stay in one shard's caches. Tenants too large for one
+shard are listed in ``split_tenants`` and routed per agent instead.
+"""
+
+import bisect
+import hashlib
+from collections import Counter
+from typing import Iterable
+
+DEFAULT_VNODES = 128
+
+
+def ring_hash(key: str) -> int:
+    """Stable 64-bit position of ``key`` (identical across processes)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest())
+
+
+def routing_key(
+    tenant_id: str, agent_id: str, split_tenants: frozenset[str] = frozenset()
+) -> str:
+    """Ring key for an agent: its tenant, or ``tenant/agent`` for split tenants."""
+    if tenant_id in split_tenants:
+        return f"{tenant_id}/{agent_id}"
+    return tenant_id
+
+
+class HashRing:
+    """
+    Immutable consistent hash ring.
+
+    :meth:`with_shard` and :meth:`without_shard` return new rings, so readers
+    holding a ring never see a membership change half applied.
+    """
+
+    def __init__(self, shards: Iterable[str] = (), *, vnodes: int = DEFAULT_VNODES):
+        if vnodes < 1:
+            raise ValueError("vnodes must be >= 1")
+        self.vnodes = vnodes
+        self.shards = tuple(sorted(set(shards)))
+        points = sorted(
+            (ring_hash(f"{shard}#{index}"), shard)
+            for shard in self.shards
+            for index in range(vnodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+    def __contains__(self, shard_id: object) -> bool:
+        return shard_id in self.shards
+
+    def shard_for(self, key: str) -> str:
+        """Shard owning ``key``; raises LookupError on an empty ring."""
+        if not self._points:
+            raise LookupError("hash ring has no shards")
+        index = bisect.bisect_left(self._points, ring_hash(key))
+        return self._owners[index % len(self._owners)]
+
+    def with_shard(self, shard_id: str) -> "HashRing":
+        return HashRing((*self.shards, shard_id), vnodes=self.vnodes)
+
+    def without_shard(self, shard_id: str) -> "HashRing":
+        return HashRing(
+            (shard for shard in self.shards if shard != shard_id), vnodes=self.vnodes
+        )
+
+    def load(self, keys: Iterable[str]) -> Counter[str]:
+        """How many of ``keys`` each shard owns (shards owning none included)."""
+        counts = Counter({shard: 0 for shard in self.shards})
+        counts.update(self.shard_for(key) for key in keys)
+        return counts
@@ -0,0 +1,277 @@
+"""
+Orchestrator shards: per-shard task queues and agent caches (NFR 3.0).
+
+A :class:`Shard` accepts Agent Tasks (specs/technical.md § 1.1) only for
+agents it owns in its current :class:`Assignment`, queues them by
+``priority`` and keeps an LRU cache of per-agent context (persona, memories,
+budget) so consecutive tasks for an agent skip the reload.
+
+:class:`ShardRouter` hosts shards in one process and keeps them consistent
+with a :class:`ShardCoordinator`: on every rebalance all shards first adopt
+the new epoch, then each releases the queued tasks and cached agents it no
+longer owns, and the released tasks are re-routed to their new owners in
+their original order.
+"""
+
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from chimera._task import PRIORITY_RANK
+from chimera.orchestration.coordinator import (
+    Assignment,
+    Rebalance,
+    ShardCoordinator,
+    UnknownShardError,
+)
+
+# (agent_id, tenant_id, task)
+QueuedTask = tuple[str, str, dict[str, Any]]
+
+
+class NotOwnerError(LookupError):
+    """Raised when a task is submitted to a shard that does not own its agent."""
+
+    def __init__(self, shard_id: str, agent_id: str, owner: str, epoch: int):
+        super().__init__(
+            f"{shard_id} does not own agent {agent_id} (owner {owner}, epoch {epoch})"
+        )
+        self.shard_id = shard_id
+        self.agent_id = agent_id
+        self.owner = owner
+        self.epoch = epoch
+
+
+def _empty_context(agent_id: str) -> dict[str, Any]:
+    return {}
+
+
+class Shard:
+    """
+    One orchestrator shard's queue and cache.
+
+    ``loader`` fetches an agent's context on a cache miss; at most
+    ``cache_size`` agents are cached. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        shard_id: str,
+        *,
+        cache_size: int = 1024,
+        loader: Callable[[str], Any] = _empty_context,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("cache_size must be >= 1")
+        self.shard_id = shard_id
+        self.cache_size = cache_size
+        self.assignment: Assignment | None = None
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._queue: list[tuple[int, int, str, str, dict[str, Any]]] = []
+        self._order = itertools.count()
+        self._cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.released_tasks = 0
+        self.released_agents = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def assign(self, assignment: Assignment) -> None:
+        """Adopt ``assignment`` unless an equal or newer epoch is already held."""
+        with self._lock:
+            if self.assignment is None or assignment.epoch > self.assignment.epoch:
+                self.assignment = assignment
+
+    def owns(self, tenant_id: str, agent_id: str) -> bool:
+        assignment = self.assignment
+        return (
+            assignment is not None
+            and self.shard_id in assignment.ring
+            and assignment.owner(tenant_id, agent_id) == self.shard_id
+        )
+
+    def submit(self, agent_id: str, task: dict[str, Any], *, tenant_id: str) -> None:
+        """Queue ``task`` for ``agent_id``; NotOwnerError if the agent is elsewhere."""
+        with self._lock:
+            self._check_owner(tenant_id, agent_id)
+            self._push(agent_id, tenant_id, task, next(self._order))
+
+    def submit_many(self, items: list[QueuedTask]) -> None:
+        """Queue a batch; all-or-nothing if any agent is owned elsewhere."""
+        with self._lock:
+            for agent_id, tenant_id, _ in items:
+                self._check_owner(tenant_id, agent_id)
+            for agent_id, tenant_id, task in items:
+                self._push(agent_id, tenant_id, task, next(self._order))
+
+    def pop(self) -> QueuedTask | None:
+        """Highest-priority, oldest queued task, or None if the queue is empty."""
+        with self._lock:
+            if not self._queue:
+                return None
+            _, _, agent_id, tenant_id, task = heapq.heappop(self._queue)
+            return agent_id, tenant_id, task
+
+    def context(self, agent_id: str, tenant_id: str) -> Any:
+        """Cached context of an owned agent, loading it on a miss."""
+        with self._lock:
+            entry = self._cache.get(agent_id)
+            if entry is not None:
+                self._cache.move_to_end(agent_id)
+                self.cache_hits += 1
+                return entry[1]
+            self.cache_misses += 1
+        value = self._loader(agent_id)
+        with self._lock:
+            if self.owns(tenant_id, agent_id):
+                self._cache[agent_id] = (tenant_id, value)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    def release(self) -> list[QueuedTask]:
+        """Remove queued tasks and cached agents this shard no longer owns."""
+        with self._lock:
+            kept, released = [], []
+            for entry in self._queue:
+                _, _, agent_id, tenant_id, task = entry
+                if self.owns(tenant_id, agent_id):
+                    kept.append(entry)
+                else:
+                    released.append(entry)
+            if released:
+                heapq.heapify(kept)
+                self._queue = kept
+            for agent_id, (tenant_id, _) in list(self._cache.items()):
+                if not self.owns(tenant_id, agent_id):
+                    del self._cache[agent_id]
+                    self.released_agents += 1
+            self.released_tasks += len(released)
+            # Original submission order, so re-routing preserves FIFO per agent.
+            released.sort(key=lambda entry: entry[1])
+            return [
+                (agent_id, tenant, task) for _, _, agent_id, tenant, task in released
+            ]
+
+    def drain(self) -> list[QueuedTask]:
+        """Remove and return every queued task (the shard is shutting down)."""
+        with self._lock:
+            drained = sorted(self._queue, key=lambda entry: entry[1])
+            self._queue = []
+            self._cache.clear()
+            return [
+                (agent_id, tenant, task) for _, _, agent_id, tenant, task in drained
+            ]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "shard_id": self.shard_id,
+                "epoch": self.assignment.epoch if self.assignment else None,
+                "queued": len(self._queue),
+                "cached_agents": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "released_tasks": self.released_tasks,
+                "released_agents": self.released_agents,
+            }
+
+    def _check_owner(self, tenant_id: str, agent_id: str) -> None:
+        if not self.owns(tenant_id, agent_id):
+            assignment = self.assignment
+            if assignment is None or not len(assignment.ring):
+                raise NotOwnerError(self.shard_id, agent_id, "<none>", -1)
+            raise NotOwnerError(
+                self.shard_id,
+                agent_id,
+                assignment.owner(tenant_id, agent_id),
+                assignment.epoch,
+            )
+
+    def _push(
+        self, agent_id: str, tenant_id: str, task: dict[str, Any], order: int
+    ) -> None:
+        rank = PRIORITY_RANK.get(task.get("priority", "medium"), 1)
+        heapq.heappush(self._queue, (rank, order, agent_id, tenant_id, task))
+
+
+class ShardRouter:
+    """
+    Hosts shards in this process and routes tasks to their owners.
+
+    Shards added here join ``coordinator``; membership changes made through
+    the coordinator directly (lease expiry, another router) rebalance these
+    shards too.
+    """
+
+    def __init__(
+        self,
+        coordinator: ShardCoordinator,
+        *,
+        cache_size: int = 1024,
+        loader: Callable[[str], Any] = _empty_context,
+    ) -> None:
+        self.coordinator = coordinator
+        self.shards: dict[str, Shard] = {}
+        self.rebalances: list[Rebalance] = []
+        self._cache_size = cache_size
+        self._loader = loader
+        self._unsubscribe = coordinator.subscribe(self._on_rebalance)
+
+    def add_shard(self, shard_id: str) -> Shard:
+        shard = Shard(shard_id, cache_size=self._cache_size, loader=self._loader)
+        shard.assign(self.coordinator.assignment)
+        self.shards[shard_id] = shard
+        self.coordinator.join(shard_id)
+        return shard
+
+    def remove_shard(self, shard_id: str) -> list[QueuedTask]:
+        """Leave the ring and re-route the shard's queue; returns what moved."""
+        if len(self.coordinator.assignment.ring) == 1 and len(self.shards[shard_id]):
+            raise UnknownShardError(
+                f"{shard_id} is the last shard and has queued tasks"
+            )
+        shard = self.shards.pop(shard_id)
+        pending = shard.drain()
+        self.coordinator.leave(shard_id)
+        self._route_all(pending)
+        return pending
+
+    def submit(self, agent_id: str, task: dict[str, Any]) -> str:
+        """Queue ``task`` on the owner of ``agent_id``; returns the shard id."""
+        tenant_id = self.coordinator.tenant_of(agent_id)
+        owner = self.coordinator.assignment.owner(tenant_id, agent_id)
+        shard = self.shards.get(owner)
+        if shard is None:
+            raise UnknownShardError(f"{owner} is not hosted by this router")
+        shard.submit(agent_id, task, tenant_id=tenant_id)
+        return owner
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def _on_rebalance(self, rebalance: Rebalance) -> None:
+        self.rebalances.append(rebalance)
+        for shard in self.shards.values():
+            shard.assign(rebalance.current)
+        released: list[QueuedTask] = []
+        for shard in self.shards.values():
+            released.extend(shard.release())
+        self._route_all(released)
+
+    def _route_all(self, items: list[QueuedTask]) -> None:
+        assignment = self.coordinator.assignment
+        batches: dict[str, list[QueuedTask]] = {}
+        for item in items:
+            owner = assignment.owner(item[1], item[0])
+            batches.setdefault(owner, []).append(item)
+        for owner, batch in batches.items():
+            shard = self.shards.get(owner)
+            if shard is None:
+                raise UnknownShardError(f"{owner} is not hosted by this router")
+            shard.submit_many(batch)
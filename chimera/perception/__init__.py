@@ -0,0 +1,19 @@
+"""
+Perception System: resource monitoring and trend detection (skills/README.md § 1).
+"""
+
+from chimera.perception.feed_log import FeedLog, FeedLogError, FeedRecorder
+from chimera.perception.trend_engine import (
+    TrendEngine,
+    TrendParameters,
+    extract_topics,
+)
+
+__all__ = [
+    "FeedLog",
+    "FeedLogError",
+    "FeedRecorder",
+    "TrendEngine",
+    "TrendParameters",
+    "extract_topics",
+]
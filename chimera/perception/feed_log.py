@@ -0,0 +1,265 @@
+"""
+Append-only, columnar log of ``skill_monitor_resources`` updates (FR 2.0).
+
+A log is a directory of flat column files, one fixed-width value per update,
+plus a payload heap and a URI dictionary::
+
+    ts.i64        update timestamp, Unix microseconds
+    uri.u32       resource URI dictionary code (line number in uris.txt)
+    flags.u8      bit 0: change_detected
+    offset.u64    start of the JSON content in payload.bin
+    length.u32    length of the JSON content in payload.bin
+    payload.bin   compact JSON ``content`` objects, back to back
+    uris.txt      one resource URI per line
+    meta.json     format version and byte order
+
+:class:`FeedRecorder` appends; :class:`FeedLog` memory-maps the columns so a
+replay scans timestamps and URI codes without parsing anything, and only
+decodes the payloads it actually needs. ``ts.i64`` is written last for each
+flush, so after a crash the timestamp count is the number of complete
+records and any trailing bytes in the other files are ignored.
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterator
+
+from chimera._time import epoch_from_iso, iso_from_epoch
+
+FORMAT_VERSION = 1
+# column file -> array typecode; ts must stay last (commit marker)
+COLUMNS = {
+    "uri.u32": "I",
+    "flags.u8": "B",
+    "offset.u64": "Q",
+    "length.u32": "I",
+    "ts.i64": "q",
+}
+_CHANGE_DETECTED = 0x01
+
+
+class FeedLogError(Exception):
+    """Raised for a missing, foreign or incompatible feed log."""
+
+
+class FeedRecorder:
+    """
+    Appends monitor updates to a feed log directory, creating it if needed.
+
+    Records are buffered in memory and written every ``flush_every`` updates
+    and on :meth:`flush` / :meth:`close`.
+    """
+
+    def __init__(self, path: str | os.PathLike, *, flush_every: int = 4096) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta_path = self.path / "meta.json"
+        if meta_path.exists():
+            if _check_meta(meta_path):
+                raise FeedLogError(f"{self.path} was written with another byte order")
+            _truncate_to_committed(self.path)
+        else:
+            meta_path.write_text(
+                json.dumps({"version": FORMAT_VERSION, "byteorder": sys.byteorder})
+            )
+        self.flush_every = flush_every
+        self._uris = _read_uris(self.path / "uris.txt")
+        self._codes = {uri: code for code, uri in enumerate(self._uris)}
+        self._new_uris: list[str] = []
+        self._payload = open(self.path / "payload.bin", "ab")
+        self._payload_end = self._payload.tell()
+        self._buffers = {name: array(code) for name, code in COLUMNS.items()}
+        self._heap = bytearray()
+        self.recorded = 0
+
+    def record(self, update: dict[str, Any]) -> None:
+        """Append one ``updates[]`` entry from a skill_monitor_resources output."""
+        uri = update["resource_uri"]
+        code = self._codes.get(uri)
+        if code is None:
+            code = self._codes[uri] = len(self._uris)
+            self._uris.append(uri)
+            self._new_uris.append(uri)
+        payload = json.dumps(
+            update.get("content"), separators=(",", ":"), ensure_ascii=False
+        ).encode()
+        buffers = self._buffers
+        buffers["uri.u32"].append(code)
+        buffers["flags.u8"].append(
+            _CHANGE_DETECTED if update.get("change_detected", True) else 0
+        )
+        buffers["offset.u64"].append(self._payload_end + len(self._heap))
+        buffers["length.u32"].append(len(payload))
+        buffers["ts.i64"].append(round(epoch_from_iso(update["timestamp"]) * 1e6))
+        self._heap += payload
+        self.recorded += 1
+        if len(buffers["ts.i64"]) >= self.flush_every:
+            self.flush()
+
+    def record_poll(self, output: dict[str, Any]) -> int:
+        """Append every update of a successful poll; returns how many."""
+        if not output.get("success"):
+            return 0
+        updates = output.get("updates", [])
+        for update in updates:
+            self.record(update)
+        return len(updates)
+
+    def flush(self) -> None:
+        if not self._buffers["ts.i64"]:
+            return
+        self._payload.write(self._heap)
+        self._payload.flush()
+        self._payload_end += len(self._heap)
+        self._heap.clear()
+        if self._new_uris:
+            with open(self.path / "uris.txt", "a", encoding="utf-8") as uris:
+                uris.writelines(f"{uri}\n" for uri in self._new_uris)
+            self._new_uris.clear()
+        for name, buffer in self._buffers.items():
+            with open(self.path / name, "ab") as column:
+                buffer.tofile(column)
+            del buffer[:]
+
+    def close(self) -> None:
+        self.flush()
+        self._payload.close()
+
+    def __enter__(self) -> "FeedRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class FeedLog:
+    """
+    Read-only, memory-mapped view of a feed log.
+
+    ``timestamps`` and ``uri_codes`` are zero-copy sequences over the column
+    files; :meth:`content` decodes one payload on demand.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        meta_path = self.path / "meta.json"
+        if not meta_path.exists():
+            raise FeedLogError(f"not a feed log: {self.path}")
+        swap = _check_meta(meta_path)
+        self.uris = _read_uris(self.path / "uris.txt")
+        self._maps: list[mmap.mmap] = []
+        columns = {name: self._map(name, code, swap) for name, code in COLUMNS.items()}
+        self._length = len(columns["ts.i64"])
+        self.timestamps = columns["ts.i64"][: self._length]
+        self.uri_codes = columns["uri.u32"][: self._length]
+        self._flags = columns["flags.u8"][: self._length]
+        self._offsets = columns["offset.u64"][: self._length]
+        self._lengths = columns["length.u32"][: self._length]
+        self._payload = self._map_bytes("payload.bin")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def timestamp(self, index: int) -> float:
+        """Unix seconds of record ``index``."""
+        return self.timestamps[index] / 1e6
+
+    def uri(self, index: int) -> str:
+        return self.uris[self.uri_codes[index]]
+
+    def change_detected(self, index: int) -> bool:
+        return bool(self._flags[index] & _CHANGE_DETECTED)
+
+    def raw_content(self, index: int) -> bytes:
+        """Undecoded JSON ``content`` of record ``index``."""
+        start = self._offsets[index]
+        return bytes(self._payload[start : start + self._lengths[index]])
+
+    def content(self, index: int) -> Any:
+        return json.loads(self.raw_content(index))
+
+    def update(self, index: int) -> dict[str, Any]:
+        """Record ``index`` in the skill_monitor_resources update shape."""
+        return {
+            "resource_uri": self.uri(index),
+            "content": self.content(index),
+            "timestamp": iso_from_epoch(self.timestamp(index)),
+            "change_detected": self.change_detected(index),
+        }
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(self._length):
+            yield self.update(index)
+
+    def close(self) -> None:
+        views = (
+            self.timestamps,
+            self.uri_codes,
+            self._flags,
+            self._offsets,
+            self._lengths,
+            self._payload,
+        )
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "FeedLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _map_bytes(self, name: str) -> memoryview | bytes:
+        path = self.path / name
+        if not path.exists() or path.stat().st_size == 0:
+            return b""
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped)
+
+    def _map(self, name: str, code: str, swap: bool):
+        raw = self._map_bytes(name)
+        itemsize = array(code).itemsize
+        usable = len(raw) - len(raw) % itemsize
+        if swap:
+            # Foreign byte order: fall back to a swapped in-memory copy.
+            values = array(code, bytes(raw[:usable]))
+            values.byteswap()
+            return values
+        if not usable:
+            return array(code)
+        return raw[:usable].cast(code)
+
+
+def _check_meta(meta_path: Path) -> bool:
+    """Validate ``meta.json``; returns True if the byte order is foreign."""
+    meta = json.loads(meta_path.read_text())
+    if meta.get("version") != FORMAT_VERSION:
+        raise FeedLogError(f"unsupported feed log version: {meta.get('version')}")
+    return meta.get("byteorder", sys.byteorder) != sys.byteorder
+
+
+def _truncate_to_committed(path: Path) -> None:
+    """Drop column bytes past the last committed timestamp (torn flush)."""
+    ts_path = path / "ts.i64"
+    committed = ts_path.stat().st_size // 8 if ts_path.exists() else 0
+    for name, code in COLUMNS.items():
+        column = path / name
+        size = committed * array(code).itemsize
+        if column.exists() and column.stat().st_size != size:
+            os.truncate(column, size)
+
+
+def _read_uris(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return path.read_text(encoding="utf-8").splitlines()
@@ -0,0 +1,209 @@
+"""
+Trend backtesting: replay a recorded feed log through trend engines.
+
+:class:`FeedReplayer` streams a :class:`FeedLog` through any number of
+:class:`TrendEngine` instances in one pass (each payload is decoded and
+tokenized once), either as fast as possible or scaled to wall-clock time.
+:func:`diff_alerts` compares the Trend Alerts two parameter sets produced.
+
+Command line::
+
+    python -m chimera.perception.replay FEED_LOG \\
+        --a time_window_hours=4,min_cluster_size=5 \\
+        --b time_window_hours=2,min_cluster_size=8
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from typing import Any, Callable, Mapping
+
+from chimera._time import epoch_from_iso
+from chimera.perception.feed_log import FeedLog
+from chimera.perception.trend_engine import TrendEngine, TrendParameters, extract_topics
+
+
+class FeedReplayer:
+    """
+    Feeds a log to trend engines in record order.
+
+    With ``speed=None`` records are delivered back to back; otherwise
+    ``speed`` feed-seconds are replayed per wall-clock second (``3600`` plays
+    an hour of feed per second).
+    """
+
+    def __init__(
+        self,
+        log: FeedLog,
+        *,
+        speed: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.log = log
+        self.speed = speed
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(self, engines: Mapping[str, TrendEngine]) -> dict[str, Any]:
+        """Replay the whole log; returns alerts per engine and timings."""
+        log = self.log
+        started = self._clock()
+        last_payload: list[bytes | None] = [None] * len(log.uris)
+        last_topics: list[frozenset[str]] = [frozenset()] * len(log.uris)
+        first = log.timestamp(0) if len(log) else 0.0
+        last = first
+        for index in range(len(log)):
+            timestamp = log.timestamp(index)
+            if self.speed is not None:
+                due = started + (timestamp - first) / self.speed
+                ahead = due - self._clock()
+                if ahead > 0:
+                    self._sleep(ahead)
+            # Polls often repeat a resource's last content; skip re-parsing it.
+            code = log.uri_codes[index]
+            raw = log.raw_content(index)
+            if raw != last_payload[code]:
+                last_payload[code] = raw
+                last_topics[code] = extract_topics(json.loads(raw))
+            topics = last_topics[code]
+            uri = log.uris[code]
+            for engine in engines.values():
+                engine.observe(timestamp, uri, topics)
+            last = timestamp
+        for engine in engines.values():
+            engine.advance(last)
+        return {
+            "records": len(log),
+            "feed_seconds": round(last - first, 3),
+            "wall_seconds": round(self._clock() - started, 4),
+            "alerts": {name: engine.alerts for name, engine in engines.items()},
+        }
+
+
+def diff_alerts(
+    baseline: list[dict[str, Any]], candidate: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Compare two runs' alerts, matched by (lead topic, window_end).
+
+    ``first_alert_lag_seconds`` is, per lead topic alerted in both runs, how
+    much later the candidate first alerted (negative: earlier).
+    """
+
+    def keyed(alerts):
+        return {(alert["topics"][0], alert["window_end"]): alert for alert in alerts}
+
+    def first_seen(alerts):
+        seen: dict[str, str] = {}
+        for alert in alerts:
+            seen.setdefault(alert["topics"][0], alert["window_end"])
+        return seen
+
+    base, cand = keyed(baseline), keyed(candidate)
+    changed = []
+    for key in sorted(base.keys() & cand.keys()):
+        before, after = base[key], cand[key]
+        if before["topics"] != after["topics"] or (
+            before["relevance_score"] != after["relevance_score"]
+        ):
+            changed.append(
+                {
+                    "lead_topic": key[0],
+                    "window_end": key[1],
+                    "topics": [before["topics"], after["topics"]],
+                    "relevance_score": [
+                        before["relevance_score"],
+                        after["relevance_score"],
+                    ],
+                }
+            )
+    base_first, cand_first = first_seen(baseline), first_seen(candidate)
+    lag = {
+        topic: round(
+            epoch_from_iso(cand_first[topic]) - epoch_from_iso(base_first[topic]), 3
+        )
+        for topic in sorted(base_first.keys() & cand_first.keys())
+    }
+    return {
+        "baseline_alerts": len(baseline),
+        "candidate_alerts": len(candidate),
+        "matched": len(base.keys() & cand.keys()),
+        "only_in_baseline": [base[key] for key in sorted(base.keys() - cand.keys())],
+        "only_in_candidate": [cand[key] for key in sorted(cand.keys() - base.keys())],
+        "changed": changed,
+        "topics_only_in_baseline": sorted(base_first.keys() - cand_first.keys()),
+        "topics_only_in_candidate": sorted(cand_first.keys() - base_first.keys()),
+        "first_alert_lag_seconds": lag,
+    }
+
+
+def backtest(
+    log: FeedLog,
+    parameter_sets: Mapping[str, TrendParameters],
+    *,
+    agent_id: str | None = None,
+    speed: float | None = None,
+) -> dict[str, Any]:
+    """Replay ``log`` once per parameter set (in one pass) and diff the first two."""
+    agent_id = agent_id or str(uuid.UUID(int=0))
+    engines = {
+        name: TrendEngine(agent_id, params) for name, params in parameter_sets.items()
+    }
+    result = FeedReplayer(log, speed=speed).run(engines)
+    report = {
+        "records": result["records"],
+        "feed_seconds": result["feed_seconds"],
+        "wall_seconds": result["wall_seconds"],
+        "parameters": {
+            name: params.__dict__ for name, params in parameter_sets.items()
+        },
+        "alerts": result["alerts"],
+    }
+    names = list(parameter_sets)
+    if len(names) >= 2:
+        report["diff"] = diff_alerts(
+            result["alerts"][names[0]], result["alerts"][names[1]]
+        )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chimera.perception.replay")
+    parser.add_argument("log", help="feed log directory")
+    parser.add_argument("--a", default="", help="baseline TrendParameters")
+    parser.add_argument("--b", default=None, help="candidate TrendParameters")
+    parser.add_argument(
+        "--speed", type=float, help="feed seconds per wall second (default: max)"
+    )
+    parser.add_argument("--output", help="write the full JSON report here")
+    args = parser.parse_args(argv)
+
+    parameter_sets = {"a": TrendParameters.parse(args.a)}
+    if args.b is not None:
+        parameter_sets["b"] = TrendParameters.parse(args.b)
+    with FeedLog(args.log) as log:
+        report = backtest(log, parameter_sets, speed=args.speed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+    summary = {key: value for key, value in report.items() if key != "alerts"}
+    summary["alert_counts"] = {
+        name: len(alerts) for name, alerts in report["alerts"].items()
+    }
+    if "diff" in summary:
+        diff = dict(summary["diff"])
+        diff["only_in_baseline"] = len(diff["only_in_baseline"])
+        diff["only_in_candidate"] = len(diff["only_in_candidate"])
+        diff["changed"] = len(diff["changed"])
+        summary["diff"] = diff
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
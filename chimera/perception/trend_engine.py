@@ -0,0 +1,261 @@
+"""
+Parameterized trend engine behind skill_detect_trends (FR 2.2, § 1.9).
+
+:class:`TrendEngine` consumes ``skill_monitor_resources`` updates in time
+order and, every ``evaluation_interval_minutes``, looks for topic clusters in
+the trailing ``time_window_hours``:
+
+- A topic seeds a cluster when it appears in at least ``min_cluster_size``
+  updates in the window. Topics that co-occur with the seed in at least half
+  of those updates join the cluster (up to ``max_topics`` in total).
+- ``relevance_score`` rewards both size and novelty: ``novelty`` is
+  ``size / (size + previous + min_cluster_size)``, where ``previous`` is the
+  seed's count in the window before; the ``min_cluster_size`` pseudo-count
+  keeps small bursts of rare background topics from looking novel.
+  ``saturation`` is ``1 - exp(-size / min_cluster_size)`` and the score is
+  their product.
+- Clusters scoring at least ``relevance_threshold`` become Trend Alerts.
+  Topics in an alerted cluster do not seed another alert until a full window
+  has passed.
+
+Evaluations are aligned to multiples of the interval on the Unix clock, and
+alert ids are derived from (agent, seed topic, window end), so two engines
+with different parameters produce directly comparable alerts. No alerts are
+emitted until two full windows have been observed, since novelty needs the
+previous window.
+
+Topics come from ``content["topics"]`` / ``keywords`` / ``hashtags`` when
+present, otherwise from the words of ``title``, ``headline``, ``text`` and
+``summary``. The production skill will use LLM clustering; this engine is
+the deterministic baseline used for tuning and backtests.
+"""
+
+import math
+import re
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from chimera._time import epoch_from_iso, iso_from_epoch
+
+STOPWORDS = frozenset(
+    """about after again also been before being between both could does doing
+    down during each from further have having here into just more most must
+    only other over same should some such than that their them then there these
+    they this those through under until very were what when where which while
+    will with would your""".split()
+)
+_WORD = re.compile(r"#?[^\W\d_][\w'-]{3,}")
+_TEXT_FIELDS = ("title", "headline", "text", "summary")
+_LIST_FIELDS = ("topics", "keywords", "hashtags")
+
+
+def extract_topics(content: Any) -> frozenset[str]:
+    """Normalized topics of one resource ``content`` object."""
+    if isinstance(content, dict):
+        for key in _LIST_FIELDS:
+            listed = content.get(key)
+            if listed:
+                return frozenset(str(topic).lower().lstrip("#") for topic in listed)
+        text = " ".join(
+            content[key] for key in _TEXT_FIELDS if isinstance(content.get(key), str)
+        )
+    elif isinstance(content, str):
+        text = content
+    else:
+        return frozenset()
+    return frozenset(
+        word
+        for word in (match.lstrip("#") for match in _WORD.findall(text.lower()))
+        if word not in STOPWORDS
+    )
+
+
+@dataclass(frozen=True)
+class TrendParameters:
+    """Tunable skill_detect_trends inputs plus the engine's own knobs."""
+
+    time_window_hours: float = 4.0
+    min_cluster_size: int = 5
+    relevance_threshold: float = 0.75
+    evaluation_interval_minutes: float = 15.0
+    max_topics: int = 5
+
+    def __post_init__(self) -> None:
+        if self.time_window_hours <= 0 or self.evaluation_interval_minutes <= 0:
+            raise ValueError("window and evaluation interval must be positive")
+        if self.min_cluster_size < 1 or self.max_topics < 1:
+            raise ValueError("min_cluster_size and max_topics must be >= 1")
+        if not 0.0 <= self.relevance_threshold <= 1.0:
+            raise ValueError("relevance_threshold must be in [0.0, 1.0]")
+
+    @classmethod
+    def parse(cls, spec: str) -> "TrendParameters":
+        """Build from ``"time_window_hours=2,min_cluster_size=8"``."""
+        fields = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            name, _, value = item.partition("=")
+            if name not in cls.__dataclass_fields__:
+                raise ValueError(f"unknown trend parameter: {name}")
+            fields[name] = (
+                int(value)
+                if name in ("min_cluster_size", "max_topics")
+                else float(value)
+            )
+        return cls(**fields)
+
+
+class TrendEngine:
+    """Sliding-window topic clustering for one agent."""
+
+    def __init__(
+        self,
+        agent_id: str,
+        params: TrendParameters | None = None,
+        *,
+        resource_uris: Iterable[str] | None = None,
+    ) -> None:
+        self.agent_id = agent_id
+        self.params = params or TrendParameters()
+        self.resource_uris = frozenset(resource_uris) if resource_uris else None
+        self.alerts: list[dict[str, Any]] = []
+        self._window = self.params.time_window_hours * 3600.0
+        self._interval = self.params.evaluation_interval_minutes * 60.0
+        self._current: deque[tuple[float, str, frozenset[str]]] = deque()
+        self._previous: deque[tuple[float, str, frozenset[str]]] = deque()
+        self._current_counts: Counter[str] = Counter()
+        self._previous_counts: Counter[str] = Counter()
+        # topic -> last alert time, oldest first (re-alerts move to the end)
+        self._last_alert: dict[str, float] = {}
+        self._started_at: float | None = None
+        self._next_evaluation: float | None = None
+
+    def observe(
+        self, timestamp: float, resource_uri: str, topics: frozenset[str]
+    ) -> list[dict[str, Any]]:
+        """Feed one update; returns alerts from evaluations it moved past."""
+        alerts = self.advance(timestamp)
+        if topics and (
+            self.resource_uris is None or resource_uri in self.resource_uris
+        ):
+            self._current.append((timestamp, resource_uri, topics))
+            self._current_counts.update(topics)
+        return alerts
+
+    def observe_update(self, update: dict[str, Any]) -> list[dict[str, Any]]:
+        """Feed one skill_monitor_resources ``updates[]`` entry."""
+        return self.observe(
+            epoch_from_iso(update["timestamp"]),
+            update["resource_uri"],
+            extract_topics(update.get("content")),
+        )
+
+    def advance(self, now: float) -> list[dict[str, Any]]:
+        """Run every evaluation due at or before ``now``."""
+        if self._next_evaluation is None:
+            self._started_at = now
+            self._next_evaluation = math.ceil(now / self._interval) * self._interval
+        alerts = []
+        while self._next_evaluation <= now:
+            alerts.extend(self._evaluate(self._next_evaluation))
+            self._next_evaluation += self._interval
+        self.alerts.extend(alerts)
+        return alerts
+
+    @property
+    def tracked_topics(self) -> int:
+        """Distinct topics counted in either window or alerted within one."""
+        return len(
+            self._current_counts.keys()
+            | self._previous_counts.keys()
+            | self._last_alert.keys()
+        )
+
+    def _slide(self, now: float) -> None:
+        current_start = now - self._window
+        while self._current and self._current[0][0] < current_start:
+            event = self._current.popleft()
+            _discount(self._current_counts, event[2])
+            self._previous.append(event)
+            self._previous_counts.update(event[2])
+        previous_start = current_start - self._window
+        while self._previous and self._previous[0][0] < previous_start:
+            event = self._previous.popleft()
+            _discount(self._previous_counts, event[2])
+        # Alerts at or before the window start no longer suppress a topic.
+        last_alert = self._last_alert
+        while last_alert:
+            topic, alerted_at = next(iter(last_alert.items()))
+            if alerted_at > current_start:
+                break
+            del last_alert[topic]
+
+    def _evaluate(self, now: float) -> list[dict[str, Any]]:
+        self._slide(now)
+        params = self.params
+        if now - self._started_at < 2 * self._window:
+            return []
+        size = params.min_cluster_size
+        recent = now - self._window
+        scores: dict[str, float] = {}
+        for topic, count in self._current_counts.items():
+            if count < size or self._last_alert.get(topic, -math.inf) > recent:
+                continue
+            novelty = count / (count + self._previous_counts[topic] + size)
+            score = round(novelty * (1.0 - math.exp(-count / size)), 4)
+            if score >= params.relevance_threshold:
+                scores[topic] = score
+        if not scores:
+            return []
+        # Co-occurrence is only needed for seeds that already qualify.
+        seeds = set(scores)
+        cooccurrence: dict[str, Counter[str]] = {seed: Counter() for seed in seeds}
+        sources: dict[str, set[str]] = {seed: set() for seed in seeds}
+        for _, uri, topics in self._current:
+            for seed in topics & seeds:
+                cooccurrence[seed].update(topics)
+                sources[seed].add(uri)
+
+        alerts = []
+        claimed: set[str] = set()
+        for seed in sorted(seeds, key=lambda t: (-self._current_counts[t], t)):
+            if seed in claimed:
+                continue
+            count = self._current_counts[seed]
+            score = scores[seed]
+            related = [
+                topic
+                for topic, together in cooccurrence[seed].most_common()
+                if topic != seed and topic not in claimed and together * 2 >= count
+            ][: params.max_topics - 1]
+            topics = [seed, *related]
+            claimed.update(topics)
+            for topic in topics:
+                self._last_alert.pop(topic, None)
+                self._last_alert[topic] = now
+            alerts.append(
+                {
+                    "alert_id": str(
+                        uuid.uuid5(uuid.NAMESPACE_URL, f"{self.agent_id}/{seed}/{now}")
+                    ),
+                    "agent_id": self.agent_id,
+                    "topics": topics,
+                    "relevance_score": score,
+                    "source_resources": sorted(sources[seed]),
+                    "window_start": iso_from_epoch(now - self._window),
+                    "window_end": iso_from_epoch(now),
+                    "created_at": iso_from_epoch(now),
+                }
+            )
+        return alerts
+
+
+def _discount(counts: Counter[str], topics: frozenset[str]) -> None:
+    """Remove one occurrence of each topic, dropping keys that reach zero."""
+    for topic in topics:
+        remaining = counts[topic] - 1
+        if remaining > 0:
+            counts[topic] = remaining
+        else:
+            del counts[topic]
@@ -0,0 +1,19 @@
+"""
+Runtime Skills invoked by Workers (contracts in skills/README.md).
+
+Skills are imported lazily: ``from chimera.skills import skill_generate_text``
+loads only that skill's module, via the default :class:`SkillRegistry`.
+"""
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if not name.startswith("skill_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from chimera.skills.registry import UnknownSkillError, default_registry
+
+    try:
+        return default_registry().get(name)
+    except UnknownSkillError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
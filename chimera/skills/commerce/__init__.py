@@ -0,0 +1,3 @@
+"""
+Agentic Commerce Skills (skills/README.md § 5).
+"""
@@ -0,0 +1,68 @@
+"""
+skill_get_wallet_balance (skills/README.md § 5.1, SRS FR 5.1).
+
+Reads go through a :class:`WalletBalanceCache` so the Planner's mandatory
+pre-flight balance check does not cost a Coinbase MCP round trip per task.
+The cache never returns a balance older than its ``max_staleness_seconds``.
+"""
+
+import uuid
+from typing import Any, Callable
+
+from chimera._time import iso_now
+from chimera.commerce.wallet_cache import WalletBalanceCache, WalletBalanceError
+
+WALLET_SERVER = "mcp-server-coinbase"
+
+_default_cache: WalletBalanceCache | None = None
+
+
+def set_default_cache(cache: WalletBalanceCache | None) -> None:
+    """Install the process-wide cache used when none is passed explicitly."""
+    global _default_cache
+    _default_cache = cache
+
+
+def configure(clients: Any, state_dir: str) -> Callable[[], None]:
+    """
+    Install a default cache that calls ``get_balance`` through ``clients``.
+
+    The Coinbase client is only created on the first cache miss.
+    """
+    cache = WalletBalanceCache(
+        lambda agent_id: clients.call_tool(
+            WALLET_SERVER, "get_balance", {"agent_id": agent_id}
+        )
+    )
+    set_default_cache(cache)
+
+    def shutdown() -> None:
+        set_default_cache(None)
+        cache.close()
+
+    return shutdown
+
+
+def skill_get_wallet_balance(
+    agent_id: str,
+    *,
+    max_staleness_seconds: float | None = None,
+    cache: WalletBalanceCache | None = None,
+) -> dict[str, Any]:
+    """Return the agent's balances per the Output Contract."""
+    try:
+        uuid.UUID(str(agent_id))
+    except ValueError:
+        return _error("agent_id must be a UUID string")
+    cache = cache or _default_cache
+    if cache is None:
+        return _error("wallet balance cache is not configured")
+    try:
+        snapshot = cache.get(agent_id, max_staleness_seconds=max_staleness_seconds)
+    except WalletBalanceError as exc:
+        return _error(str(exc))
+    return snapshot.to_output()
+
+
+def _error(message: str) -> dict[str, Any]:
+    return {"success": False, "checked_at": iso_now(), "error": message}
@@ -0,0 +1,3 @@
+"""
+Memory & Persona Management Skills (skills/README.md § 2).
+"""
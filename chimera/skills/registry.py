@@ -0,0 +1,381 @@
+"""
+Lazy skill registry (skills/README.md contract set).
+
+Workers resolve skills by name through a :class:`SkillRegistry` instead of
+importing every skill module up front. Implementations are imported on first
+use and MCP clients are created the first time a skill asks for one, so a
+Worker that only runs ``skill_generate_text`` never pays for the Coinbase or
+Weaviate client imports.
+
+A skill module may define ``configure(clients, state_dir)``; it installs the
+skill's process-wide defaults (cache, pipeline, ingestor) on top of the
+registry's :class:`LazyClientPool` and returns a shutdown callable or
+``None``. :meth:`SkillRegistry.configure` runs it for the skills a Worker
+serves.
+
+The contract set is kept as a static table (:data:`SKILL_CONTRACTS`) because
+``skills/README.md`` is not shipped in the container image;
+:func:`parse_skills_readme` reads the same table from the README so tests can
+keep the two in sync.
+"""
+
+import importlib
+import importlib.util
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# skills/README.md section number -> package under chimera.skills
+CATEGORIES = {
+    1: "perception",
+    2: "memory",
+    3: "content",
+    4: "social",
+    5: "commerce",
+    6: "governance",
+}
+
+
+class UnknownSkillError(LookupError):
+    """Raised for a name that is not in the skills/README.md contract set."""
+
+
+class SkillNotImplementedError(ImportError):
+    """Raised when a contracted skill has no implementation module yet."""
+
+
+@dataclass(frozen=True)
+class SkillContract:
+    """One skill from skills/README.md and the MCP servers it depends on."""
+
+    name: str
+    category: str
+    mcp_servers: tuple[str, ...] = ()
+
+    @property
+    def module(self) -> str:
+        short = self.name.removeprefix("skill_")
+        return f"chimera.skills.{self.category}.{short}"
+
+
+SKILL_CONTRACTS: tuple[SkillContract, ...] = (
+    SkillContract(
+        "skill_monitor_resources",
+        "perception",
+        ("mcp-server-twitter", "mcp-server-news", "mcp-server-market"),
+    ),
+    SkillContract("skill_semantic_filter", "perception"),
+    SkillContract("skill_detect_trends", "perception", ("mcp-server-news",)),
+    SkillContract("skill_load_persona", "memory"),
+    SkillContract("skill_retrieve_episodic_memory", "memory"),
+    SkillContract("skill_retrieve_semantic_memory", "memory", ("mcp-server-weaviate",)),
+    SkillContract("skill_assemble_context", "memory"),
+    SkillContract("skill_evolve_persona", "memory", ("mcp-server-weaviate",)),
+    SkillContract("skill_generate_text", "content"),
+    SkillContract(
+        "skill_generate_image",
+        "content",
+        ("mcp-server-ideogram", "mcp-server-midjourney"),
+    ),
+    SkillContract(
+        "skill_generate_video", "content", ("mcp-server-runway", "mcp-server-luma")
+    ),
+    SkillContract("skill_validate_character_consistency", "content"),
+    SkillContract(
+        "skill_post_content",
+        "social",
+        ("mcp-server-twitter", "mcp-server-instagram", "mcp-server-threads"),
+    ),
+    SkillContract("skill_reply_comment", "social"),
+    SkillContract("skill_manage_engagement_loop", "social"),
+    SkillContract("skill_get_wallet_balance", "commerce", ("mcp-server-coinbase",)),
+    SkillContract("skill_transfer_asset", "commerce", ("mcp-server-coinbase",)),
+    SkillContract("skill_deploy_token", "commerce", ("mcp-server-coinbase",)),
+    SkillContract("skill_enforce_budget", "commerce"),
+    SkillContract("skill_score_confidence", "governance"),
+    SkillContract("skill_route_hitl", "governance"),
+    SkillContract("skill_detect_sensitive_topics", "governance"),
+    SkillContract("skill_enforce_disclosure", "governance"),
+    SkillContract("skill_handle_honesty_directive", "governance"),
+)
+
+# Worker role -> skills it preloads (specs/technical.md Worker pools).
+WORKER_ROLES: dict[str, tuple[str, ...]] = {
+    "perception": (
+        "skill_monitor_resources",
+        "skill_semantic_filter",
+        "skill_detect_trends",
+    ),
+    "content": (
+        "skill_load_persona",
+        "skill_assemble_context",
+        "skill_generate_text",
+        "skill_generate_image",
+        "skill_generate_video",
+        "skill_validate_character_consistency",
+    ),
+    "social": (
+        "skill_load_persona",
+        "skill_generate_text",
+        "skill_post_content",
+        "skill_reply_comment",
+        "skill_manage_engagement_loop",
+    ),
+    "commerce": (
+        "skill_get_wallet_balance",
+        "skill_transfer_asset",
+        "skill_deploy_token",
+        "skill_enforce_budget",
+    ),
+    "judge": (
+        "skill_score_confidence",
+        "skill_route_hitl",
+        "skill_detect_sensitive_topics",
+        "skill_enforce_disclosure",
+        "skill_handle_honesty_directive",
+        "skill_evolve_persona",
+    ),
+}
+
+_SECTION = re.compile(r"^## (\d+)\. |^### (\d+)\.\d+ `(skill_\w+)`", re.MULTILINE)
+_HEADING = re.compile(r"^#{2,3} ", re.MULTILINE)
+_MCP_SERVER = re.compile(r"`(mcp-server-[\w-]+)`")
+
+
+def parse_skills_readme(path: str | Path) -> list[SkillContract]:
+    """Read the contract set (names, categories, MCP servers) from the README."""
+    text = Path(path).read_text(encoding="utf-8")
+    contracts = []
+    for match in _SECTION.finditer(text):
+        if match.group(3) is None:
+            continue
+        body = text[match.end() :]
+        following = _HEADING.search(body)
+        if following is not None:
+            body = body[: following.start()]
+        servers = tuple(dict.fromkeys(_MCP_SERVER.findall(body)))
+        contracts.append(
+            SkillContract(match.group(3), CATEGORIES[int(match.group(2))], servers)
+        )
+    return contracts
+
+
+class LazyClientPool:
+    """
+    MCP clients created on first request, one per server name.
+
+    ``factory`` builds a client for a server name (e.g. ``"mcp-server-news"``);
+    it runs at most once per server, even under concurrent first use.
+    """
+
+    def __init__(self, factory: Callable[[str], Any]) -> None:
+        self._factory = factory
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, server: str) -> Any:
+        client = self._clients.get(server)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(server)
+            if client is None:
+                client = self._factory(server)
+                self._clients[server] = client
+            return client
+
+    def call_tool(
+        self, server: str, tool: str, arguments: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Call ``tool`` on ``server``'s client and return the tool's output.
+
+        MCP ``tools/call`` results carry the output in ``structuredContent``;
+        an ``isError`` result becomes ``{"success": False, "error": ...}``.
+        """
+        result = self.get(server).call_tool(tool, arguments)
+        if result.get("isError"):
+            text = " ".join(part.get("text", "") for part in result.get("content", ()))
+            return {"success": False, "error": text or f"{tool} failed"}
+        return result.get("structuredContent", result)
+
+    def created(self) -> list[str]:
+        """Servers that have a client, in creation order."""
+        with self._lock:
+            return list(self._clients)
+
+    def close(self) -> None:
+        """Close every created client that has a ``close()`` method."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            close = getattr(client, "close", None)
+            if close is not None:
+                close()
+
+
+class SkillRegistry:
+    """
+    Resolves skill names to callables, importing modules on first use.
+
+    ``clients`` is the :class:`LazyClientPool` skills use to reach their MCP
+    servers; without a ``client_factory`` asking for a client is an error.
+    """
+
+    def __init__(
+        self,
+        contracts: Iterable[SkillContract] = SKILL_CONTRACTS,
+        *,
+        client_factory: Callable[[str], Any] | None = None,
+    ) -> None:
+        self._contracts = {contract.name: contract for contract in contracts}
+        self._loaded: dict[str, Callable[..., Any]] = {}
+        self._lock = threading.Lock()
+        self._shutdown: list[Callable[[], None]] = []
+        self.clients = LazyClientPool(client_factory or _no_client_factory)
+
+    def names(self) -> list[str]:
+        """All contracted skill names, in README order."""
+        return list(self._contracts)
+
+    def contract(self, name: str) -> SkillContract:
+        try:
+            return self._contracts[name]
+        except KeyError:
+            raise UnknownSkillError(f"unknown skill: {name}") from None
+
+    def get(self, name: str) -> Callable[..., Any]:
+        """Return the skill callable, importing its module on first use."""
+        skill = self._loaded.get(name)
+        if skill is not None:
+            return skill
+        contract = self.contract(name)
+        with self._lock:
+            skill = self._loaded.get(name)
+            if skill is None:
+                skill = self._import(contract)
+                self._loaded[name] = skill
+            return skill
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def loaded(self) -> list[str]:
+        """Skills imported so far."""
+        return list(self._loaded)
+
+    def implemented(self) -> list[str]:
+        """Contracted skills whose module exists, found without importing it."""
+        return [
+            name
+            for name, contract in self._contracts.items()
+            if _module_exists(contract.module)
+        ]
+
+    def preload(self, names: Iterable[str]) -> list[str]:
+        """
+        Import ``names`` now and return those without an implementation.
+
+        Unknown names raise :class:`UnknownSkillError`.
+        """
+        missing = []
+        for name in names:
+            try:
+                self.get(name)
+            except SkillNotImplementedError:
+                missing.append(name)
+        return missing
+
+    def configure(self, names: Iterable[str], *, state_dir: str) -> None:
+        """
+        Run each skill module's ``configure(clients, state_dir)`` hook.
+
+        Skills without a hook are skipped. Shutdown callables are run by
+        :meth:`close`, newest first.
+        """
+        for name in names:
+            module = importlib.import_module(self.contract(name).module)
+            configure = getattr(module, "configure", None)
+            if configure is None:
+                continue
+            shutdown = configure(self.clients, state_dir)
+            if shutdown is not None:
+                self._shutdown.append(shutdown)
+
+    def close(self) -> None:
+        """Shut down configured skill defaults, then close the MCP clients."""
+        shutdown, self._shutdown = self._shutdown, []
+        for stop in reversed(shutdown):
+            stop()
+        self.clients.close()
+
+    def resolve(self, selectors: Iterable[str]) -> list[str]:
+        """
+        Expand ``--skills`` selectors into skill names.
+
+        A selector is a skill name (with or without the ``skill_`` prefix),
+        a category (``content``), a worker role (``judge``) or ``all``.
+        """
+        names: dict[str, None] = {}
+        for selector in selectors:
+            selector = selector.strip()
+            if not selector:
+                continue
+            if selector == "all":
+                names.update(dict.fromkeys(self._contracts))
+            elif selector in WORKER_ROLES:
+                names.update(dict.fromkeys(WORKER_ROLES[selector]))
+            elif selector in CATEGORIES.values():
+                names.update(
+                    (name, None)
+                    for name, contract in self._contracts.items()
+                    if contract.category == selector
+                )
+            else:
+                name = (
+                    selector if selector.startswith("skill_") else f"skill_{selector}"
+                )
+                self.contract(name)
+                names[name] = None
+        return list(names)
+
+    def _import(self, contract: SkillContract) -> Callable[..., Any]:
+        if not _module_exists(contract.module):
+            raise SkillNotImplementedError(
+                f"{contract.name} is contracted but {contract.module} does not exist"
+            )
+        module = importlib.import_module(contract.module)
+        return getattr(module, contract.name)
+
+
+def _module_exists(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def _no_client_factory(server: str) -> Any:
+    raise RuntimeError(f"no MCP client factory configured for {server}")
+
+
+_default_registry: SkillRegistry | None = None
+_default_lock = threading.Lock()
+
+
+def default_registry() -> SkillRegistry:
+    """The process-wide registry, created on first use."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = SkillRegistry()
+        return _default_registry
+
+
+def set_default_registry(registry: SkillRegistry | None) -> None:
+    """Install the process-wide registry (``None`` recreates it on next use)."""
+    global _default_registry
+    with _default_lock:
+        _default_registry = registry
@@ -0,0 +1,3 @@
+"""
+Social Media Action Skills (skills/README.md § 4).
+"""
@@ -0,0 +1,119 @@
+"""
+skill_manage_engagement_loop (skills/README.md § 4.3, SRS FR 4.1).
+
+This skill runs the ``ingest`` step of the engagement loop. The mention goes
+through a :class:`MentionIngestor`, which drops re-delivered ``mention_id``s
+and coalesces mentions from the same author in the same thread. The returned
+``task_id`` is the reply task of the mention's group; mentions that were
+coalesced share it. Plan, generate, act and verify run once per group when
+the Planner takes it from :meth:`MentionIngestor.pop_due`, which then
+reports it with :meth:`MentionIngestor.complete` or
+:meth:`MentionIngestor.fail`. That is why ``reply_id`` is empty here.
+
+A duplicate delivery (already answered, or its group is still pending)
+returns ``success: false`` with a ``duplicate mention_id`` error, so the
+caller can tell it apart from a new mention.
+"""
+
+import uuid
+from typing import Any, Callable
+
+from chimera._task import PRIORITY_RANK
+from chimera._time import epoch_from_iso, iso_now
+from chimera.social.mention_ingest import MentionIngestor
+
+PLATFORMS = ("twitter", "instagram", "threads")
+
+_default_ingestor: MentionIngestor | None = None
+
+
+def set_default_ingestor(ingestor: MentionIngestor | None) -> None:
+    """Install the process-wide ingestor used when none is passed explicitly."""
+    global _default_ingestor
+    _default_ingestor = ingestor
+
+
+def configure(clients: Any, state_dir: str) -> Callable[[], None]:
+    """Install a default ingestor; ingest needs no MCP client."""
+    set_default_ingestor(MentionIngestor())
+    return lambda: set_default_ingestor(None)
+
+
+def skill_manage_engagement_loop(
+    agent_id: str,
+    mention_id: str,
+    platform: str,
+    mention_content: str,
+    mention_author: str,
+    mention_timestamp: str,
+    *,
+    priority: str = "medium",
+    thread_id: str | None = None,
+    author_influence: float = 0.0,
+    ingestor: MentionIngestor | None = None,
+) -> dict[str, Any]:
+    """Ingest one mention; returns the reply task it was grouped into."""
+    error = _validate(agent_id, mention_id, platform, mention_timestamp, priority)
+    ingestor = ingestor or _default_ingestor
+    if error is None and ingestor is None:
+        error = "mention ingestor is not configured"
+    if error is not None:
+        return _error(error)
+
+    status, group = ingestor.ingest(
+        {
+            "agent_id": agent_id,
+            "mention_id": mention_id,
+            "platform": platform,
+            "mention_content": mention_content,
+            "mention_author": mention_author,
+            "mention_timestamp": mention_timestamp,
+            "priority": priority,
+            "thread_id": thread_id,
+            "author_influence": author_influence,
+        }
+    )
+    if group is None:
+        return _error(f"duplicate mention_id: {mention_id} is pending or answered")
+    now = iso_now()
+    return {
+        "success": True,
+        "task_id": group.task_id,
+        "reply_id": "",
+        "workflow_steps": [{"step": "ingest", "status": "success", "timestamp": now}],
+        "completed_at": now,
+    }
+
+
+def _validate(
+    agent_id: str,
+    mention_id: str,
+    platform: str,
+    mention_timestamp: str,
+    priority: str,
+) -> str | None:
+    try:
+        uuid.UUID(str(agent_id))
+    except ValueError:
+        return "agent_id must be a UUID string"
+    if not isinstance(mention_id, str) or not mention_id:
+        return "mention_id must be a non-empty string"
+    if platform not in PLATFORMS:
+        return f"platform must be one of {', '.join(PLATFORMS)}"
+    try:
+        epoch_from_iso(mention_timestamp)
+    except (AttributeError, ValueError):
+        return "mention_timestamp must be an ISO 8601 string"
+    if priority not in PRIORITY_RANK:
+        return "priority must be high, medium or low"
+    return None
+
+
+def _error(message: str) -> dict[str, Any]:
+    now = iso_now()
+    return {
+        "success": False,
+        "workflow_steps": [{"step": "ingest", "status": "failure", "timestamp": now}],
+        "completed_at": now,
+        "error": message,
+    }
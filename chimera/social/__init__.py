@@ -0,0 +1,11 @@
+"""
+Social engagement support (skills/README.md § 4, SRS FR 4.x).
+"""
+
+from chimera.social.mention_ingest import (
+    MentionIngestor,
+    ProcessedMentionSet,
+    ReplyGroup,
+)
+
+__all__ = ["MentionIngestor", "ProcessedMentionSet", "ReplyGroup"]
@@ -0,0 +1,429 @@
+"""
+Mention ingestion for skill_manage_engagement_loop (skills/README.md § 4.3).
+
+A viral post turns into a burst of mention deliveries: the platform
+re-delivers the same ``mention_id`` on retries and reconnects, and many
+mentions land in the same thread from the same author within seconds.
+Running ingest -> plan -> generate -> act -> verify for each delivery costs
+two LLM calls and three MCP calls each and floods the thread with replies.
+:class:`MentionIngestor` sits in front of the loop:
+
+1. :class:`ProcessedMentionSet` drops ``mention_id``s that were already
+   answered. Recently answered ids are kept exactly; all answered ids go
+   into a rotating Bloom filter of bounded size. A mention created within
+   the exact window is only ever checked against the exact set, so Bloom
+   false positives cannot drop fresh mentions; only late re-deliveries of
+   old mentions rely on the filter. Re-deliveries of mentions whose group is
+   still queued or being answered are dropped too.
+2. Surviving mentions are grouped per (agent, platform, thread, author)
+   into a :class:`ReplyGroup`. A group closes ``window_seconds`` after its
+   first mention (or at ``max_group_size``) and becomes one
+   ``reply_comment`` Agent Task (specs/technical.md § 1.1).
+3. :meth:`MentionIngestor.pop_due` returns closed groups by ``priority``
+   (high, medium, low), then author influence, then age, so replies to
+   important mentions are generated first.
+4. The loop reports each group back: :meth:`MentionIngestor.complete` once
+   the reply is posted, which records its ids as processed, or
+   :meth:`MentionIngestor.fail` when plan, generate or act failed, so the
+   next re-delivery is answered. Ids are never marked processed before a
+   reply exists; after a crash, re-deliveries are admitted again.
+5. A group that is not reported within ``pending_seconds`` of being handed
+   out (or of opening, if nothing pops it) expires as if it had failed, and
+   is dropped from the ingestor. A worker that dies mid-reply, or an
+   ingestor nobody drains, therefore never blocks re-deliveries for good or
+   grows without bound.
+"""
+
+import hashlib
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from chimera._task import PRIORITY_RANK
+from chimera._time import epoch_from_iso, iso_from_epoch
+
+# mention -> author influence (higher replies first), e.g. a follower score
+InfluenceFn = Callable[[dict[str, Any]], float]
+
+
+def _default_influence(mention: dict[str, Any]) -> float:
+    return float(mention.get("author_influence") or 0.0)
+
+
+class ProcessedMentionSet:
+    """
+    Bounded record of processed ``mention_id``s.
+
+    The Bloom filter has two generations of ``capacity`` ids each, sized for
+    ``error_rate``; when the current one fills up the older one is discarded,
+    so memory stays fixed and every id is remembered for at least
+    ``capacity`` further ids. The exact set keeps ids processed in the last
+    ``recent_seconds`` (at most ``max_recent`` of them). If a burst evicts
+    ids from the exact set before their window ends, mentions created before
+    the last such eviction are checked against the filter as well. Timestamps
+    are Unix seconds from ``clock``.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        recent_seconds: float = 900.0,
+        max_recent: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be in (0.0, 1.0)")
+        self.capacity = capacity
+        self.recent_seconds = recent_seconds
+        self.max_recent = max_recent or capacity
+        self._clock = clock
+        self._bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._current = bytearray((self._bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+        self._recent: OrderedDict[str, float] = OrderedDict()
+        # Latest processing time of an id evicted by ``max_recent`` while
+        # still inside the window; older mentions may be missing exactly.
+        self._evicted_through = -math.inf
+        self._lock = threading.Lock()
+        self.exact_duplicates = 0
+        self.probable_duplicates = 0
+
+    def __len__(self) -> int:
+        """Ids in the exact recent window."""
+        return len(self._recent)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of both Bloom generations."""
+        return len(self._current) * 2
+
+    def add(self, mention_id: str, created_at: float | None = None) -> bool:
+        """
+        Record ``mention_id``; returns False if it was already processed.
+
+        ``created_at`` (Unix seconds of ``mention_timestamp``) lets fresh
+        mentions skip the probabilistic check entirely.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._seen(mention_id, created_at, now):
+                return False
+            self._insert(self._positions(mention_id))
+            self._recent[mention_id] = now
+            while len(self._recent) > self.max_recent:
+                _, seen_at = self._recent.popitem(last=False)
+                if seen_at >= now - self.recent_seconds:
+                    self._evicted_through = max(self._evicted_through, seen_at)
+            return True
+
+    def seen(self, mention_id: str, created_at: float | None = None) -> bool:
+        """Whether ``mention_id`` was processed, without recording it."""
+        with self._lock:
+            return self._seen(mention_id, created_at, self._clock())
+
+    def _seen(self, mention_id: str, created_at: float | None, now: float) -> bool:
+        self._expire(now)
+        if mention_id in self._recent:
+            self.exact_duplicates += 1
+            return True
+        # A mention is processed after it is created, so one created after
+        # every evicted id was processed cannot be among them.
+        fresh = (
+            created_at is not None
+            and now - created_at < self.recent_seconds
+            and created_at > self._evicted_through
+        )
+        if not fresh and self._maybe_contains(self._positions(mention_id)):
+            self.probable_duplicates += 1
+            return True
+        return False
+
+    def __contains__(self, mention_id: object) -> bool:
+        if not isinstance(mention_id, str):
+            return False
+        with self._lock:
+            return mention_id in self._recent or self._maybe_contains(
+                self._positions(mention_id)
+            )
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.recent_seconds
+        recent = self._recent
+        while recent:
+            mention_id, seen_at = next(iter(recent.items()))
+            if seen_at >= cutoff:
+                break
+            del recent[mention_id]
+
+    def _positions(self, mention_id: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over one 128-bit digest.
+        digest = hashlib.blake2b(mention_id.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._bits for i in range(self._hashes)]
+
+    def _maybe_contains(self, positions: list[int]) -> bool:
+        for bits in (self._current, self._previous):
+            if all(bits[p >> 3] & (1 << (p & 7)) for p in positions):
+                return True
+        return False
+
+    def _insert(self, positions: list[int]) -> None:
+        if self._current_count >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(len(self._previous))
+            self._current_count = 0
+        for p in positions:
+            self._current[p >> 3] |= 1 << (p & 7)
+        self._current_count += 1
+
+
+@dataclass
+class ReplyGroup:
+    """Mentions from one author in one thread that get a single reply."""
+
+    agent_id: str
+    platform: str
+    thread_id: str
+    author: str
+    opened_at: float
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    mentions: list[dict[str, Any]] = field(default_factory=list)
+    priority: str = "low"
+    influence: float = 0.0
+
+    @property
+    def rank(self) -> tuple[int, float, float]:
+        """Sort key: priority, then influence (descending), then age."""
+        return (PRIORITY_RANK[self.priority], -self.influence, self.opened_at)
+
+    @property
+    def mention_ids(self) -> list[str]:
+        return [mention["mention_id"] for mention in self.mentions]
+
+    def reply_input(self) -> dict[str, Any]:
+        """skill_reply_comment input answering the latest mention of the group."""
+        latest = self.mentions[-1]
+        return {
+            "agent_id": self.agent_id,
+            "task_id": self.task_id,
+            "platform": self.platform,
+            "parent_id": latest["mention_id"],
+            "parent_content": "\n".join(m["mention_content"] for m in self.mentions),
+            "parent_author": self.author,
+        }
+
+    def to_task(self) -> dict[str, Any]:
+        """The group as one ``reply_comment`` Agent Task (§ 1.1)."""
+        count = len(self.mentions)
+        return {
+            "task_id": self.task_id,
+            "task_type": "reply_comment",
+            "priority": self.priority,
+            "context": {
+                "goal_description": (
+                    f"Reply to {count} mention{'s' if count > 1 else ''} "
+                    f"from {self.author} on {self.platform}"
+                ),
+                "required_resources": [
+                    f"mcp://{self.platform}/mentions/{mention_id}"
+                    for mention_id in self.mention_ids
+                ],
+            },
+            "assigned_worker_id": "",
+            "created_at": iso_from_epoch(self.opened_at),
+            "status": "pending",
+        }
+
+
+class MentionIngestor:
+    """
+    Deduplicates and coalesces mentions into prioritised reply groups.
+
+    ``ingest`` is called per delivery with a skill_manage_engagement_loop
+    input (plus optional ``priority``, ``thread_id`` and
+    ``author_influence``); ``pop_due`` hands out groups whose window closed,
+    and the loop reports each one with ``complete`` or ``fail``. Mentions
+    without a ``thread_id`` are grouped per author. A group's lease of
+    ``pending_seconds`` starts when it opens and restarts when it is popped;
+    once it runs out the group is treated as failed.
+    """
+
+    def __init__(
+        self,
+        processed: ProcessedMentionSet | None = None,
+        *,
+        window_seconds: float = 2.0,
+        max_group_size: int = 20,
+        pending_seconds: float = 300.0,
+        influence: InfluenceFn = _default_influence,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if window_seconds < 0 or max_group_size < 1:
+            raise ValueError("window_seconds must be >= 0, max_group_size >= 1")
+        if pending_seconds <= window_seconds:
+            raise ValueError("pending_seconds must exceed window_seconds")
+        if processed is None:
+            processed = ProcessedMentionSet(clock=clock)
+        self.processed = processed
+        self.window_seconds = window_seconds
+        self.max_group_size = max_group_size
+        self.pending_seconds = pending_seconds
+        self._influence = influence
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._open: dict[tuple[str, str, str, str], ReplyGroup] = {}
+        self._closed: list[ReplyGroup] = []
+        # mention_id -> group, from ingest until complete() or fail()
+        self._pending: dict[str, ReplyGroup] = {}
+        # task_id -> (lease deadline, group) for every unreported group, in
+        # deadline order: leases are always ``clock() + pending_seconds``.
+        self._leases: OrderedDict[str, tuple[float, ReplyGroup]] = OrderedDict()
+        self.received = 0
+        self.pending_duplicates = 0
+        self.failed = 0
+        self.expired = 0
+        self.coalesced = 0
+        self.groups = 0
+
+    def ingest(self, mention: dict[str, Any]) -> tuple[str, ReplyGroup | None]:
+        """
+        Admit one delivery.
+
+        Returns ``("duplicate", None)``, ``("new", group)`` for the first
+        mention of a group or ``("coalesced", group)`` when it joined one.
+        """
+        created_at = epoch_from_iso(mention["mention_timestamp"])
+        mention_id = mention["mention_id"]
+        with self._lock:
+            self.received += 1
+            now = self._clock()
+            self._expire(now)
+            if mention_id in self._pending:
+                self.pending_duplicates += 1
+                return "duplicate", None
+            if self.processed.seen(mention_id, created_at):
+                return "duplicate", None
+            key = (
+                mention["agent_id"],
+                mention["platform"],
+                mention.get("thread_id") or "",
+                mention["mention_author"],
+            )
+            group = self._open.get(key)
+            status = "coalesced"
+            if group is None:
+                group = self._open[key] = ReplyGroup(*key, opened_at=now)
+                self._leases[group.task_id] = (now + self.pending_seconds, group)
+                self.groups += 1
+                status = "new"
+            else:
+                self.coalesced += 1
+            group.mentions.append(mention)
+            self._pending[mention_id] = group
+            priority = mention.get("priority") or "medium"
+            if PRIORITY_RANK[priority] < PRIORITY_RANK[group.priority]:
+                group.priority = priority
+            group.influence = max(group.influence, self._influence(mention))
+            if len(group.mentions) >= self.max_group_size:
+                self._closed.append(self._open.pop(key))
+            return status, group
+
+    def next_due(self) -> float | None:
+        """When the oldest open group closes (clock time), or None."""
+        with self._lock:
+            self._expire(self._clock())
+            if self._closed:
+                return self._clock()
+            if not self._open:
+                return None
+            return min(g.opened_at for g in self._open.values()) + self.window_seconds
+
+    def pop_due(self, now: float | None = None) -> list[ReplyGroup]:
+        """Remove and return every closed group, highest rank first."""
+        with self._lock:
+            clock = self._clock()
+            self._expire(clock)
+            now = clock if now is None else now
+            due = self._closed
+            self._closed = []
+            for key, group in list(self._open.items()):
+                if group.opened_at + self.window_seconds <= now:
+                    due.append(self._open.pop(key))
+            for group in due:
+                self._leases[group.task_id] = (clock + self.pending_seconds, group)
+                self._leases.move_to_end(group.task_id)
+            return sorted(due, key=lambda group: group.rank)
+
+    def flush(self) -> list[ReplyGroup]:
+        """Close and return every group regardless of its window."""
+        return self.pop_due(now=math.inf)
+
+    def complete(self, group: ReplyGroup) -> None:
+        """The group's reply was posted: record its mentions as processed."""
+        with self._lock:
+            self._release(group)
+            for mention in group.mentions:
+                self.processed.add(
+                    mention["mention_id"], epoch_from_iso(mention["mention_timestamp"])
+                )
+
+    def fail(self, group: ReplyGroup) -> None:
+        """The group was not answered: admit its mentions' next re-delivery."""
+        with self._lock:
+            self.failed += 1
+            self._release(group)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                "received": self.received,
+                "pending_duplicates": self.pending_duplicates,
+                "exact_duplicates": self.processed.exact_duplicates,
+                "probable_duplicates": self.processed.probable_duplicates,
+                "coalesced": self.coalesced,
+                "groups": self.groups,
+                "failed_groups": self.failed,
+                "expired_groups": self.expired,
+                "open_groups": len(self._open),
+                "closed_groups": len(self._closed),
+                "pending_mentions": len(self._pending),
+            }
+
+    def _release(self, group: ReplyGroup) -> None:
+        # Caller holds ``_lock``. A re-delivery admitted after this group
+        # expired belongs to a newer group; leave its entry alone.
+        self._leases.pop(group.task_id, None)
+        for mention_id in group.mention_ids:
+            if self._pending.get(mention_id) is group:
+                del self._pending[mention_id]
+
+    def _expire(self, now: float) -> None:
+        # Caller holds ``_lock``.
+        expired = []
+        while self._leases:
+            _, (deadline, group) = next(iter(self._leases.items()))
+            if deadline > now:
+                break
+            expired.append(group)
+            self._release(group)
+            key = (group.agent_id, group.platform, group.thread_id, group.author)
+            if self._open.get(key) is group:
+                del self._open[key]
+        if expired:
+            self.expired += len(expired)
+            gone = {group.task_id for group in expired}
+            self._closed = [g for g in self._closed if g.task_id not in gone]
@@ -1,6 +1,6 @@
-def main():
-    print("Hello from chimera-tenx!")
+import sys
 
+from chimera.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
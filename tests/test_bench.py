@@ -0,0 +1,120 @@
+"""
+Test suite for the chimera.bench load harness.
+
+Smoke-tests the offline Planner -> Worker -> Judge load harness against the
+targets in:
+- SRS: docs/project-chimera-srs-challenge/project-chimera-srs.md NFR 3.0, 3.1
+"""
+
+import pytest
+
+from chimera.bench.fakes import FakeLLM, FakeServerError, LatencyProfile
+from chimera.bench.harness import (
+    BenchConfig,
+    compare_reports,
+    generate_feed,
+    percentiles,
+    run_load_test,
+)
+
+
+def _small_config(**overrides) -> BenchConfig:
+    values = dict(
+        agents=40,
+        duration_seconds=30.0,
+        time_scale=0.01,
+        mentions_per_agent_minute=2.0,
+        trends_per_agent_minute=0.5,
+        workers=20,
+        judges=5,
+    )
+    values.update(overrides)
+    return BenchConfig(**values)
+
+
+class TestLoadHarness:
+    """Report structure and determinism."""
+
+    def test_report_contains_stage_percentiles(self):
+        """A run reports throughput, per-stage percentiles and memory."""
+        report = run_load_test(_small_config())
+
+        assert report["events"] > 0
+        assert report["outcomes"]["published"] > 0
+        assert report["throughput_tasks_per_second"] > 0
+        for stage in ("plan", "queue_wait", "work", "judge", "act"):
+            for key in ("p50", "p95", "p99"):
+                assert key in report["stages"][stage]
+        assert report["end_to_end"]["high"]["count"] > 0
+        assert 0.0 <= report["high_priority_within_10s"] <= 1.0
+        assert report["memory_per_agent_bytes"] > 0
+
+    def test_feed_is_deterministic(self):
+        """The same seed produces the same synthetic feed."""
+        first = generate_feed(_small_config(seed=7))
+        second = generate_feed(_small_config(seed=7))
+
+        assert [(e.at, e.agent_index, e.priority) for e in first] == [
+            (e.at, e.agent_index, e.priority) for e in second
+        ]
+
+    def test_wallet_checks_are_cached(self):
+        """Trend tasks check the wallet, mostly without chain round trips."""
+        report = run_load_test(
+            _small_config(
+                agents=5, mentions_per_agent_minute=0.0, trends_per_agent_minute=30.0
+            )
+        )
+
+        trend_tasks = report["stages"]["plan"]["count"]
+        assert report["wallet_balance_fetches"] < trend_tasks
+
+
+class TestFakes:
+    """Deterministic fake servers."""
+
+    def test_fake_results_do_not_depend_on_call_order(self):
+        """Identical calls on separate servers yield identical outcomes."""
+        profile = LatencyProfile(0.0, 0.0, 0.5)
+        outcomes = []
+        for _ in range(2):
+            llm = FakeLLM(profile, seed=3, time_scale=0.0)
+            run = []
+            for i in range(20):
+                try:
+                    run.append(llm.call_blocking("generate_text", {"i": i}))
+                except FakeServerError:
+                    run.append(None)
+            outcomes.append(run)
+
+        assert outcomes[0] == outcomes[1]
+        assert None in outcomes[0], "error_rate must inject failures"
+
+
+class TestCompareReports:
+    """Regression detection."""
+
+    def test_percentiles(self):
+        """Nearest-rank percentiles over simple data."""
+        result = percentiles([float(i) for i in range(1, 101)])
+
+        assert result["p50"] == 50.0
+        assert result["p99"] == 99.0
+
+    @pytest.mark.parametrize(
+        "throughput, p95, expected", [(10.0, 1.0, 0), (5.0, 1.0, 1), (10.0, 2.0, 4)]
+    )
+    def test_compare_flags_regressions(self, throughput, p95, expected):
+        """Throughput drops and tail latency growth are reported."""
+
+        def report(tp, tail):
+            stats = {"p95": tail, "p99": tail}
+            return {
+                "throughput_tasks_per_second": tp,
+                "end_to_end": {"all": stats, "high": stats},
+                "high_priority_within_10s": 1.0,
+            }
+
+        regressions = compare_reports(report(throughput, p95), report(10.0, 1.0))
+
+        assert len(regressions) == expected
@@ -0,0 +1,242 @@
+"""
+Test suite for mention deduplication and thread coalescing.
+
+Validates the ingest stage of the engagement loop against:
+- skills/README.md § 4.3 skill_manage_engagement_loop (contract)
+- specs/technical.md § 1.1 Agent Task (reply_comment, priority)
+- SRS: docs/project-chimera-srs-challenge/project-chimera-srs.md NFR 3.1
+"""
+
+import uuid
+
+import pytest
+
+from chimera._time import iso_from_epoch
+from chimera.bench.engagement import BurstConfig, run_burst
+from chimera.skills.social.manage_engagement_loop import (
+    skill_manage_engagement_loop,
+)
+from chimera.social.mention_ingest import MentionIngestor, ProcessedMentionSet
+
+START = 1769904000.0  # 2026-02-01T00:00:00Z
+AGENT_ID = str(uuid.UUID(int=7, version=4))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+
+def _mention(n, author="@fan", thread="t1", at=START, **extra):
+    return {
+        "agent_id": AGENT_ID,
+        "mention_id": f"m{n}",
+        "platform": "twitter",
+        "mention_content": f"hello {n}",
+        "mention_author": author,
+        "mention_timestamp": iso_from_epoch(at),
+        "thread_id": thread,
+        **extra,
+    }
+
+
+class TestProcessedMentionSet:
+    """Exact recent window backed by a rotating Bloom filter."""
+
+    def test_recent_and_late_duplicates(self):
+        """Re-deliveries are caught exactly, then by the filter after the window."""
+        clock = _Clock()
+        processed = ProcessedMentionSet(recent_seconds=60, clock=clock)
+        assert processed.add("m1", START)
+        assert not processed.add("m1", START)
+        clock.now += 600
+
+        assert not processed.add("m1", START), "old id must still be known"
+        assert len(processed) == 0, "exact window expired"
+        assert (processed.exact_duplicates, processed.probable_duplicates) == (1, 1)
+
+    def test_fresh_mentions_bypass_false_positives(self):
+        """A saturated filter never drops a mention created inside the window."""
+        clock = _Clock()
+        processed = ProcessedMentionSet(
+            capacity=8, error_rate=0.5, recent_seconds=60, max_recent=1000, clock=clock
+        )
+        for n in range(8):
+            processed.add(f"old{n}")
+        clock.now += 600
+        stale = sum(not processed.add(f"new{n}") for n in range(200))
+        fresh = [processed.add(f"fresh{n}", clock.now) for n in range(200)]
+
+        assert stale > 0, "an overfull filter reports false positives"
+        assert all(fresh), "fresh mentions are judged by the exact set only"
+
+    def test_burst_over_the_exact_cap_falls_back_to_the_filter(self):
+        """Ids evicted by max_recent inside the window are still caught."""
+        clock = _Clock()
+        processed = ProcessedMentionSet(recent_seconds=60, max_recent=10, clock=clock)
+        for n in range(50):
+            assert processed.add(f"m{n}", START)
+        clock.now += 1
+
+        assert not processed.add("m0", START), "evicted id must not slip through"
+        assert processed.probable_duplicates == 1
+        assert processed.add("later", clock.now), "newer mentions stay exact"
+
+    def test_memory_is_bounded(self):
+        """The filter rotates generations instead of growing."""
+        processed = ProcessedMentionSet(capacity=100, recent_seconds=0)
+        size = processed.memory_bytes
+        for n in range(1000):
+            processed.add(f"m{n}")
+        assert processed.memory_bytes == size
+        assert "m999" in processed
+        assert "m0" not in processed, "ids older than two generations are dropped"
+
+
+class TestMentionIngestor:
+    """Per thread and author coalescing with prioritised release."""
+
+    def test_coalesces_thread_and_author_within_window(self):
+        """Mentions from one author in one thread become one reply task."""
+        clock = _Clock()
+        ingestor = MentionIngestor(window_seconds=2.0, clock=clock)
+        assert ingestor.ingest(_mention(1))[0] == "new"
+        clock.now += 1.0
+        assert ingestor.ingest(_mention(2))[0] == "coalesced"
+        assert ingestor.ingest(_mention(1))[0] == "duplicate"
+        assert ingestor.ingest(_mention(3, author="@other"))[0] == "new"
+        assert ingestor.ingest(_mention(4, thread="t2"))[0] == "new"
+        assert ingestor.pop_due() == [], "windows are still open"
+
+        clock.now += 1.5
+        due = ingestor.pop_due()
+        assert [group.mention_ids for group in due] == [["m1", "m2"]]
+        task = due[0].to_task()
+        assert task["task_type"] == "reply_comment"
+        assert task["context"]["required_resources"] == [
+            "mcp://twitter/mentions/m1",
+            "mcp://twitter/mentions/m2",
+        ]
+        assert due[0].reply_input()["parent_id"] == "m2"
+        assert len(ingestor.flush()) == 2
+
+    def test_releases_by_priority_then_influence(self):
+        """High priority first, then the most influential author."""
+        ingestor = MentionIngestor(window_seconds=0.0, clock=_Clock())
+        ingestor.ingest(_mention(1, author="@a", priority="low", author_influence=0.9))
+        ingestor.ingest(_mention(2, author="@b", author_influence=0.2))
+        ingestor.ingest(_mention(3, author="@c", author_influence=0.8))
+        ingestor.ingest(_mention(4, author="@d", priority="high"))
+        ingestor.ingest(_mention(5, author="@b", priority="high"))
+
+        order = [group.author for group in ingestor.pop_due()]
+        assert order == ["@b", "@d", "@c", "@a"]
+
+    def test_ids_are_processed_only_when_the_reply_completes(self):
+        """Pending groups drop re-deliveries; failed groups admit them again."""
+        clock = _Clock()
+        ingestor = MentionIngestor(window_seconds=0.0, clock=clock)
+        ingestor.ingest(_mention(1, author="@a"))
+        ingestor.ingest(_mention(2, author="@b"))
+        answered, failed = sorted(ingestor.pop_due(), key=lambda g: g.author)
+        assert ingestor.ingest(_mention(1, author="@a"))[0] == "duplicate"
+        assert "m1" not in ingestor.processed, "no reply exists yet"
+
+        ingestor.complete(answered)
+        ingestor.fail(failed)
+
+        assert ingestor.ingest(_mention(1, author="@a"))[0] == "duplicate"
+        assert ingestor.ingest(_mention(2, author="@b"))[0] == "new"
+        stats = ingestor.stats()
+        assert stats["pending_duplicates"] == 1
+        assert stats["failed_groups"] == 1
+        assert stats["pending_mentions"] == 1
+
+    def test_unreported_groups_expire(self):
+        """A popped group never reported, or never popped, expires like a fail."""
+        clock = _Clock()
+        ingestor = MentionIngestor(window_seconds=2.0, pending_seconds=60, clock=clock)
+        ingestor.ingest(_mention(1, author="@a"))
+        clock.now += 5
+        (popped,) = ingestor.pop_due()  # the worker dies mid-reply
+        for n in range(2, 50):
+            ingestor.ingest(_mention(n, author=f"@{n}"))  # nobody drains these
+        clock.now += 30
+        assert ingestor.ingest(_mention(1, author="@a"))[0] == "duplicate"
+
+        clock.now += 31
+        assert ingestor.ingest(_mention(1, author="@a"))[0] == "new"
+        ingestor.fail(popped)  # a late report does not free the new delivery
+        stats = ingestor.stats()
+        assert stats["expired_groups"] == 49
+        assert stats["pending_mentions"] == 1
+        assert stats["open_groups"] + stats["closed_groups"] == 1
+
+    def test_full_group_closes_early(self):
+        """A group reaching max_group_size is released before its window."""
+        ingestor = MentionIngestor(window_seconds=60, max_group_size=3, clock=_Clock())
+        for n in range(4):
+            ingestor.ingest(_mention(n))
+        assert [len(group.mentions) for group in ingestor.pop_due()] == [3]
+        assert ingestor.stats()["open_groups"] == 1
+
+
+class TestEngagementLoopSkill:
+    """skill_manage_engagement_loop ingest output."""
+
+    def _call(self, ingestor, n, **overrides):
+        arguments = _mention(n)
+        del arguments["thread_id"]
+        arguments.update(overrides)
+        return skill_manage_engagement_loop(**arguments, ingestor=ingestor)
+
+    def test_contract_and_shared_task(self):
+        """Coalesced mentions share a task_id; duplicates fail clearly."""
+        ingestor = MentionIngestor(clock=_Clock())
+        first = self._call(ingestor, 1)
+        second = self._call(ingestor, 2)
+        duplicate = self._call(ingestor, 1)
+
+        assert first["success"] is True
+        assert first["task_id"] == second["task_id"]
+        assert first["reply_id"] == ""
+        assert [s["step"] for s in first["workflow_steps"]] == ["ingest"]
+        assert duplicate["success"] is False
+        assert "duplicate mention_id" in duplicate["error"]
+
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"agent_id": "not-a-uuid"}, "agent_id"),
+            ({"platform": "myspace"}, "platform"),
+            ({"mention_timestamp": "yesterday"}, "mention_timestamp"),
+            ({"priority": "urgent"}, "priority"),
+        ],
+    )
+    def test_invalid_input(self, overrides, message):
+        """Invalid inputs return success false with the offending field."""
+        result = self._call(MentionIngestor(clock=_Clock()), 1, **overrides)
+        assert result["success"] is False
+        assert message in result["error"]
+
+
+class TestEngagementBench:
+    """Replayed burst report."""
+
+    def test_coalescing_saves_calls_and_meets_target(self):
+        """Fewer LLM/MCP calls, no duplicate replies, high priority within 10s."""
+        report = run_burst(BurstConfig(mentions=400, duration_seconds=60, workers=8))
+        baseline, coalesced = report["per_mention"], report["coalesced"]
+
+        assert report["saved"]["llm_calls"] > 0 and report["saved"]["mcp_calls"] > 0
+        assert baseline["duplicate_replies"] > 0
+        assert coalesced["duplicate_replies"] == 0
+        assert coalesced["unanswered"] == 0
+        assert coalesced["high_priority_within_target"] == 1.0
+        assert (
+            coalesced["latency_by_priority"]["high"]["p95"]
+            < baseline["latency_by_priority"]["high"]["p95"]
+        )
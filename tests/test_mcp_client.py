@@ -0,0 +1,323 @@
+"""
+Test suite for the shared MCP client layer.
+
+Validates session reuse, pipelining, coalescing and per-server policies for
+the MCP integration described in:
+- specs/_meta.md (MCP as the only path to external systems)
+- specs/technical.md § 1 (MCP tool contracts)
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from chimera.mcp import (
+    BlockingMCPClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    MCPClientManager,
+    MCPRemoteError,
+    MCPTimeoutError,
+    MCPUnavailableError,
+    ServerConfig,
+    ServerPolicy,
+)
+from chimera.mcp.stub_server import StubMCPServer
+
+SERVER = "mcp-server-stub"
+
+
+class BrokenTransport:
+    """Transport whose peer hangs up or sends garbage on the first read."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.closed = False
+
+    async def send(self, message):
+        pass
+
+    async def receive(self):
+        await asyncio.sleep(0)
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+    async def close(self):
+        self.closed = True
+
+
+def _manager(server, **policy):
+    return MCPClientManager(
+        [ServerConfig(SERVER, server.connect, ServerPolicy(**policy))]
+    )
+
+
+class TestSessions:
+    """One long-lived, pipelined session per server."""
+
+    def test_concurrent_calls_share_one_pipelined_session(self):
+        """Fifty concurrent tool calls use one session and overlap in flight."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER, latency_seconds=0.05)
+            manager = _manager(server)
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(manager.call_tool(SERVER, "echo", {"n": n}) for n in range(50))
+            )
+            elapsed = time.perf_counter() - started
+            await manager.close()
+            return server, results, elapsed
+
+        server, results, elapsed = asyncio.run(scenario())
+
+        assert server.sessions == 1, "expected a single initialize handshake"
+        assert server.max_in_flight >= 50, "requests were not pipelined"
+        assert elapsed < 1.0, f"50 x 50ms calls took {elapsed:.2f}s"
+        assert results[7]["structuredContent"] == {"echo": {"n": 7}}
+
+    def test_reconnects_after_server_drops_session(self):
+        """A lost session is replaced on the next call."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER)
+            manager = _manager(server)
+            await manager.call_tool(SERVER, "echo")
+            await server.disconnect_all()
+            await asyncio.sleep(0)
+            await manager.read_resource(SERVER, "mcp://news/latest")
+            metrics = manager.metrics()[SERVER]
+            await manager.close()
+            return server, metrics
+
+        server, metrics = asyncio.run(scenario())
+
+        assert server.sessions == 2
+        assert metrics["sessions_opened"] == 2
+
+    def test_failed_handshake_closes_the_transport(self):
+        """A timed-out or rejected initialize leaves no session behind."""
+
+        async def scenario():
+            slow = StubMCPServer(SERVER, connect_latency_seconds=0.2)
+            manager = _manager(
+                slow, connect_timeout_seconds=0.02, max_attempts=1, failure_threshold=99
+            )
+            for _ in range(4):
+                with pytest.raises(MCPUnavailableError):
+                    await manager.read_resource(SERVER, "mcp://news/latest")
+            await asyncio.sleep(0.01)
+            leaked = slow.open_sessions
+            await manager.close()
+
+            rejecting = StubMCPServer(SERVER, protocol_version="1999-01-01")
+            manager = _manager(rejecting, max_attempts=1, failure_threshold=1)
+            with pytest.raises(MCPUnavailableError) as failure:
+                await manager.call_tool(SERVER, "echo")
+            breaker = manager.metrics()[SERVER]["breaker"]
+            await asyncio.sleep(0.01)
+            await manager.close()
+            return slow, leaked, rejecting, failure.value, breaker
+
+        slow, leaked, rejecting, error, breaker = asyncio.run(scenario())
+
+        assert slow.sessions == 4 and leaked == 0
+        assert isinstance(error.__cause__, MCPRemoteError)
+        assert breaker == "open", "a rejected handshake counts as a failure"
+        assert rejecting.open_sessions == 0
+
+    def test_lost_connection_closes_the_transport(self):
+        """A session that failed on its own still releases its transport."""
+        replies = [EOFError("closed stdout"), ValueError("bad json"), ["garbage"]]
+        transports = []
+
+        async def connect():
+            transports.append(BrokenTransport(replies[len(transports)]))
+            return transports[-1]
+
+        async def scenario():
+            manager = MCPClientManager(
+                [
+                    ServerConfig(
+                        SERVER,
+                        connect,
+                        ServerPolicy(max_attempts=1, failure_threshold=99),
+                    )
+                ]
+            )
+            for _ in replies:
+                with pytest.raises(MCPUnavailableError):
+                    await manager.call_tool(SERVER, "echo")
+            await manager.close()
+
+        asyncio.run(scenario())
+
+        assert [transport.closed for transport in transports] == [True, True, True]
+
+
+class TestCoalescing:
+    """Identical in-flight resource reads share one request."""
+
+    def test_identical_reads_coalesce(self):
+        """Twenty concurrent reads of one URI send one resources/read."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER, latency_seconds=0.02)
+            manager = _manager(server)
+            results = await asyncio.gather(
+                *(
+                    manager.read_resource(SERVER, "mcp://twitter/mentions/1")
+                    for _ in range(20)
+                ),
+                manager.read_resource(SERVER, "mcp://twitter/mentions/2"),
+            )
+            metrics = manager.metrics()[SERVER]
+            await manager.close()
+            return server, results, metrics
+
+        server, results, metrics = asyncio.run(scenario())
+
+        assert server.requests["resources/read"] == 2
+        assert metrics["coalesced"] == 19
+        assert all(result is results[0] for result in results[:20])
+        assert results[20]["contents"][0]["uri"] == "mcp://twitter/mentions/2"
+
+    def test_sequential_reads_are_not_cached(self):
+        """Coalescing only applies while a read is in flight."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER)
+            manager = _manager(server)
+            for _ in range(3):
+                await manager.read_resource(SERVER, "mcp://news/latest")
+            await manager.close()
+            return server
+
+        assert asyncio.run(scenario()).requests["resources/read"] == 3
+
+
+class TestPolicies:
+    """Per-server timeout, retry and circuit breaker."""
+
+    def test_reads_retry_and_tools_do_not(self):
+        """Timed-out reads are retried; non-idempotent tool calls are not."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER, latency_seconds=0.2)
+            manager = _manager(
+                server,
+                timeout_seconds=0.02,
+                max_attempts=3,
+                backoff_seconds=0.001,
+                failure_threshold=100,
+            )
+            with pytest.raises(MCPTimeoutError):
+                await manager.read_resource(SERVER, "mcp://news/latest")
+            with pytest.raises(MCPTimeoutError):
+                await manager.call_tool(SERVER, "echo")
+            metrics = manager.metrics()[SERVER]
+            await manager.close()
+            return server, metrics
+
+        server, metrics = asyncio.run(scenario())
+
+        assert server.requests["resources/read"] == 3
+        assert server.requests["tools/call"] == 1
+        assert metrics["timeouts"] == 4
+        assert metrics["retries"] == 2
+
+    def test_remote_errors_are_final_and_healthy(self):
+        """A JSON-RPC error is raised once and does not open the breaker."""
+
+        async def scenario():
+            server = StubMCPServer(SERVER, failure_rate=1.0)
+            manager = _manager(server, failure_threshold=1)
+            for _ in range(3):
+                with pytest.raises(MCPRemoteError):
+                    await manager.call_tool(SERVER, "echo")
+            metrics = manager.metrics()[SERVER]
+            await manager.close()
+            return server, metrics
+
+        server, metrics = asyncio.run(scenario())
+
+        assert server.requests["tools/call"] == 3
+        assert metrics["breaker"] == "closed"
+
+    def test_breaker_opens_and_recovers(self):
+        """Consecutive connect failures open the breaker until a trial succeeds."""
+        clock = {"now": 0.0}
+
+        async def scenario():
+            server = StubMCPServer(SERVER)
+            server.down = True
+            manager = MCPClientManager(
+                [
+                    ServerConfig(
+                        SERVER,
+                        server.connect,
+                        ServerPolicy(
+                            max_attempts=1,
+                            failure_threshold=2,
+                            reset_timeout_seconds=30.0,
+                        ),
+                    )
+                ],
+                clock=lambda: clock["now"],
+            )
+            for _ in range(2):
+                with pytest.raises(MCPUnavailableError) as failure:
+                    await manager.read_resource(SERVER, "mcp://news/latest")
+                assert not isinstance(failure.value, CircuitOpenError)
+            with pytest.raises(CircuitOpenError):
+                await manager.read_resource(SERVER, "mcp://news/latest")
+            opened = manager.metrics()[SERVER]
+
+            server.down = False
+            clock["now"] = 31.0
+            await manager.read_resource(SERVER, "mcp://news/latest")
+            recovered = manager.metrics()[SERVER]
+            await manager.close()
+            return opened, recovered
+
+        opened, recovered = asyncio.run(scenario())
+
+        assert opened["breaker"] == "open"
+        assert opened["rejected"] == 1
+        assert recovered["breaker"] == "closed"
+
+    def test_half_open_admits_one_trial(self):
+        """Only one call probes a half-open server."""
+        clock = {"now": 0.0}
+        breaker = CircuitBreaker(1, 10.0, clock=lambda: clock["now"])
+        breaker.record_failure()
+        assert breaker.allow() is False
+
+        clock["now"] = 10.0
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+
+class TestStdio:
+    """The stub server speaks MCP over a real stdio subprocess."""
+
+    def test_blocking_client_against_stdio_stub(self):
+        """Synchronous callers reach a subprocess server through the manager."""
+        config = ServerConfig.stdio(
+            SERVER, [sys.executable, "-m", "chimera.mcp.stub_server"]
+        )
+        client = BlockingMCPClient(MCPClientManager([config]))
+        try:
+            result = client.bind(SERVER).call_tool("echo", {"hello": "world"})
+            metrics = client.metrics()[SERVER]
+        finally:
+            client.close()
+
+        assert result["structuredContent"] == {"echo": {"hello": "world"}}
+        assert metrics["sessions_opened"] == 1
+        assert metrics["latency_seconds"]["max"] > 0
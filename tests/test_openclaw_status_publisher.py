@@ -0,0 +1,190 @@
+"""
+Test suite for the OpenClaw Registry Publisher.
+
+Validates batched, delta-encoded status publishing defined in:
+- specs/openclaw_integration.md § 3.4 Status Object, § 4.3 Frequency, § 5
+"""
+
+import random
+
+import pytest
+
+from chimera.openclaw.simulation import MockOpenClawRegistry, simulate_fleet
+from chimera.openclaw.status_publisher import (
+    BATCH_TOOL,
+    PublisherConfig,
+    StatusPublisher,
+)
+
+
+def _document(agent_id: str) -> dict:
+    return {
+        "agent_id": agent_id,
+        "availability": {"open_for_collaboration": True, "max_concurrent_collabs": 3},
+        "status": {"operational_state": "sleeping", "queue_depth": 0},
+    }
+
+
+def _publisher(transport, **config) -> StatusPublisher:
+    return StatusPublisher(
+        transport,
+        PublisherConfig(**config),
+        clock=lambda: 0.0,
+        wall_clock=lambda: 1_770_292_800.0,
+        rng=random.Random(0),
+    )
+
+
+class RecordingTransport:
+    def __init__(self, registry=None):
+        self.registry = registry or MockOpenClawRegistry()
+        self.messages = []
+
+    def __call__(self, tool_name, arguments):
+        self.messages.append((tool_name, arguments))
+        return self.registry(tool_name, arguments)
+
+
+class TestStatusPublisher:
+    """Batching, delta encoding and debounce behaviour."""
+
+    def test_first_publish_is_one_batched_full_payload(self):
+        """Registered agents are published together as full documents."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport)
+        for i in range(3):
+            publisher.register(f"agent-{i}", _document(f"agent-{i}"), now=0.0)
+
+        assert publisher.flush(now=0.0) == 1, "All agents must share one message"
+        tool_name, message = transport.messages[0]
+        assert tool_name == BATCH_TOOL
+        assert len(message["updates"]) == 3
+        assert all("full" in update for update in message["updates"])
+
+    def test_changes_are_sent_as_deltas(self):
+        """Only changed fields are sent relative to the acknowledged version."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport, debounce_seconds=1.0)
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+
+        publisher.update("agent-1", {"status": {"queue_depth": 4}}, now=5.0)
+        publisher.flush(now=6.0)
+
+        update = transport.messages[-1][1]["updates"][0]
+        assert update["base_version"] == 1
+        assert update["set"] == {"status.queue_depth": 4}
+        assert transport.registry.entries["agent-1"]["status"]["queue_depth"] == 4
+
+    def test_state_flaps_are_debounced(self):
+        """planning -> working -> judging inside the window publishes once."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport, debounce_seconds=2.0)
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+
+        for t, state in ((10.0, "planning"), (10.5, "working"), (11.0, "judging")):
+            publisher.update("agent-1", {"status": {"operational_state": state}}, t)
+            publisher.flush(now=t)
+        publisher.flush(now=13.0)
+
+        assert len(transport.messages) == 2, "Flap must collapse into one delta"
+        update = transport.messages[-1][1]["updates"][0]
+        assert update["set"] == {"status.operational_state": "judging"}
+        assert publisher.stats.debounced_changes == 2
+
+    def test_flap_back_to_acknowledged_state_sends_nothing(self):
+        """A change that reverts before the debounce fires is dropped."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport, debounce_seconds=2.0)
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+
+        publisher.update("agent-1", {"status": {"operational_state": "working"}}, 10)
+        publisher.update("agent-1", {"status": {"operational_state": "sleeping"}}, 11)
+        publisher.flush(now=20.0)
+
+        assert len(transport.messages) == 1
+
+    def test_heartbeat_does_not_acknowledge_pending_changes(self):
+        """A heartbeat during debounce must not mark the pending edit as sent."""
+        transport = RecordingTransport()
+        publisher = _publisher(
+            transport, heartbeat_interval_seconds=60.0, debounce_seconds=5.0
+        )
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+
+        publisher.update("agent-1", {"status": {"queue_depth": 9}}, now=199.0)
+        publisher.flush(now=200.0)  # heartbeat due, change still debouncing
+        publisher.flush(now=205.0)
+
+        assert transport.registry.entries["agent-1"]["status"]["queue_depth"] == 9
+
+    def test_heartbeats_are_jittered(self):
+        """Agents registered together do not heartbeat at the same instant."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport, heartbeat_interval_seconds=60.0)
+        for i in range(50):
+            publisher.register(f"agent-{i}", _document(f"agent-{i}"), now=0.0)
+        publisher.flush(now=0.0)
+
+        per_second = [publisher.flush(now=float(t)) for t in range(1, 80)]
+
+        assert publisher.stats.heartbeats == 50
+        assert sum(per_second) > 5, "Heartbeats must be spread across the window"
+
+    def test_failed_send_is_retried_against_last_ack(self):
+        """Updates stay pending when the transport fails."""
+        registry = MockOpenClawRegistry()
+        fail = {"on": True}
+
+        def flaky(tool_name, arguments):
+            if fail["on"]:
+                raise ConnectionError("registry unavailable")
+            return registry(tool_name, arguments)
+
+        publisher = _publisher(flaky)
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+        fail["on"] = False
+        publisher.flush(now=1.0)
+
+        assert publisher.stats.failed_messages == 1
+        assert "agent-1" in registry.entries
+
+    def test_resync_sends_full_document(self):
+        """Agents the registry lost are re-sent in full."""
+        transport = RecordingTransport()
+        publisher = _publisher(transport, debounce_seconds=0.0)
+        publisher.register("agent-1", _document("agent-1"), now=0.0)
+        publisher.flush(now=0.0)
+        transport.registry.versions.clear()
+
+        publisher.update("agent-1", {"status": {"queue_depth": 1}}, now=1.0)
+        publisher.flush(now=1.0)
+        publisher.flush(now=2.0)
+
+        assert "full" in transport.messages[-1][1]["updates"][0]
+        assert transport.registry.entries["agent-1"]["status"]["queue_depth"] == 1
+
+    def test_invalid_config_rejected(self):
+        """Configuration outside the supported ranges raises ValueError."""
+        with pytest.raises(ValueError):
+            PublisherConfig(heartbeat_jitter=1.5)
+
+
+class TestFleetSimulation:
+    """Traffic comparison for a simulated fleet."""
+
+    def test_batched_publisher_reduces_traffic(self):
+        """Batched deltas use fewer messages and bytes than full payloads."""
+        report = simulate_fleet(agents=200, minutes=3, seed=1)
+
+        assert report["registry_consistent"], "Registry must converge"
+        baseline, batched = report["baseline"], report["batched"]
+        assert batched["messages_per_minute"] < baseline["messages_per_minute"]
+        assert batched["bytes_per_minute"] < baseline["bytes_per_minute"]
+        assert (
+            batched["peak_messages_per_second"] < baseline["peak_messages_per_second"]
+        )
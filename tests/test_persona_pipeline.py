@@ -0,0 +1,313 @@
+"""
+Test suite for the write-behind persona evolution pipeline.
+
+Validates skill_evolve_persona behaviour defined in:
+- skills/README.md § 2.5 skill_evolve_persona
+- SRS: docs/project-chimera-srs-challenge/project-chimera-srs.md FR 1.2
+"""
+
+import threading
+import time
+import uuid
+
+import pytest
+
+from chimera.memory.persona_pipeline import JournalInUseError, PersonaEvolutionPipeline
+from chimera.skills.memory.evolve_persona import skill_evolve_persona
+
+
+class FakeMemoryBackends:
+    """Records LLM summarise, embed and Weaviate write calls."""
+
+    def __init__(self):
+        self.summaries = []
+        self.embed_calls = []
+        self.writes = []
+        self.fail_writes = False
+
+    def summarize(self, agent_id, interactions):
+        self.summaries.append((agent_id, len(interactions)))
+        return f"{agent_id}: {len(interactions)} interactions"
+
+    def embed(self, texts):
+        self.embed_calls.append(len(texts))
+        return [[float(len(text))] for text in texts]
+
+    def write(self, records):
+        if self.fail_writes:
+            raise ConnectionError("weaviate unavailable")
+        self.writes.append(records)
+
+
+def _interaction(agent_id, score=0.9):
+    return {
+        "agent_id": agent_id,
+        "interaction_id": str(uuid.uuid4()),
+        "engagement_metrics": {"likes": 10, "engagement_score": score},
+        "interaction_content": {"text": "loved the summer drop"},
+        "timestamp": "2026-02-05T12:00:00.000Z",
+    }
+
+
+@pytest.fixture
+def clock():
+    return {"now": 0.0}
+
+
+def _pipeline(backends, journal, clock, **kwargs):
+    return PersonaEvolutionPipeline(
+        backends.summarize,
+        backends.embed,
+        backends.write,
+        journal,
+        clock=lambda: clock["now"],
+        fsync=False,
+        **kwargs,
+    )
+
+
+class TestPersonaEvolutionPipeline:
+    """Merging, batching and crash recovery."""
+
+    def test_interactions_are_merged_per_agent(self, tmp_path, clock):
+        """Interactions for one agent share one summary and memory_id."""
+        backends = FakeMemoryBackends()
+        pipeline = _pipeline(backends, tmp_path / "journal", clock, merge_threshold=3)
+        agent_id = str(uuid.uuid4())
+
+        ids = {pipeline.submit(_interaction(agent_id)) for _ in range(3)}
+
+        assert len(ids) == 1, "Merged interactions must share a memory_id"
+        assert backends.summaries == [], "submit must not call the LLM"
+        assert pipeline.run_once() == 1
+        assert backends.summaries == [(agent_id, 3)]
+        assert pipeline.status(ids.pop())["written_to_weaviate"] is True
+
+    def test_window_flushes_partial_groups(self, tmp_path, clock):
+        """Groups below the threshold are written after the merge window."""
+        backends = FakeMemoryBackends()
+        pipeline = _pipeline(
+            backends, tmp_path / "journal", clock, merge_window_seconds=30.0
+        )
+        pipeline.submit(_interaction(str(uuid.uuid4())))
+
+        assert pipeline.run_once() == 0
+        clock["now"] = 31.0
+        assert pipeline.run_once() == 1
+
+    def test_embeddings_and_writes_are_batched(self, tmp_path, clock):
+        """Many agents' summaries are embedded and written in bulk."""
+        backends = FakeMemoryBackends()
+        pipeline = _pipeline(
+            backends,
+            tmp_path / "journal",
+            clock,
+            merge_threshold=1,
+            embed_batch_size=4,
+        )
+        for _ in range(10):
+            pipeline.submit(_interaction(str(uuid.uuid4())))
+
+        assert pipeline.run_once() == 10
+        assert backends.embed_calls == [4, 4, 2]
+        assert [len(batch) for batch in backends.writes] == [4, 4, 2]
+
+    def test_failed_write_is_retried_after_backoff(self, tmp_path, clock):
+        """Write errors keep the group queued and report the error."""
+        backends = FakeMemoryBackends()
+        backends.fail_writes = True
+        pipeline = _pipeline(
+            backends,
+            tmp_path / "journal",
+            clock,
+            merge_threshold=1,
+            retry_backoff_seconds=5.0,
+        )
+        memory_id = pipeline.submit(_interaction(str(uuid.uuid4())))
+
+        assert pipeline.run_once() == 0
+        assert "error" in pipeline.status(memory_id)
+        backends.fail_writes = False
+        assert pipeline.run_once() == 0, "Must wait for the backoff"
+        clock["now"] = 6.0
+        assert pipeline.run_once() == 1
+        assert pipeline.pending() == 0
+
+    def test_pending_writes_survive_restart(self, tmp_path, clock):
+        """Uncommitted interactions are replayed from the journal."""
+        journal = tmp_path / "journal"
+        backends = FakeMemoryBackends()
+        pipeline = _pipeline(backends, journal, clock, merge_threshold=10)
+        agent_id = str(uuid.uuid4())
+        memory_id = pipeline.submit(_interaction(agent_id))
+        pipeline.submit(_interaction(agent_id))
+        pipeline.close()  # simulated crash: nothing written
+
+        recovered = _pipeline(FakeMemoryBackends(), journal, clock)
+        assert recovered.pending() == 2
+        assert recovered.run_once() == 1
+        assert recovered.status(memory_id)["written_to_weaviate"] is True
+        recovered.stop()
+        assert journal.read_text() == "", "Committed work must be compacted"
+
+    def test_journal_has_a_single_owner(self, tmp_path, clock):
+        """A second pipeline on a journal in use is refused until it closes."""
+        journal = tmp_path / "journal"
+        owner = _pipeline(FakeMemoryBackends(), journal, clock)
+
+        with pytest.raises(JournalInUseError):
+            _pipeline(FakeMemoryBackends(), journal, clock)
+        owner.close()
+        _pipeline(FakeMemoryBackends(), journal, clock).close()
+
+    def test_journal_is_compacted_under_steady_traffic(self, tmp_path, clock):
+        """With a group always open, the journal still stays bounded."""
+        journal = tmp_path / "journal"
+        pipeline = _pipeline(
+            FakeMemoryBackends(),
+            journal,
+            clock,
+            merge_threshold=2,
+            compact_bytes=4096,
+        )
+        lingering = str(uuid.uuid4())
+        pipeline.submit(_interaction(lingering))  # never reaches the threshold
+        sizes = []
+        for _ in range(300):
+            agent_id = str(uuid.uuid4())
+            pipeline.submit(_interaction(agent_id))
+            pipeline.submit(_interaction(agent_id))
+            assert pipeline.run_once() == 1
+            sizes.append(journal.stat().st_size)
+        pipeline.close()
+
+        assert max(sizes) < 3 * 4096, "journal must not grow with history"
+        recovered = _pipeline(FakeMemoryBackends(), journal, clock)
+        assert recovered.pending() == 1, "only the open group is replayed"
+
+    def test_background_worker_reports_asynchronously(self, tmp_path):
+        """on_written fires from the worker thread with the skill output."""
+        backends = FakeMemoryBackends()
+        done = threading.Event()
+        results = {}
+
+        def on_written(memory_id, result):
+            results[memory_id] = result
+            done.set()
+
+        pipeline = PersonaEvolutionPipeline(
+            backends.summarize,
+            backends.embed,
+            backends.write,
+            tmp_path / "journal",
+            merge_threshold=2,
+            on_written=on_written,
+            fsync=False,
+        )
+        pipeline.start()
+        agent_id = str(uuid.uuid4())
+        pipeline.submit(_interaction(agent_id))
+        memory_id = pipeline.submit(_interaction(agent_id))
+
+        assert done.wait(timeout=5.0), "Worker must write the merged group"
+        pipeline.stop()
+        assert results[memory_id]["written_to_weaviate"] is True
+        assert results[memory_id]["summary"]
+
+    def test_overdue_groups_flush_without_another_window(self, tmp_path, clock):
+        """A group already past its merge window is written immediately."""
+        written = threading.Event()
+        pipeline = _pipeline(
+            FakeMemoryBackends(),
+            tmp_path / "journal",
+            clock,
+            merge_window_seconds=30.0,
+            on_written=lambda memory_id, result: written.set(),
+        )
+        pipeline.submit(_interaction(str(uuid.uuid4())))
+        clock["now"] = 31.0
+
+        pipeline.start()
+        try:
+            assert written.wait(timeout=2.0), "worker slept another window"
+        finally:
+            pipeline.stop()
+
+    def test_failing_callback_does_not_requeue_commits(self, tmp_path, clock):
+        """A raising on_written is logged; committed groups stay committed."""
+        backends = FakeMemoryBackends()
+
+        def on_written(memory_id, result):
+            raise RuntimeError("subscriber crashed")
+
+        pipeline = _pipeline(
+            backends,
+            tmp_path / "journal",
+            clock,
+            merge_threshold=1,
+            on_written=on_written,
+        )
+        memory_id = pipeline.submit(_interaction(str(uuid.uuid4())))
+
+        assert pipeline.run_once() == 1
+        clock["now"] = 3600.0
+        assert pipeline.run_once() == 0
+        assert len(backends.writes) == 1, "committed group was written again"
+        assert pipeline.pending() == 0
+        assert pipeline.status(memory_id)["written_to_weaviate"] is True
+        pipeline.stop()
+
+
+class TestSkillEvolvePersona:
+    """skill_evolve_persona Input/Output contract."""
+
+    def test_returns_without_waiting_for_write(self, tmp_path):
+        """The skill returns promptly while the background write is blocked."""
+        backends = FakeMemoryBackends()
+        writing = threading.Event()
+        release = threading.Event()
+
+        def blocking_write(records):
+            writing.set()
+            release.wait(timeout=10.0)
+            backends.writes.append(records)
+
+        pipeline = PersonaEvolutionPipeline(
+            backends.summarize,
+            backends.embed,
+            blocking_write,
+            tmp_path / "journal",
+            merge_threshold=1,
+        )
+        pipeline.start()
+        try:
+            first = skill_evolve_persona(
+                pipeline=pipeline, **_interaction(str(uuid.uuid4()))
+            )
+            assert writing.wait(timeout=5.0), "worker must be inside the write"
+
+            started = time.perf_counter()
+            result = skill_evolve_persona(
+                pipeline=pipeline, **_interaction(str(uuid.uuid4()))
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+            pipeline.stop()
+
+        assert elapsed < 0.5, f"skill blocked for {elapsed:.2f}s on the write"
+        assert result["success"] is True
+        assert result["written_to_weaviate"] is False
+        assert isinstance(result["memory_id"], str)
+        assert isinstance(result["timestamp"], str)
+        assert pipeline.status(first["memory_id"])["written_to_weaviate"] is True
+
+    def test_invalid_input_returns_error(self, tmp_path, clock):
+        """Invalid identifiers yield success=False with an error string."""
+        pipeline = _pipeline(FakeMemoryBackends(), tmp_path / "journal", clock)
+        item = _interaction("not-a-uuid")
+
+        result = skill_evolve_persona(pipeline=pipeline, **item)
+
+        assert result["success"] is False
+        assert isinstance(result["error"], str)
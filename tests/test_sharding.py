@@ -0,0 +1,247 @@
+"""
+Test suite for tenant-sharded orchestration.
+
+Validates agent placement and rebalancing built on:
+- specs/technical.md § 1.1 Agent Task (priority) and § 2 agents.tenant_id
+- SRS: docs/project-chimera-srs-challenge/project-chimera-srs.md NFR 3.0
+"""
+
+import argparse
+
+import pytest
+
+from chimera.bench.shards import movement, run_shards
+from chimera.orchestration import (
+    HashRing,
+    NotOwnerError,
+    Shard,
+    ShardCoordinator,
+    ShardRouter,
+    UnknownShardError,
+    routing_key,
+)
+
+
+def _agents(count=200, tenants=10):
+    return {f"agent-{i:04d}": f"tenant-{i % tenants:02d}" for i in range(count)}
+
+
+def _task(n, priority="medium"):
+    return {"task_id": f"task-{n}", "priority": priority, "status": "pending"}
+
+
+def _router(agents, shards=2, **kwargs):
+    coordinator = ShardCoordinator(**kwargs)
+    for agent_id, tenant_id in agents.items():
+        coordinator.register_agent(agent_id, tenant_id)
+    router = ShardRouter(coordinator)
+    for index in range(shards):
+        router.add_shard(f"shard-{index}")
+    return coordinator, router
+
+
+def _drain(router):
+    seen = {}
+    for shard_id, shard in router.shards.items():
+        while (item := shard.pop()) is not None:
+            seen.setdefault(shard_id, []).append(item)
+    return seen
+
+
+class TestHashRing:
+    """Consistent placement and minimal movement."""
+
+    def test_adding_a_shard_only_moves_keys_to_it(self):
+        """Keys either stay put or move to the new shard, about 1/n of them."""
+        keys = [f"key-{i}" for i in range(4000)]
+        before = HashRing(["a", "b", "c"])
+        after = before.with_shard("d")
+
+        moved = [k for k in keys if before.shard_for(k) != after.shard_for(k)]
+        assert all(after.shard_for(k) == "d" for k in moved)
+        assert 0.15 < len(moved) / len(keys) < 0.35, len(moved)
+        assert set(after.load(keys).values()) != {0}, "every shard owns keys"
+
+    def test_removing_a_shard_only_moves_its_keys(self):
+        """Keys of surviving shards never move when another shard leaves."""
+        keys = [f"key-{i}" for i in range(2000)]
+        before = HashRing(["a", "b", "c", "d"])
+        after = before.without_shard("b")
+        for key in keys:
+            if before.shard_for(key) != "b":
+                assert after.shard_for(key) == before.shard_for(key)
+
+    def test_routing_key_colocates_tenants_unless_split(self):
+        """Unsplit tenants route as one key; split tenants route per agent."""
+        assert routing_key("t1", "a1") == routing_key("t1", "a2") == "t1"
+        assert routing_key("t1", "a1", frozenset({"t1"})) == "t1/a1"
+
+    def test_empty_ring_raises(self):
+        """Placement on a ring with no shards fails clearly."""
+        with pytest.raises(LookupError):
+            HashRing().shard_for("t1")
+
+
+class TestCoordinator:
+    """Epochs, leases and rebalance plans."""
+
+    def test_rebalance_lists_exactly_the_moved_agents(self):
+        """The published plan matches a before/after comparison per agent."""
+        agents = _agents()
+        coordinator, _ = _router(agents, shards=3, split_tenants=["tenant-00"])
+        plans = []
+        coordinator.subscribe(plans.append)
+        before = {agent: coordinator.owner_of(agent) for agent in agents}
+
+        coordinator.join("shard-3")
+
+        after = {agent: coordinator.owner_of(agent) for agent in agents}
+        expected = {a: (before[a], after[a]) for a in agents if before[a] != after[a]}
+        assert len(plans) == 1 and plans[0].current.epoch == 4
+        assert plans[0].moved == expected
+        assert all(new == "shard-3" for _, new in expected.values())
+
+    def test_expired_lease_drops_the_shard(self):
+        """A shard that stops heartbeating is removed and must re-join."""
+        now = {"t": 0.0}
+        coordinator = ShardCoordinator(lease_seconds=10, clock=lambda: now["t"])
+        coordinator.join("a")
+        coordinator.join("b")
+        now["t"] = 8.0
+        coordinator.heartbeat("a")
+        now["t"] = 12.0
+
+        assert coordinator.expire() == ["b"]
+        assert coordinator.assignment.shards == ("a",)
+        with pytest.raises(UnknownShardError):
+            coordinator.heartbeat("b")
+
+
+class TestShard:
+    """Per-shard queue and cache."""
+
+    def test_rejects_agents_it_does_not_own(self):
+        """Tasks for another shard's agent raise NotOwnerError naming the owner."""
+        agents = _agents()
+        coordinator, router = _router(agents)
+        agent = next(a for a in agents if coordinator.owner_of(a) == "shard-1")
+        with pytest.raises(NotOwnerError) as caught:
+            router.shards["shard-0"].submit(agent, _task(1), tenant_id=agents[agent])
+        assert caught.value.owner == "shard-1"
+
+    def test_priority_then_fifo(self):
+        """High priority tasks pop first; equal priorities keep arrival order."""
+        coordinator = ShardCoordinator()
+        coordinator.join("only")
+        shard = Shard("only")
+        shard.assign(coordinator.assignment)
+        for n, priority in enumerate(["low", "medium", "high", "medium", "high"]):
+            shard.submit("a1", _task(n, priority), tenant_id="t1")
+        order = [shard.pop()[2]["task_id"] for _ in range(5)]
+        assert order == ["task-2", "task-4", "task-1", "task-3", "task-0"]
+        assert shard.pop() is None
+
+    def test_context_cache_is_lru(self):
+        """Repeated context reads hit the cache; the least recent entry is evicted."""
+        loads = []
+        coordinator = ShardCoordinator()
+        coordinator.join("only")
+        shard = Shard("only", cache_size=2, loader=loads.append)
+        shard.assign(coordinator.assignment)
+        for agent in ["a1", "a2", "a1", "a3", "a2"]:
+            shard.context(agent, "t1")
+        assert loads == ["a1", "a2", "a3", "a2"]
+        assert (shard.cache_hits, shard.cache_misses) == (1, 4)
+
+
+class TestRouter:
+    """Live rebalancing of queued tasks and cached agents."""
+
+    def test_join_hands_off_queued_tasks_in_order(self):
+        """A new shard receives its agents' queued tasks; nothing is lost."""
+        agents = _agents()
+        coordinator, router = _router(agents)
+        agent_ids = list(agents)
+        for n in range(600):
+            router.submit(agent_ids[n % len(agent_ids)], _task(n))
+        for shard in router.shards.values():
+            for agent_id in agent_ids[:50]:
+                if shard.owns(agents[agent_id], agent_id):
+                    shard.context(agent_id, agents[agent_id])
+
+        router.add_shard("shard-2")
+
+        moved = router.rebalances[-1].moved
+        assert moved and all(new == "shard-2" for _, new in moved.values())
+        released = sum(s.released_agents for s in router.shards.values())
+        assert released == len([a for a in agent_ids[:50] if a in moved])
+        seen = _drain(router)
+        tasks = [item for items in seen.values() for item in items]
+        assert len(tasks) == 600, "every queued task survives the rebalance"
+        for shard_id, items in seen.items():
+            for agent_id, _, _ in items:
+                assert coordinator.owner_of(agent_id) == shard_id
+        per_agent = {}
+        for agent_id, _, task in seen["shard-2"]:
+            per_agent.setdefault(agent_id, []).append(int(task["task_id"][5:]))
+        assert all(ids == sorted(ids) for ids in per_agent.values())
+
+    def test_remove_reroutes_and_guards_the_last_shard(self):
+        """Leaving re-routes the queue; the last shard cannot drop its tasks."""
+        agents = _agents()
+        _, router = _router(agents)
+        for n, agent_id in enumerate(agents):
+            router.submit(agent_id, _task(n))
+
+        pending = router.remove_shard("shard-0")
+
+        assert len(router.shards["shard-1"]) == len(agents)
+        assert pending, "shard-0 owned some agents"
+        with pytest.raises(UnknownShardError):
+            router.remove_shard("shard-1")
+
+    def test_close_is_idempotent(self):
+        """Closing a router twice unsubscribes it once and does not raise."""
+        coordinator, router = _router(_agents())
+        epochs = len(router.rebalances)
+
+        router.close()
+        router.close()
+        coordinator.join("shard-9")
+
+        assert len(router.rebalances) == epochs, "closed router still subscribed"
+
+
+class TestShardBench:
+    """Multi-process benchmark smoke test."""
+
+    def test_consistent_hashing_moves_fewer_agents_than_modulo(self):
+        """Growing 3 -> 4 shards moves about a quarter of agents, not most."""
+        agents = _agents(2000, 50)
+        rows = movement(agents, 4, 128)
+        last = rows[-1]
+        assert last["to_shards"] == 4
+        assert last["consistent_fraction"] < 0.35 < last["modulo_fraction"]
+
+        coordinator, router = _router(agents, shards=3, vnodes=128)
+        router.add_shard("shard-3")
+        moved = router.rebalances[-1].moved_fraction
+        assert last["consistent_fraction"] == round(moved, 4), "same placement"
+
+    def test_two_shard_processes(self):
+        """Each shard process drains its routed share of a fixed backlog."""
+        args = argparse.Namespace(
+            vnodes=64,
+            split=[],
+            tasks=60,
+            cpu_ms=0.1,
+            io_ms=2.0,
+            load_ms=0.0,
+            cache_size=64,
+            seed=0,
+        )
+        report = run_shards(2, _agents(100, 10), args)
+        assert report["shards"] == 2
+        assert report["completed"] == 60, "the whole backlog is drained"
+        assert set(report["per_shard_completed"]) == {"shard-0", "shard-1"}
+        assert all(report["per_shard_completed"].values())
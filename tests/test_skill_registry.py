@@ -0,0 +1,303 @@
+"""
+Test suite for the lazy skill registry and the ``chimera worker`` entry point.
+
+Validates skill discovery and lazy loading against:
+- skills/README.md (contract set, MCP server dependencies)
+- specs/technical.md Worker pools
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+from chimera.cli import serve, worker
+from chimera.memory import PersonaEvolutionPipeline
+from chimera.skills.registry import (
+    SKILL_CONTRACTS,
+    WORKER_ROLES,
+    LazyClientPool,
+    SkillNotImplementedError,
+    SkillRegistry,
+    UnknownSkillError,
+    parse_skills_readme,
+)
+
+SKILLS_README = Path(__file__).resolve().parent.parent / "skills" / "README.md"
+
+
+class FakeMCPClient:
+    """One server's client: answers tools/call with structuredContent."""
+
+    def __init__(self, server, calls):
+        self.server = server
+        self.calls = calls
+
+    def call_tool(self, tool, arguments=None):
+        self.calls.append((self.server, tool))
+        payload = {
+            "success": True,
+            "balances": {"USDC": "12.50"},
+            "wallet_address": "0xabc",
+        }
+        return {"content": [], "structuredContent": payload, "isError": False}
+
+
+class TestContractSet:
+    """The static contract table matches skills/README.md."""
+
+    @pytest.mark.skipif(not SKILLS_README.exists(), reason="skills/README.md absent")
+    def test_table_matches_readme(self):
+        """Names, categories and MCP servers agree with the README."""
+        assert list(SKILL_CONTRACTS) == parse_skills_readme(SKILLS_README), (
+            "SKILL_CONTRACTS is out of sync with skills/README.md"
+        )
+
+    def test_roles_reference_contracted_skills(self):
+        """Every worker role preloads only contracted skills."""
+        names = {contract.name for contract in SKILL_CONTRACTS}
+        for role, skills in WORKER_ROLES.items():
+            assert set(skills) <= names, f"role {role} lists unknown skills"
+
+
+class TestSkillRegistry:
+    """Lazy import, resolution and error reporting."""
+
+    def test_get_imports_on_first_use(self):
+        """A skill module is imported by get(), not by constructing the registry."""
+        registry = SkillRegistry()
+        assert registry.loaded() == []
+
+        skill = registry.get("skill_get_wallet_balance")
+
+        assert skill.__name__ == "skill_get_wallet_balance"
+        assert registry.loaded() == ["skill_get_wallet_balance"]
+        assert registry.get("skill_get_wallet_balance") is skill
+
+    def test_unknown_and_unimplemented_skills(self):
+        """Unknown names and contracted-but-missing modules raise distinct errors."""
+        registry = SkillRegistry()
+
+        with pytest.raises(UnknownSkillError):
+            registry.get("skill_does_not_exist")
+        with pytest.raises(SkillNotImplementedError):
+            registry.get("skill_deploy_token")
+
+    def test_preload_reports_missing(self):
+        """preload() imports what exists and returns what does not."""
+        registry = SkillRegistry()
+
+        missing = registry.preload(WORKER_ROLES["commerce"])
+
+        assert "skill_get_wallet_balance" not in missing
+        assert "skill_transfer_asset" in missing
+        assert registry.is_loaded("skill_get_wallet_balance")
+
+    def test_resolve_selectors(self):
+        """Names, short names, categories, roles and 'all' expand without dupes."""
+        registry = SkillRegistry()
+
+        assert registry.resolve(["get_wallet_balance"]) == ["skill_get_wallet_balance"]
+        assert registry.resolve(["memory"])[0] == "skill_load_persona"
+        assert registry.resolve(["judge", "skill_evolve_persona"]) == list(
+            WORKER_ROLES["judge"]
+        )
+        assert len(registry.resolve(["all"])) == len(SKILL_CONTRACTS)
+        with pytest.raises(UnknownSkillError):
+            registry.resolve(["nope"])
+
+    def test_package_attribute_is_lazy(self):
+        """`from chimera.skills import skill_x` goes through the registry."""
+        from chimera.skills import skill_evolve_persona
+
+        assert callable(skill_evolve_persona)
+        with pytest.raises(ImportError):
+            from chimera.skills import skill_does_not_exist  # noqa: F401
+
+
+class TestLazyClientPool:
+    """MCP clients are created on first request, once per server."""
+
+    def test_factory_called_once_per_server(self):
+        """Concurrent first use creates a single client."""
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def factory(server):
+            calls.append(server)
+            return object()
+
+        pool = LazyClientPool(factory)
+
+        def use(_):
+            barrier.wait()
+            return pool.get("mcp-server-news")
+
+        threads = [threading.Thread(target=use, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["mcp-server-news"]
+        assert pool.created() == ["mcp-server-news"]
+
+    def test_no_factory_is_an_error(self):
+        """Without a factory, asking for a client fails loudly."""
+        with pytest.raises(RuntimeError):
+            SkillRegistry().clients.get("mcp-server-coinbase")
+
+
+class TestWorker:
+    """`chimera worker` preloads its skills and serves JSON lines."""
+
+    def test_serve_only_selected_skills(self):
+        """Requests for skills outside the worker's set are rejected."""
+        registry = SkillRegistry()
+        stdin = io.StringIO(
+            json.dumps(
+                {
+                    "id": 1,
+                    "skill": "skill_get_wallet_balance",
+                    "arguments": {"agent_id": "not-a-uuid"},
+                }
+            )
+            + "\n"
+            + json.dumps({"id": 2, "skill": "skill_post_content"})
+            + "\n"
+        )
+        stdout = io.StringIO()
+
+        served = serve(registry, ["skill_get_wallet_balance"], stdin, stdout)
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert served == 2
+        assert responses[0]["id"] == 1
+        assert "UUID" in responses[0]["result"]["error"]
+        assert "not served" in responses[1]["result"]["error"]
+
+    def test_malformed_requests_do_not_stop_the_worker(self):
+        """Non-object lines and bad skill or arguments fields get error replies."""
+        registry = SkillRegistry()
+        lines = [
+            "[1]",
+            "not json",
+            json.dumps({"id": 1, "skill": ["skill_get_wallet_balance"]}),
+            json.dumps({"id": 2, "skill": {"a": 1}}),
+            json.dumps({"id": 3, "skill": "skill_get_wallet_balance", "arguments": 5}),
+            json.dumps(
+                {
+                    "id": 4,
+                    "skill": "skill_get_wallet_balance",
+                    "arguments": {"agent_id": "not-a-uuid"},
+                }
+            ),
+        ]
+        stdout = io.StringIO()
+
+        served = serve(
+            registry,
+            ["skill_get_wallet_balance"],
+            io.StringIO("\n".join(lines) + "\n"),
+            stdout,
+        )
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert served == len(lines)
+        assert [r["id"] for r in responses] == [None, None, 1, 2, 3, 4]
+        assert all(r["result"]["success"] is False for r in responses)
+        assert "object" in responses[0]["result"]["error"]
+        assert "skill must be a string" in responses[2]["result"]["error"]
+        assert "arguments" in responses[4]["result"]["error"]
+        assert "UUID" in responses[5]["result"]["error"], "worker kept serving"
+
+    def test_dry_run_reports_role_skills(self):
+        """A cold commerce worker reports the role skills it preloaded."""
+        completed = subprocess.run(
+            [sys.executable, "-m", "chimera", "worker", "--skills=commerce"]
+            + ["--dry-run"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        ready = json.loads(completed.stdout)
+
+        assert ready["event"] == "ready"
+        assert ready["skills"] == ["skill_get_wallet_balance"]
+        assert "skill_deploy_token" in ready["missing"]
+        assert ready["preload_seconds"] >= 0
+
+    def test_worker_serves_configured_skills(self, tmp_path, monkeypatch):
+        """A worker configures skill defaults from its lazy client pool."""
+        calls = []
+        registry = SkillRegistry(
+            client_factory=lambda server: FakeMCPClient(server, calls)
+        )
+        agent_id = str(uuid.uuid4())
+        requests = [
+            {
+                "id": 1,
+                "skill": "skill_get_wallet_balance",
+                "arguments": {"agent_id": agent_id},
+            },
+            {
+                "id": 2,
+                "skill": "skill_manage_engagement_loop",
+                "arguments": {
+                    "agent_id": agent_id,
+                    "mention_id": "m1",
+                    "platform": "twitter",
+                    "mention_content": "hi",
+                    "mention_author": "@fan",
+                    "mention_timestamp": "2026-02-05T12:00:00.000Z",
+                },
+            },
+        ]
+        stdout = io.StringIO()
+        monkeypatch.setattr(
+            sys, "stdin", io.StringIO("".join(json.dumps(r) + "\n" for r in requests))
+        )
+        monkeypatch.setattr(sys, "stdout", stdout)
+        args = argparse.Namespace(
+            skills="skill_get_wallet_balance,skill_manage_engagement_loop",
+            strict=True,
+            dry_run=False,
+            mcp_config=None,
+            state_dir=str(tmp_path),
+        )
+
+        assert worker(args, registry) == 0
+
+        lines = stdout.getvalue().splitlines()
+        results = [json.loads(line)["result"] for line in lines]
+        assert results[0]["success"] is True, results[0]
+        assert results[0]["balances"] == {"USDC": "12.50"}
+        assert results[1]["success"] is True, results[1]
+        assert calls == [("mcp-server-coinbase", "get_balance")]
+
+    def test_worker_refuses_a_journal_in_use(self, tmp_path, monkeypatch, capsys):
+        """Two workers never share one persona journal."""
+        journal = tmp_path / "persona-evolution.journal"
+        owner = PersonaEvolutionPipeline(None, None, None, journal, fsync=False)
+        monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+        args = argparse.Namespace(
+            skills="skill_evolve_persona",
+            strict=True,
+            dry_run=False,
+            mcp_config=None,
+            state_dir=str(tmp_path),
+        )
+        registry = SkillRegistry(
+            client_factory=lambda server: FakeMCPClient(server, [])
+        )
+
+        assert worker(args, registry) == 2
+        assert "in use" in capsys.readouterr().err
+        owner.close()
@@ -0,0 +1,233 @@
+"""
+Test suite for feed recording, replay and trend backtesting.
+
+Validates the trend tooling built on:
+- skills/README.md § 1.1 skill_monitor_resources (update shape)
+- skills/README.md § 1.3 skill_detect_trends (parameters)
+- specs/technical.md § 1.9 Trend Alert
+"""
+
+import uuid
+
+import pytest
+
+from chimera._time import iso_from_epoch
+from chimera.bench.feeds import generate_feed_log
+from chimera.perception.feed_log import FeedLog, FeedLogError, FeedRecorder
+from chimera.perception.replay import FeedReplayer, backtest, diff_alerts
+from chimera.perception.trend_engine import (
+    TrendEngine,
+    TrendParameters,
+    extract_topics,
+)
+
+START = 1769904000.0  # 2026-02-01T00:00:00Z
+HOUR = 3600.0
+
+
+def _update(uri, content, when, changed=True):
+    return {
+        "resource_uri": uri,
+        "content": content,
+        "timestamp": iso_from_epoch(when),
+        "change_detected": changed,
+    }
+
+
+def _feed(hours=12, burst_at=8.0, burst_topics=("sneaker-drop", "addis")):
+    """Background chatter every 5 minutes plus a burst after ``burst_at`` hours."""
+    updates = []
+    for step in range(int(hours * 12)):
+        when = START + step * 300
+        updates.append(
+            _update("news://ethiopia/fashion/trends", {"topics": ["fashion"]}, when)
+        )
+        if when >= START + burst_at * HOUR:
+            updates.append(
+                _update("twitter://trending", {"topics": list(burst_topics)}, when + 1)
+            )
+    return updates
+
+
+class TestFeedLog:
+    """Columnar, memory-mapped log round trip."""
+
+    def test_round_trip(self, tmp_path):
+        """Updates read back with their URI, timestamp, flag and content."""
+        updates = [
+            _update("twitter://mentions/recent", {"text": "hello"}, START),
+            _update("market://crypto/eth/price", {"price": 3001.5}, START + 60),
+            _update("twitter://mentions/recent", {"text": "again"}, START + 120, False),
+        ]
+        with FeedRecorder(tmp_path / "feed", flush_every=2) as recorder:
+            for update in updates:
+                recorder.record(update)
+
+        with FeedLog(tmp_path / "feed") as log:
+            assert len(log) == 3
+            assert log.uris == [
+                "twitter://mentions/recent",
+                "market://crypto/eth/price",
+            ]
+            assert list(log.uri_codes) == [0, 1, 0], "URIs must be dictionary coded"
+            assert log.timestamp(1) == START + 60
+            assert list(log) == updates
+
+    def test_append_repairs_torn_flush(self, tmp_path):
+        """Bytes past the last committed timestamp are dropped on reopen."""
+        path = tmp_path / "feed"
+        with FeedRecorder(path) as recorder:
+            recorder.record(_update("news://a", {"topics": ["x"]}, START))
+        with open(path / "uri.u32", "ab") as column:
+            column.write(b"\x07\x00\x00\x00")  # crash between column writes
+
+        with FeedRecorder(path) as recorder:
+            recorder.record(_update("news://b", {"topics": ["y"]}, START + 1))
+
+        with FeedLog(path) as log:
+            assert [update["resource_uri"] for update in log] == [
+                "news://a",
+                "news://b",
+            ]
+
+    def test_record_poll_skips_failures(self, tmp_path):
+        """Only successful skill_monitor_resources outputs are recorded."""
+        with FeedRecorder(tmp_path / "feed") as recorder:
+            assert recorder.record_poll({"success": False, "error": "down"}) == 0
+            recorded = recorder.record_poll(
+                {"success": True, "updates": _feed(hours=1)}
+            )
+        with FeedLog(tmp_path / "feed") as log:
+            assert len(log) == recorded == 12
+
+    def test_missing_log_raises(self, tmp_path):
+        """Opening a directory that is not a feed log fails clearly."""
+        with pytest.raises(FeedLogError):
+            FeedLog(tmp_path)
+
+
+class TestTrendEngine:
+    """Window clustering and Trend Alert output."""
+
+    def test_burst_produces_contract_alert(self):
+        """A new co-occurring topic pair becomes one § 1.9 Trend Alert."""
+        agent_id = str(uuid.uuid4())
+        engine = TrendEngine(agent_id, TrendParameters(time_window_hours=2))
+        for update in _feed():
+            engine.observe_update(update)
+        engine.advance(START + 12 * HOUR)
+
+        assert len(engine.alerts) == 1, engine.alerts
+        alert = engine.alerts[0]
+        assert alert["agent_id"] == agent_id
+        assert sorted(alert["topics"]) == ["addis", "sneaker-drop"]
+        assert 0.75 <= alert["relevance_score"] <= 1.0
+        assert alert["source_resources"] == ["twitter://trending"]
+        assert alert["window_start"] < alert["window_end"] <= alert["created_at"]
+        uuid.UUID(alert["alert_id"])
+        assert set(alert) == {
+            "alert_id",
+            "agent_id",
+            "topics",
+            "relevance_score",
+            "source_resources",
+            "window_start",
+            "window_end",
+            "created_at",
+        }, "alerts carry only § 1.9 fields"
+
+    def test_expired_topics_are_forgotten(self):
+        """Topics that slide out of both windows leave no state behind."""
+        engine = TrendEngine(str(uuid.uuid4()), TrendParameters(time_window_hours=2))
+        for update in _feed():
+            engine.observe_update(update)
+        assert engine.tracked_topics > 0
+
+        engine.advance(START + 48 * HOUR)
+
+        assert engine.alerts, "alerted topics are forgotten too"
+        assert engine.tracked_topics == 0
+
+    def test_steady_topics_and_warmup_do_not_alert(self):
+        """Constant background chatter never alerts, even at start-up."""
+        engine = TrendEngine(str(uuid.uuid4()))
+        for update in _feed(burst_at=100):
+            engine.observe_update(update)
+        engine.advance(START + 12 * HOUR)
+
+        assert engine.alerts == []
+
+    def test_resource_filter(self):
+        """Updates from URIs outside resource_uris are ignored."""
+        engine = TrendEngine(
+            str(uuid.uuid4()),
+            TrendParameters(time_window_hours=2),
+            resource_uris=["news://ethiopia/fashion/trends"],
+        )
+        for update in _feed():
+            engine.observe_update(update)
+        engine.advance(START + 12 * HOUR)
+
+        assert engine.alerts == []
+
+    def test_extract_topics(self):
+        """Listed topics win over free text; stopwords and short words drop."""
+        assert extract_topics({"hashtags": ["#Addis"], "text": "x"}) == {"addis"}
+        assert extract_topics({"title": "Sneakers with Addis vibes"}) == {
+            "sneakers",
+            "addis",
+            "vibes",
+        }
+        assert extract_topics({"price": 1.0}) == frozenset()
+
+    def test_parse_parameters(self):
+        """CLI parameter strings map onto TrendParameters fields."""
+        params = TrendParameters.parse("time_window_hours=2,min_cluster_size=8")
+        assert params == TrendParameters(time_window_hours=2.0, min_cluster_size=8)
+        with pytest.raises(ValueError):
+            TrendParameters.parse("window=2")
+
+
+class TestReplay:
+    """Replay speed control and parameter-set diffs."""
+
+    def test_scaled_replay_paces_by_feed_time(self, tmp_path):
+        """At speed 3600 twelve feed hours take about twelve wall seconds."""
+        with FeedRecorder(tmp_path / "feed") as recorder:
+            recorder.record_poll({"success": True, "updates": _feed()})
+        clock = {"now": 0.0}
+
+        def sleep(seconds):
+            clock["now"] += seconds
+
+        with FeedLog(tmp_path / "feed") as log:
+            result = FeedReplayer(
+                log, speed=3600, clock=lambda: clock["now"], sleep=sleep
+            ).run({"a": TrendEngine(str(uuid.uuid4()))})
+
+        assert result["wall_seconds"] == pytest.approx(
+            result["feed_seconds"] / 3600, abs=0.01
+        )
+
+    def test_diff_between_parameter_sets(self, tmp_path):
+        """A stricter cluster size drops alerts; identical runs diff clean."""
+        generate_feed_log(str(tmp_path / "feed"), days=1, bursts_per_day=4, seed=3)
+
+        with FeedLog(tmp_path / "feed") as log:
+            report = backtest(
+                log,
+                {
+                    "loose": TrendParameters(),
+                    "strict": TrendParameters(min_cluster_size=50),
+                    "same": TrendParameters(),
+                },
+            )
+
+        loose = report["alerts"]["loose"]
+        assert report["records"] == len(log)
+        assert loose, "the synthetic bursts should produce alerts"
+        assert report["diff"]["candidate_alerts"] < report["diff"]["baseline_alerts"]
+        same = diff_alerts(loose, report["alerts"]["same"])
+        assert same["matched"] == len(loose)
+        assert not (same["only_in_baseline"] or same["only_in_candidate"])
+        assert not same["changed"]
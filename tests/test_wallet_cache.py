@@ -0,0 +1,255 @@
+"""
+Test suite for the wallet balance cache.
+
+Validates skill_get_wallet_balance caching defined in:
+- skills/README.md § 5.1 skill_get_wallet_balance, § 5.2 skill_transfer_asset
+- specs/technical.md § 1.7 get_balance, § 1.8 send_payment
+- SRS: docs/project-chimera-srs-challenge/project-chimera-srs.md FR 5.1
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from chimera.commerce.wallet_cache import WalletBalanceCache, WalletBalanceError
+from chimera.skills.commerce.get_wallet_balance import skill_get_wallet_balance
+
+
+class FakeWalletServer:
+    """Thread-safe stand-in for the Coinbase MCP server."""
+
+    def __init__(self, usdc="100.00", latency=0.0):
+        self.usdc = Decimal(usdc)
+        self.latency = latency
+        self.balance_calls = 0
+        self.available = True
+        self._lock = threading.Lock()
+
+    def get_balance(self, agent_id):
+        with self._lock:
+            self.balance_calls += 1
+            usdc = self.usdc
+        time.sleep(self.latency)
+        if not self.available:
+            return {"success": False, "error": "coinbase MCP unavailable"}
+        return {
+            "success": True,
+            "balances": {"USDC": str(usdc), "ETH": "0.25"},
+            "wallet_address": "0xabc",
+        }
+
+    def send_payment(self, amount):
+        with self._lock:
+            if amount > self.usdc:
+                return {"success": False, "error": "BudgetExceededError"}
+            self.usdc -= amount
+        return {
+            "success": True,
+            "tx_hash": "0x" + uuid.uuid4().hex,
+            "amount": str(amount),
+            "token_symbol": "USDC",
+        }
+
+
+@pytest.fixture
+def clock():
+    return {"now": 0.0}
+
+
+def _cache(server, clock, **kwargs):
+    return WalletBalanceCache(server.get_balance, clock=lambda: clock["now"], **kwargs)
+
+
+class TestWalletBalanceCache:
+    """TTL, staleness bound, coalescing and write-through behaviour."""
+
+    def test_reads_within_ttl_hit_cache(self, clock):
+        """Repeated reads inside the TTL do not call get_balance."""
+        server = FakeWalletServer()
+        cache = _cache(server, clock, ttl_seconds=10.0)
+        agent_id = str(uuid.uuid4())
+
+        for _ in range(20):
+            assert cache.get(agent_id).balances["USDC"] == Decimal("100.00")
+
+        assert server.balance_calls == 1
+        cache.close()
+
+    def test_concurrent_cold_reads_coalesce(self, clock):
+        """Concurrent reads of an uncached agent share one refresh."""
+        server = FakeWalletServer(latency=0.05)
+        cache = _cache(server, clock)
+        agent_id = str(uuid.uuid4())
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(lambda _: cache.get(agent_id), range(64)))
+
+        assert server.balance_calls == 1
+        assert all(r.balances["USDC"] == Decimal("100.00") for r in results)
+        cache.close()
+
+    def test_staleness_bound_forces_chain_read(self, clock):
+        """Entries older than the bound are never returned."""
+        server = FakeWalletServer()
+        cache = _cache(server, clock, ttl_seconds=5.0, max_staleness_seconds=30.0)
+        agent_id = str(uuid.uuid4())
+        cache.get(agent_id)
+        server.usdc = Decimal("40.00")  # spent elsewhere
+
+        clock["now"] = 31.0
+        snapshot = cache.get(agent_id)
+
+        assert snapshot.balances["USDC"] == Decimal("40.00")
+        assert snapshot.age_seconds <= 30.0
+        cache.close()
+
+    def test_stale_entry_served_while_refreshing(self, clock):
+        """Past the TTL the cached value is returned and refreshed behind."""
+        server = FakeWalletServer()
+        cache = _cache(server, clock, ttl_seconds=5.0, max_staleness_seconds=30.0)
+        agent_id = str(uuid.uuid4())
+        cache.get(agent_id)
+
+        clock["now"] = 10.0
+        assert cache.get(agent_id).age_seconds == 10.0
+        cache.refresh(agent_id).result()
+        assert server.balance_calls == 2
+        cache.close()
+
+    def test_transfer_applied_before_refresh_completes(self, clock):
+        """A local debit is visible immediately and survives a racing read."""
+        server = FakeWalletServer(latency=0.05)
+        cache = _cache(server, clock)
+        agent_id = str(uuid.uuid4())
+        cache.get(agent_id)
+
+        cache.refresh(agent_id)  # chain read in flight, pre-dating the spend
+        result = server.send_payment(Decimal("30.00"))
+        cache.apply_transfer(agent_id, result)
+
+        assert cache.get(agent_id).balances["USDC"] == Decimal("70.00")
+        time.sleep(0.2)
+        assert cache.get(agent_id).balances["USDC"] == Decimal("70.00")
+        cache.close()
+
+    def test_tight_bound_does_not_join_an_older_refresh(self, clock):
+        """A refresh sent before the bound is not reused by a stricter read."""
+        server = FakeWalletServer()
+        gate = threading.Event()
+        calls = []
+
+        def gated_fetch(agent_id):
+            calls.append(clock["now"])
+            if len(calls) == 1:
+                gate.wait(5)
+            return server.get_balance(agent_id)
+
+        cache = WalletBalanceCache(gated_fetch, clock=lambda: clock["now"])
+        agent_id = str(uuid.uuid4())
+        old = cache.refresh(agent_id)  # sent at t=0, held by the gate
+        clock["now"] = 1.0
+        server.usdc = Decimal("40.00")
+
+        snapshot = cache.get(agent_id, max_staleness_seconds=0.0)
+        gate.set()
+        old.result()
+
+        assert calls == [0.0, 1.0], "a second chain read was sent"
+        assert snapshot.age_seconds == 0.0
+        assert snapshot.balances["USDC"] == Decimal("40.00")
+        later = cache.get(agent_id)
+        assert later.balances["USDC"] == Decimal("40.00"), "old read lands late"
+        cache.close()
+
+    def test_concurrent_spend_never_overstates_balance(self, clock):
+        """Under concurrent spend and refreshes, no debit is ever lost."""
+        server = FakeWalletServer(usdc="1000.00", latency=0.002)
+        cache = _cache(server, clock, ttl_seconds=0.0, max_staleness_seconds=60.0)
+        agent_id = str(uuid.uuid4())
+        cache.get(agent_id)
+        spend_lock = threading.Lock()
+        violations = []
+        done = threading.Event()
+
+        def spend(_):
+            for _ in range(10):
+                # Serialise send + apply so the chain balance captured before
+                # the payment is exact; refreshes still race freely.
+                with spend_lock:
+                    before = server.usdc
+                    result = server.send_payment(Decimal("1.50"))
+                    cache.apply_transfer(agent_id, result)
+                    seen = cache.get(agent_id).balances["USDC"]
+                if seen > before - Decimal("1.50"):
+                    violations.append((before, seen))
+
+        def read():
+            while not done.is_set():
+                cache.get(agent_id, max_staleness_seconds=0.0)
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            readers = [pool.submit(read) for _ in range(4)]
+            list(pool.map(spend, range(16)))
+            done.set()
+            for reader in readers:
+                reader.result()
+        cache.refresh(agent_id).result()
+        time.sleep(0.05)
+
+        assert not violations
+        assert cache.get(agent_id).balances["USDC"] == server.usdc
+        assert server.usdc == Decimal("760.00")
+        cache.close()
+
+    def test_invalid_amounts_raise_value_error(self, clock):
+        """Malformed transfer amounts and gas fees raise ValueError."""
+        cache = _cache(FakeWalletServer(), clock)
+        agent_id = str(uuid.uuid4())
+
+        with pytest.raises(ValueError):
+            cache.apply_transfer(agent_id, {"success": True, "amount": "ten"})
+        with pytest.raises(ValueError):
+            cache.apply_deploy(agent_id, {"success": True}, gas_fee_native="n/a")
+        cache.close()
+
+    def test_unavailable_wallet_raises(self, clock):
+        """A failed chain read with nothing cached raises WalletBalanceError."""
+        server = FakeWalletServer()
+        server.available = False
+        cache = _cache(server, clock)
+
+        with pytest.raises(WalletBalanceError):
+            cache.get(str(uuid.uuid4()))
+        cache.close()
+
+
+class TestSkillGetWalletBalance:
+    """skill_get_wallet_balance Input/Output contract."""
+
+    def test_output_contract(self, clock):
+        """Successful reads return balances as decimal strings."""
+        cache = _cache(FakeWalletServer(), clock)
+
+        result = skill_get_wallet_balance(str(uuid.uuid4()), cache=cache)
+
+        assert result["success"] is True
+        assert result["balances"]["USDC"] == "100.00"
+        assert isinstance(result["wallet_address"], str)
+        assert isinstance(result["checked_at"], str)
+        cache.close()
+
+    def test_errors_are_reported(self, clock):
+        """Invalid input and wallet failures yield success=False."""
+        server = FakeWalletServer()
+        server.available = False
+        cache = _cache(server, clock)
+
+        assert skill_get_wallet_balance("nope", cache=cache)["success"] is False
+        result = skill_get_wallet_balance(str(uuid.uuid4()), cache=cache)
+        assert result["success"] is False
+        assert "unavailable" in result["error"]
+        cache.close()